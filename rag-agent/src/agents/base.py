@@ -1,11 +1,16 @@
 """Base agent implementation and types."""
 
+import asyncio
+import inspect
 from abc import ABC, abstractmethod
 from dataclasses import dataclass, field
 from enum import Enum
-from typing import Any, TypedDict
+from typing import Any, Callable, ClassVar, TypedDict
 
 from langchain_core.messages import BaseMessage
+from langchain_core.runnables import RunnableConfig
+
+from src.core.config import get_settings
 
 
 class AgentState(TypedDict, total=False):
@@ -14,10 +19,13 @@ class AgentState(TypedDict, total=False):
     messages: list[BaseMessage]
     context: str
     question: str
+    query_embedding: list[float] | None
     answer: str
+    refined_answer: str
     sources: list[dict[str, Any]]
     next_action: str
     iteration: int
+    refine_count: int
     error: str | None
 
 
@@ -40,6 +48,12 @@ class AgentConfig:
     temperature: float = 0.7
     max_iterations: int = 10
     retrieval_top_k: int = 5
+    extraction_batch_size: int = 3
+    max_concurrent_llm: int = 4
+    speculative_refine: bool = False
+    max_refines: int = 1
+    section_ctx_tokens: int = 2000
+    exec_summary_ctx_tokens: int = 1250
     verbose: bool = False
 
 
@@ -55,9 +69,36 @@ class AgentResult:
     metadata: dict[str, Any] = field(default_factory=dict)
 
 
+def agent_node(method: Callable[..., Any]) -> Callable[..., Any]:
+    """Wrap an agent method so it can be used in a shared compiled graph.
+
+    The wrapper resolves the agent instance from
+    ``config["configurable"]["agent"]`` at run time instead of binding it
+    when the graph is built.
+
+    Args:
+        method: Unbound agent method taking ``(self, state)``.
+
+    Returns:
+        Graph node or router function.
+    """
+    if inspect.iscoroutinefunction(method):
+        async def node(state: Any, config: RunnableConfig) -> Any:
+            return await method(config["configurable"]["agent"], state)
+    else:
+        def node(state: Any, config: RunnableConfig) -> Any:
+            return method(config["configurable"]["agent"], state)
+
+    node.__name__ = method.__name__
+    return node
+
+
 class BaseAgent(ABC):
     """Abstract base class for agents."""
 
+    # Compiled graphs shared by all instances of an agent class
+    _compiled_graphs: ClassVar[dict[type, Any]] = {}
+
     def __init__(self, config: AgentConfig | None = None) -> None:
         """Initialize the agent.
 
@@ -66,6 +107,38 @@ class BaseAgent(ABC):
         """
         self.config = config or AgentConfig()
 
+        # Bound LLM calls and vector store searches across all concurrently
+        # running nodes and runs of this agent to stay under provider rate limits
+        self._llm_semaphore = asyncio.Semaphore(self.config.max_concurrent_llm)
+        self._search_semaphore = asyncio.Semaphore(get_settings().max_concurrent_searches)
+
+    @classmethod
+    def _build_graph(cls) -> Any:
+        """Build and compile the agent graph.
+
+        Nodes must be wrapped with ``agent_node`` so the compiled graph is
+        not bound to a single instance.
+
+        Returns:
+            Compiled state graph.
+        """
+        raise NotImplementedError
+
+    def _get_graph(self) -> Any:
+        """Get the class's compiled graph bound to this agent instance.
+
+        The graph is compiled once per agent class and reused by every
+        instance.
+
+        Returns:
+            Compiled state graph configured with this agent.
+        """
+        cls = type(self)
+        graph = BaseAgent._compiled_graphs.get(cls)
+        if graph is None:
+            graph = BaseAgent._compiled_graphs[cls] = cls._build_graph()
+        return graph.with_config(configurable={"agent": self})
+
     @abstractmethod
     async def run(self, question: str, **kwargs: Any) -> AgentResult:
         """Run the agent on a question.
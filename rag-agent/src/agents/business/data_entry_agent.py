@@ -7,26 +7,104 @@ This agent automates data entry tasks by:
 4. Preparing it for database entry
 """
 
-from typing import Any, AsyncIterator
+import asyncio
+import logging
+from typing import Annotated, Any, AsyncIterator, TypedDict
 
+import orjson
 from langchain_core.messages import AIMessage, HumanMessage, SystemMessage
 from langchain_core.prompts import ChatPromptTemplate
-from langchain_openai import ChatOpenAI
 from langgraph.graph import END, StateGraph
+from langgraph.types import Send
 
-from src.agents.base import AgentConfig, AgentResult, BaseAgent
+from src.agents.base import AgentConfig, AgentResult, BaseAgent, agent_node
+from src.agents.llm import get_chat_model
+from src.agents.tools.base import ToolResult
 from src.agents.tools.data_tools import ExtractDataTool, ValidateDataTool, TransformDataTool
-from src.agents.tools.document_tools import SearchDocumentsTool
+from src.agents.tools.document_tools import SearchDocumentsTool, get_search_cache
+from src.agents.utils import content_hash, parse_llm_json, unique_by_content
 from src.core import get_logger
 from src.core.config import get_settings
+from src.rag.retrieval.vector_store import get_vector_store
 
 logger = get_logger(__name__)
 
+_ANALYZE_PROMPT = ChatPromptTemplate.from_template(
+    """Analyze this data entry request and determine:
+1. What type of data needs to be extracted
+2. What fields are required
+3. What document sources to search
+4. Whether the request already contains the text to extract from
+
+Request: {request}
+
+Respond in JSON format:
+{{
+    "data_type": "type of data (e.g., invoice, contact, order)",
+    "required_fields": ["list", "of", "fields"],
+    "source": "inline if the request contains the text, otherwise search",
+    "search_queries": ["queries to find relevant documents"],
+    "validation_rules": {{}}
+}}"""
+)
+
+
+def _merge_search_results(
+    current: dict[str, list[dict]],
+    update: dict[str, list[dict]],
+) -> dict[str, list[dict]]:
+    """Merge per-query search results written by parallel branches.
+
+    An empty update clears the results.
+    """
+    return {**current, **update} if update else {}
+
+
+def _merge_extractions(extractions: list[dict[str, Any]]) -> dict[str, Any]:
+    """Merge per-batch extractions, keeping the first non-empty value per field."""
+    merged: dict[str, Any] = {}
+    for extraction in extractions:
+        for field, value in extraction.items():
+            if merged.get(field) in (None, "") and value not in (None, ""):
+                merged[field] = value
+            else:
+                merged.setdefault(field, value)
+    return merged
+
+
+def _serialize_schema(fields: list[str]) -> str | None:
+    """Serialize an all-string extraction schema for the given fields."""
+    if not fields:
+        return None
+    schema = {field: {"type": "string"} for field in fields}
+    return orjson.dumps(schema, option=orjson.OPT_INDENT_2).decode()
+
+
+def _extraction_hash(extracted_data: dict[str, Any]) -> int:
+    """Fingerprint extracted data independently of key order."""
+    return content_hash(orjson.dumps(extracted_data, option=orjson.OPT_SORT_KEYS).decode())
 
-class DataEntryState(dict):
+
+class DataEntryState(TypedDict, total=False):
     """State for data entry agent."""
 
-    pass
+    request: str
+    analysis: dict[str, Any]
+    pending_searches: list[dict[str, Any]]
+    search_results: Annotated[dict[str, list[dict]], _merge_search_results]
+    documents: list[dict]
+    extracted_data: dict[str, Any]
+    extraction_sources: list[str]
+    extraction_hash: int
+    previous_extraction_hash: int | None
+    validation_result: dict[str, Any]
+    transformed_data: dict[str, Any]
+    final_data: dict[str, Any]
+    data_type: str | None
+    validation_errors: list[dict[str, Any]]
+    iteration: int
+    status: str
+    success: bool
 
 
 class DataEntryAgent(BaseAgent):
@@ -48,12 +126,9 @@ class DataEntryAgent(BaseAgent):
         super().__init__(config)
         self.settings = get_settings()
 
-        # Initialize LLM
-        self.llm = ChatOpenAI(
-            model=self.config.model_name,
-            temperature=0,  # Use 0 for deterministic extraction
-            openai_api_key=self.settings.openai_api_key,
-        )
+        # Initialize LLM (temperature 0 for deterministic extraction)
+        self.llm = get_chat_model(self.config.model_name, 0)
+        self._analyze_chain = _ANALYZE_PROMPT | self.llm
 
         # Initialize tools
         self.tools = {
@@ -63,35 +138,51 @@ class DataEntryAgent(BaseAgent):
             "transform": TransformDataTool(),
         }
 
-        # Build the graph
-        self.graph = self._build_graph()
+        # Bind the shared compiled graph to this agent
+        self.graph = self._get_graph()
 
-    def _build_graph(self) -> StateGraph:
+    @classmethod
+    def _build_graph(cls) -> StateGraph:
         """Build the data entry workflow graph.
 
         Returns:
             Compiled state graph.
         """
-        workflow = StateGraph(dict)
+        workflow = StateGraph(DataEntryState)
 
         # Add nodes
-        workflow.add_node("analyze_request", self._analyze_request_node)
-        workflow.add_node("search_documents", self._search_documents_node)
-        workflow.add_node("extract_data", self._extract_data_node)
-        workflow.add_node("validate_data", self._validate_data_node)
-        workflow.add_node("transform_data", self._transform_data_node)
-        workflow.add_node("finalize", self._finalize_node)
+        workflow.add_node("analyze_request", agent_node(cls._analyze_request_node))
+        workflow.add_node("dispatch_searches", agent_node(cls._dispatch_searches_node))
+        workflow.add_node("search_one", agent_node(cls._search_one_node))
+        workflow.add_node("merge_documents", agent_node(cls._merge_documents_node))
+        workflow.add_node("extract_data", agent_node(cls._extract_data_node))
+        workflow.add_node("validate_data", agent_node(cls._validate_data_node))
+        workflow.add_node("transform_data", agent_node(cls._transform_data_node))
+        workflow.add_node("finalize", agent_node(cls._finalize_node))
 
         # Set entry point
         workflow.set_entry_point("analyze_request")
 
         # Add edges
-        workflow.add_edge("analyze_request", "search_documents")
-        workflow.add_edge("search_documents", "extract_data")
+        workflow.add_conditional_edges(
+            "analyze_request",
+            agent_node(cls._source_router),
+            {
+                "search": "dispatch_searches",
+                "inline": "extract_data",  # Request already contains the text
+            },
+        )
+        workflow.add_conditional_edges(
+            "dispatch_searches",
+            agent_node(cls._search_fanout_router),
+            ["search_one", "merge_documents"],
+        )
+        workflow.add_edge("search_one", "merge_documents")
+        workflow.add_edge("merge_documents", "extract_data")
         workflow.add_edge("extract_data", "validate_data")
         workflow.add_conditional_edges(
             "validate_data",
-            self._validation_router,
+            agent_node(cls._validation_router),
             {
                 "valid": "transform_data",
                 "invalid": "extract_data",  # Retry extraction
@@ -107,77 +198,121 @@ class DataEntryAgent(BaseAgent):
         """Analyze the data entry request."""
         request = state.get("request", "")
 
-        logger.debug("Analyzing data entry request", request_preview=request[:100])
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Analyzing data entry request", request_preview=request[:100])
 
         # Determine what data needs to be extracted
-        prompt = ChatPromptTemplate.from_template(
-            """Analyze this data entry request and determine:
-1. What type of data needs to be extracted
-2. What fields are required
-3. What document sources to search
-
-Request: {request}
-
-Respond in JSON format:
-{{
-    "data_type": "type of data (e.g., invoice, contact, order)",
-    "required_fields": ["list", "of", "fields"],
-    "search_queries": ["queries to find relevant documents"],
-    "validation_rules": {{}}
-}}"""
-        )
-
-        result = await (prompt | self.llm).ainvoke({"request": request})
-
-        import json
-        import re
+        async with self._llm_semaphore:
+            result = await self._analyze_chain.ainvoke({"request": request})
 
         # Parse JSON from response
-        try:
-            json_str = result.content.strip()
-            if json_str.startswith("```"):
-                json_str = re.sub(r"^```(?:json)?\n?", "", json_str)
-                json_str = re.sub(r"\n?```$", "", json_str)
-            analysis = json.loads(json_str)
-        except json.JSONDecodeError:
-            analysis = {
+        analysis = parse_llm_json(
+            result.content,
+            fallback={
                 "data_type": "general",
                 "required_fields": [],
+                "source": "search",
                 "search_queries": [request],
                 "validation_rules": {},
-            }
+            },
+        )
+
+        # Serialize the extraction schema once so retries and batches can share it
+        required_fields = analysis.get("required_fields", [])
+        analysis["extraction_schema"] = _serialize_schema(required_fields)
 
         return {
-            **state,
             "analysis": analysis,
             "iteration": 0,
             "status": "analyzing",
         }
 
-    async def _search_documents_node(self, state: dict) -> dict:
-        """Search for relevant documents."""
+    def _source_router(self, state: dict) -> str:
+        """Route based on where the data to extract comes from."""
+        if state.get("analysis", {}).get("source") == "inline":
+            return "inline"
+        return "search"
+
+    async def _dispatch_searches_node(self, state: dict) -> dict:
+        """Resolve cached searches and queue the rest for parallel execution."""
         analysis = state.get("analysis", {})
-        search_queries = analysis.get("search_queries", [])
+        search_queries = analysis.get("search_queries", [])[:3]  # Limit to 3 queries
+
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Dispatching document searches", queries=search_queries)
+
+        # Serve near-duplicate queries from the semantic cache when enabled
+        cache = get_search_cache()
+        embeddings: list[list[float] | None] = [None] * len(search_queries)
+        if cache is not None and search_queries:
+            try:
+                embeddings = await get_vector_store().embed_queries(search_queries)
+            except Exception as e:
+                logger.warning("Query embedding failed, bypassing search cache", error=str(e))
+                cache = None
+
+        cached_results: dict[str, list[dict]] = {}
+        pending_searches = []
+        for query, embedding in zip(search_queries, embeddings):
+            cached = cache.get(embedding) if cache is not None else None
+            if cached is not None:
+                cached_results[query] = cached
+            else:
+                pending_searches.append({"query": query, "query_embedding": embedding})
+
+        return {
+            "pending_searches": pending_searches,
+            "search_results": cached_results,
+            "status": "searching",
+        }
 
-        logger.debug("Searching documents", queries=search_queries)
+    def _search_fanout_router(self, state: dict) -> list[Send] | str:
+        """Fan out one search branch per uncached query."""
+        pending_searches = state.get("pending_searches", [])
+        if not pending_searches:
+            return "merge_documents"
+        return [Send("search_one", search) for search in pending_searches]
 
-        all_results = []
-        for query in search_queries[:3]:  # Limit to 3 queries
-            result = await self.tools["search"].execute(query=query, top_k=5)
-            if result.is_success:
-                all_results.extend(result.data)
+    async def _search_one_node(self, search: dict) -> dict:
+        """Run a single document search branch."""
+        query = search["query"]
+        query_embedding = search.get("query_embedding")
+
+        try:
+            async with self._search_semaphore:
+                result = await self.tools["search"].execute(
+                    query=query,
+                    top_k=5,
+                    query_embedding=query_embedding,
+                )
+        except Exception as e:
+            # One failing query must not abort the other branches
+            logger.warning("Document search failed", error=str(e))
+            return {}
+
+        if not result.is_success:
+            return {}
+
+        cache = get_search_cache()
+        if cache is not None and query_embedding is not None:
+            cache.put(query_embedding, result.data)
+
+        return {"search_results": {query: result.data}}
+
+    async def _merge_documents_node(self, state: dict) -> dict:
+        """Collect the search branches into a single document list."""
+        search_queries = state.get("analysis", {}).get("search_queries", [])[:3]
+        search_results = state.get("search_results", {})
+
+        # Keep query order so ranking is stable across runs
+        all_results = [
+            doc for query in search_queries for doc in search_results.get(query, [])
+        ]
 
         # Deduplicate by content
-        seen_content = set()
-        unique_results = []
-        for r in all_results:
-            content_hash = hash(r["content"][:100])
-            if content_hash not in seen_content:
-                seen_content.add(content_hash)
-                unique_results.append(r)
+        unique_results = unique_by_content(all_results)
 
         return {
-            **state,
             "documents": unique_results[:10],  # Keep top 10
             "status": "documents_found",
         }
@@ -187,49 +322,93 @@ Respond in JSON format:
         documents = state.get("documents", [])
         analysis = state.get("analysis", {})
 
-        logger.debug("Extracting data", num_documents=len(documents))
+        # Inline requests are extracted from the request text itself
+        if analysis.get("source") == "inline":
+            documents = [{"content": state.get("request", ""), "source": "request"}]
+
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Extracting data", num_documents=len(documents))
 
         if not documents:
             return {
-                **state,
                 "extracted_data": {},
+                "extraction_hash": _extraction_hash({}),
+                "previous_extraction_hash": state.get("extraction_hash"),
                 "status": "no_documents",
             }
 
-        # Combine document content
-        combined_text = "\n\n---\n\n".join(
-            f"[Source: {d.get('source', 'Unknown')}]\n{d['content']}"
-            for d in documents
-        )
+        # On retry, only re-extract the fields that failed validation
+        previous_data = state.get("extracted_data", {})
+        failed_fields = [
+            error["field"]
+            for error in state.get("validation_result", {}).get("errors", [])
+            if error.get("field")
+        ]
+        retry_fields = failed_fields if state.get("iteration", 0) > 0 else []
 
-        # Build extraction schema from analysis
-        required_fields = analysis.get("required_fields", [])
-        extraction_schema = {
-            field: {"type": "string"} for field in required_fields
-        } if required_fields else None
+        extraction_schema = (
+            _serialize_schema(retry_fields)
+            if retry_fields
+            else analysis.get("extraction_schema")
+        )
 
-        result = await self.tools["extract"].execute(
-            text=combined_text,
-            extraction_schema=extraction_schema,
+        # Extract from small document batches in parallel so each call keeps a short
+        # context, bounded by the agent's LLM concurrency limit
+        batch_size = max(1, self.config.extraction_batch_size)
+        batches = [documents[i:i + batch_size] for i in range(0, len(documents), batch_size)]
+        results = await asyncio.gather(
+            *(
+                self._extract(
+                    "\n\n---\n\n".join(
+                        f"[Source: {d.get('source', 'Unknown')}]\n{d['content']}"
+                        for d in batch
+                    ),
+                    extraction_schema,
+                )
+                for batch in batches
+            )
         )
 
-        extracted_data = result.data if result.is_success else {}
+        extracted_data = _merge_extractions(
+            [result.data for result in results if result.is_success]
+        )
+        if retry_fields:
+            extracted_data = {
+                **previous_data,
+                **{field: extracted_data.get(field) for field in retry_fields},
+            }
 
         return {
-            **state,
             "extracted_data": extracted_data,
+            "extraction_hash": _extraction_hash(extracted_data),
+            "previous_extraction_hash": state.get("extraction_hash"),
             "extraction_sources": [d.get("source", "Unknown") for d in documents],
             "status": "data_extracted",
             "iteration": state.get("iteration", 0) + 1,
         }
 
+    async def _extract(self, text: str, extraction_schema: Any) -> ToolResult:
+        """Extract data from text under the agent's LLM concurrency limit.
+
+        Extraction is deterministic, so repeated document batches and schemas
+        reuse the cached response.
+        """
+        async with self._llm_semaphore:
+            return await self.tools["extract"].execute(
+                text=text,
+                extraction_schema=extraction_schema,
+                use_cache=True,
+            )
+
     async def _validate_data_node(self, state: dict) -> dict:
         """Validate extracted data."""
         extracted_data = state.get("extracted_data", {})
         analysis = state.get("analysis", {})
-        validation_rules = analysis.get("validation_rules", {})
+        # Copy so the required-field rules are not written back into the analysis
+        validation_rules = dict(analysis.get("validation_rules", {}))
 
-        logger.debug("Validating data", fields=list(extracted_data.keys()))
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Validating data", fields=list(extracted_data.keys()))
 
         # Add required field rules
         for field in analysis.get("required_fields", []):
@@ -244,7 +423,6 @@ Respond in JSON format:
         validation_result = result.data if result.is_success else {"valid": False, "errors": []}
 
         return {
-            **state,
             "validation_result": validation_result,
             "status": "validated" if validation_result.get("valid") else "validation_failed",
         }
@@ -258,20 +436,33 @@ Respond in JSON format:
             return "valid"
         elif iteration >= 3:
             return "max_retries"
+        elif state.get("extraction_hash") == state.get("previous_extraction_hash"):
+            # A retry produced the same data, so another one would too
+            return "max_retries"
         else:
             return "invalid"
 
     async def _transform_data_node(self, state: dict) -> dict:
         """Transform data into target format."""
         extracted_data = state.get("extracted_data", {})
-        analysis = state.get("analysis", {})
 
-        logger.debug("Transforming data")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Transforming data")
+
+        # Only string fields with surrounding whitespace need trimming
+        needs_trim = [
+            field for field, value in extracted_data.items()
+            if isinstance(value, str) and value != value.strip()
+        ]
+        if not needs_trim:
+            return {
+                "transformed_data": extracted_data,
+                "status": "transformed",
+            }
 
-        # Apply standard transformations
         transformations = [
             {"type": "format", "field": field, "format": "trim"}
-            for field in extracted_data.keys()
+            for field in needs_trim
         ]
 
         result = await self.tools["transform"].execute(
@@ -282,23 +473,32 @@ Respond in JSON format:
         transformed_data = result.data if result.is_success else extracted_data
 
         return {
-            **state,
             "transformed_data": transformed_data,
             "status": "transformed",
         }
 
     async def _finalize_node(self, state: dict) -> dict:
         """Finalize the data entry result."""
-        logger.debug("Finalizing data entry")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Finalizing data entry")
 
-        final_data = state.get("transformed_data", state.get("extracted_data", {}))
+        # Transform is skipped when retries run out, so fall back to the extraction
+        final_data = state.get("transformed_data") or state.get("extracted_data", {})
         validation_result = state.get("validation_result", {})
 
         return {
-            **state,
             "final_data": final_data,
+            "data_type": state.get("analysis", {}).get("data_type"),
+            "validation_errors": validation_result.get("errors", []),
             "success": validation_result.get("valid", False),
             "status": "completed",
+            # Drop intermediate results so the final state and checkpoints stay small
+            "pending_searches": [],
+            "search_results": {},
+            "documents": [],
+            "extracted_data": {},
+            "transformed_data": {},
+            "validation_result": {},
         }
 
     async def run(self, request: str, **kwargs: Any) -> AgentResult:
@@ -327,9 +527,17 @@ Respond in JSON format:
 
         try:
             final_state = await self.graph.ainvoke(initial_state)
+            final_data = final_state.get("final_data", {})
+
+            # Serialize as JSON so callers can parse the answer
+            answer = (
+                orjson.dumps(final_data, option=orjson.OPT_SORT_KEYS).decode()
+                if final_data
+                else ""
+            )
 
             return AgentResult(
-                answer=str(final_state.get("final_data", {})),
+                answer=answer,
                 sources=[
                     {"content": src, "metadata": {}}
                     for src in final_state.get("extraction_sources", [])
@@ -337,9 +545,9 @@ Respond in JSON format:
                 iterations=final_state.get("iteration", 0),
                 success=final_state.get("success", False),
                 metadata={
-                    "data_type": final_state.get("analysis", {}).get("data_type"),
-                    "validation_errors": final_state.get("validation_result", {}).get("errors", []),
-                    "final_data": final_state.get("final_data", {}),
+                    "data_type": final_state.get("data_type"),
+                    "validation_errors": final_state.get("validation_errors", []),
+                    "final_data": final_data,
                 },
             )
 
@@ -361,7 +569,7 @@ Respond in JSON format:
             **kwargs: Additional arguments.
 
         Yields:
-            Intermediate states and events.
+            Per-node progress summaries and LLM token events.
         """
         logger.info("Data entry agent streaming", request_preview=request[:50])
 
@@ -377,15 +585,39 @@ Respond in JSON format:
             "success": False,
         }
 
-        async for event in self.graph.astream(initial_state):
-            for node_name, state in event.items():
-                yield {
-                    "event": node_name,
-                    "status": state.get("status", ""),
-                    "iteration": state.get("iteration", 0),
-                    "has_data": bool(state.get("extracted_data")),
-                    "is_valid": state.get("validation_result", {}).get("valid", False),
-                }
+        # Running summary, updated only from the keys each node changed
+        summary = {"status": "started", "iteration": 0, "has_data": False, "is_valid": False}
+
+        async for mode, payload in self.graph.astream(
+            initial_state,
+            stream_mode=["updates", "messages"],
+        ):
+            if mode == "messages":
+                chunk, metadata = payload
+                if chunk.content:
+                    yield {
+                        "event": "token",
+                        "node": metadata.get("langgraph_node", ""),
+                        "content": chunk.content,
+                    }
+                continue
+
+            for node_name, update in payload.items():
+                # Search branches emit partial updates, or none on failure
+                update = update or {}
+                if "status" in update:
+                    summary["status"] = update["status"]
+                if "iteration" in update:
+                    summary["iteration"] = update["iteration"]
+                if "final_data" in update:
+                    summary["has_data"] = bool(update["final_data"])
+                elif "extracted_data" in update:
+                    summary["has_data"] = bool(update["extracted_data"])
+                if "success" in update:
+                    summary["is_valid"] = update["success"]
+                elif "validation_result" in update:
+                    summary["is_valid"] = update["validation_result"].get("valid", False)
+                yield {"event": node_name, **summary}
 
 
 def create_data_entry_agent(
@@ -7,21 +7,213 @@ This agent generates reports by:
 4. Generating formatted reports
 """
 
-from typing import Any, AsyncIterator
+import asyncio
+import logging
+from typing import Annotated, Any, AsyncIterator, Iterator, TypedDict
 from enum import Enum
 
+import orjson
 from langchain_core.prompts import ChatPromptTemplate
-from langchain_openai import ChatOpenAI
 from langgraph.graph import END, StateGraph
+from langgraph.types import Send
 
 from src.agents.base import AgentConfig, AgentResult, BaseAgent
+from src.agents.llm import ainvoke_content, get_chat_model
+from src.agents.tools.base import ToolResult
 from src.agents.tools.document_tools import SearchDocumentsTool, SummarizeDocumentTool
 from src.agents.tools.data_tools import FormatOutputTool
+from src.agents.utils import parse_llm_json, truncate_tokens
 from src.core import get_logger
+from src.core.cache import TTLCache
 from src.core.config import get_settings
+from src.rag.retrieval.vector_store import get_vector_store
 
 logger = get_logger(__name__)
 
+_ANALYZE_PROMPT = ChatPromptTemplate.from_template(
+    """Analyze this report request and determine the requirements.
+
+Report Request: {request}
+Report Type: {report_type}
+
+Provide analysis in JSON format:
+{{
+    "title": "suggested report title",
+    "purpose": "purpose of the report",
+    "audience": "intended audience",
+    "key_topics": ["main topics to cover"],
+    "data_sources": ["types of data needed"],
+    "search_queries": ["queries to find relevant information"],
+    "time_scope": "time period covered if applicable",
+    "depth": "brief/standard/detailed"
+}}"""
+)
+
+_PLAN_PROMPT = ChatPromptTemplate.from_template(
+    """Create a detailed outline for this report.
+
+Requirements: {requirements}
+Report Type: {report_type}
+
+Create a report outline in JSON format:
+{{
+    "sections": [
+        {{
+            "title": "Section Title",
+            "purpose": "what this section covers",
+            "key_points": ["points to address"],
+            "search_queries": ["specific queries for this section"]
+        }}
+    ],
+    "executive_summary_needed": true/false,
+    "conclusion_needed": true/false,
+    "appendix_topics": ["optional appendix items"]
+}}"""
+)
+
+_SECTION_PROMPT = ChatPromptTemplate.from_template(
+    """Write the content for this report section.
+
+Section Title: {title}
+Section Purpose: {purpose}
+Key Points to Address: {key_points}
+
+Available Information:
+{context}
+
+Report Depth: {depth}
+Audience: {audience}
+
+Write a well-structured section that:
+1. Has a clear introduction
+2. Addresses the key points
+3. Uses evidence from the provided information
+4. Maintains a professional tone
+
+Section Content:"""
+)
+
+_SECTIONS_BATCH_PROMPT = ChatPromptTemplate.from_template(
+    """Write the content for each section of this report.
+
+Report Depth: {depth}
+Audience: {audience}
+
+Sections, each with its purpose, key points and available information:
+{sections_json}
+
+For every section, write well-structured content that:
+1. Has a clear introduction
+2. Addresses the key points
+3. Uses evidence from the section's information
+4. Maintains a professional tone
+
+Respond with a JSON array containing one object per section, in the same order:
+[
+    {{"title": "Section Title", "content": "section content"}}
+]"""
+)
+
+_SUMMARY_PROMPT = ChatPromptTemplate.from_template(
+    """Write an executive summary for this report.
+
+Report Title: {title}
+Report Purpose: {purpose}
+
+Full Report Content:
+{content}
+
+Write a concise executive summary (2-3 paragraphs) that:
+1. States the main purpose
+2. Highlights key findings
+3. Summarizes conclusions/recommendations
+
+Executive Summary:"""
+)
+
+_CONCLUSION_PROMPT = ChatPromptTemplate.from_template(
+    """Write a conclusion for this report.
+
+Report Purpose: {purpose}
+Key Findings from Sections:
+{sections}
+
+Write a brief conclusion that:
+1. Summarizes the main findings
+2. Provides recommendations if applicable
+3. Suggests next steps
+
+Conclusion:"""
+)
+
+
+_NL = "\n"
+
+_NO_DATA_CONTEXT = "No specific data available for this section."
+
+# Report search result cache instance
+_report_search_cache: TTLCache | None = None
+
+
+def get_report_search_cache() -> TTLCache:
+    """Get the shared cache for report document searches.
+
+    Results are keyed by (query, top_k), shared by all report agents and
+    cleared whenever documents are added to or deleted from the vector store.
+
+    Returns:
+        The cache singleton.
+    """
+    global _report_search_cache
+    if _report_search_cache is None:
+        _report_search_cache = TTLCache(
+            max_entries=512,
+            ttl_seconds=get_settings().search_cache_ttl_seconds,
+        )
+        get_vector_store().add_change_listener(_report_search_cache.clear)
+    return _report_search_cache
+
+
+def _merge_gathered_data(
+    current: list[dict[str, Any]],
+    update: list[dict[str, Any]],
+) -> list[dict[str, Any]]:
+    """Append section data written by parallel gathering branches.
+
+    An empty update clears the data.
+    """
+    return current + update if update else []
+
+
+def _iter_report_blocks(compiled_report: dict[str, Any]) -> Iterator[tuple[str, str]]:
+    """Yield the (heading, body) blocks of a compiled report in output order."""
+    if compiled_report.get("executive_summary"):
+        yield "Executive Summary", compiled_report["executive_summary"]
+
+    for section in compiled_report.get("sections", []):
+        yield section["title"], section["content"]
+
+    if compiled_report.get("conclusion"):
+        yield "Conclusion", compiled_report["conclusion"]
+
+
+class ReportState(TypedDict, total=False):
+    """State for report generation agent."""
+
+    request: str
+    report_type: str
+    output_format: str
+    use_llm_cache: bool
+    requirements: dict[str, Any]
+    outline: dict[str, Any]
+    gathered_data: Annotated[list[dict[str, Any]], _merge_gathered_data]
+    generated_sections: list[dict[str, Any]]
+    compiled_report: dict[str, Any]
+    formatted_report: str
+    iteration: int
+    status: str
+    success: bool
+
 
 class ReportFormat(str, Enum):
     """Report output formats."""
@@ -61,12 +253,21 @@ class ReportGenerationAgent(BaseAgent):
         super().__init__(config)
         self.settings = get_settings()
 
-        # Initialize LLM
-        self.llm = ChatOpenAI(
-            model=self.config.model_name,
-            temperature=0.5,  # Balanced for report writing
-            openai_api_key=self.settings.openai_api_key,
-        )
+        # Initialize LLM (balanced temperature for report writing)
+        self.llm = get_chat_model(self.config.model_name, 0.5)
+
+        self._analyze_chain = _ANALYZE_PROMPT | self.llm
+        self._plan_chain = _PLAN_PROMPT | self.llm
+        self._section_chain = _SECTION_PROMPT | self.llm
+        self._sections_batch_chain = _SECTIONS_BATCH_PROMPT | self.llm
+        self._summary_chain = _SUMMARY_PROMPT | self.llm
+        self._conclusion_chain = _CONCLUSION_PROMPT | self.llm
+
+        # LLM calls currently holding the base agent's concurrency limit
+        self._llm_in_flight = 0
+
+        # In-flight searches by (query, top_k), shared by sections with overlapping queries
+        self._pending_searches: dict[tuple[str, int], asyncio.Task[ToolResult]] = {}
 
         # Initialize tools
         self.search_tool = SearchDocumentsTool()
@@ -82,12 +283,12 @@ class ReportGenerationAgent(BaseAgent):
         Returns:
             Compiled state graph.
         """
-        workflow = StateGraph(dict)
+        workflow = StateGraph(ReportState)
 
         # Add nodes
         workflow.add_node("analyze_requirements", self._analyze_requirements_node)
         workflow.add_node("plan_report", self._plan_report_node)
-        workflow.add_node("gather_data", self._gather_data_node)
+        workflow.add_node("gather_section", self._gather_section_node)
         workflow.add_node("generate_sections", self._generate_sections_node)
         workflow.add_node("compile_report", self._compile_report_node)
         workflow.add_node("format_output", self._format_output_node)
@@ -97,8 +298,12 @@ class ReportGenerationAgent(BaseAgent):
 
         # Add edges
         workflow.add_edge("analyze_requirements", "plan_report")
-        workflow.add_edge("plan_report", "gather_data")
-        workflow.add_edge("gather_data", "generate_sections")
+        workflow.add_conditional_edges(
+            "plan_report",
+            self._section_fanout_router,
+            ["gather_section", "generate_sections"],
+        )
+        workflow.add_edge("gather_section", "generate_sections")
         workflow.add_edge("generate_sections", "compile_report")
         workflow.add_edge("compile_report", "format_output")
         workflow.add_edge("format_output", END)
@@ -107,46 +312,20 @@ class ReportGenerationAgent(BaseAgent):
 
     async def _analyze_requirements_node(self, state: dict) -> dict:
         """Analyze report requirements."""
+        use_cache = state.get("use_llm_cache", False)
         request = state.get("request", "")
         report_type = state.get("report_type", "summary")
 
         logger.debug("Analyzing report requirements", request_preview=request[:100])
 
-        prompt = ChatPromptTemplate.from_template(
-            """Analyze this report request and determine the requirements.
-
-Report Request: {request}
-Report Type: {report_type}
-
-Provide analysis in JSON format:
-{{
-    "title": "suggested report title",
-    "purpose": "purpose of the report",
-    "audience": "intended audience",
-    "key_topics": ["main topics to cover"],
-    "data_sources": ["types of data needed"],
-    "search_queries": ["queries to find relevant information"],
-    "time_scope": "time period covered if applicable",
-    "depth": "brief/standard/detailed"
-}}"""
-        )
-
-        result = await (prompt | self.llm).ainvoke({
+        content = await self._llm_call(self._analyze_chain, {
             "request": request,
             "report_type": report_type,
-        })
+        }, use_cache=use_cache)
 
-        import json
-        import re
-
-        try:
-            json_str = result.content.strip()
-            if json_str.startswith("```"):
-                json_str = re.sub(r"^```(?:json)?\n?", "", json_str)
-                json_str = re.sub(r"\n?```$", "", json_str)
-            requirements = json.loads(json_str)
-        except json.JSONDecodeError:
-            requirements = {
+        requirements = parse_llm_json(
+            content,
+            fallback={
                 "title": "Report",
                 "purpose": request,
                 "audience": "general",
@@ -154,10 +333,10 @@ Provide analysis in JSON format:
                 "data_sources": [],
                 "search_queries": [request],
                 "depth": "standard",
-            }
+            },
+        )
 
         return {
-            **state,
             "requirements": requirements,
             "status": "requirements_analyzed",
             "iteration": 1,
@@ -165,49 +344,21 @@ Provide analysis in JSON format:
 
     async def _plan_report_node(self, state: dict) -> dict:
         """Plan the report structure."""
+        use_cache = state.get("use_llm_cache", False)
         requirements = state.get("requirements", {})
         report_type = state.get("report_type", "summary")
 
         logger.debug("Planning report structure")
 
-        prompt = ChatPromptTemplate.from_template(
-            """Create a detailed outline for this report.
-
-Requirements: {requirements}
-Report Type: {report_type}
-
-Create a report outline in JSON format:
-{{
-    "sections": [
-        {{
-            "title": "Section Title",
-            "purpose": "what this section covers",
-            "key_points": ["points to address"],
-            "search_queries": ["specific queries for this section"]
-        }}
-    ],
-    "executive_summary_needed": true/false,
-    "conclusion_needed": true/false,
-    "appendix_topics": ["optional appendix items"]
-}}"""
-        )
-
-        result = await (prompt | self.llm).ainvoke({
-            "requirements": str(requirements),
+        content = await self._llm_call(self._plan_chain, {
+            # Sorted compact JSON keeps the prompt short and stable for the LLM cache
+            "requirements": orjson.dumps(requirements, option=orjson.OPT_SORT_KEYS).decode(),
             "report_type": report_type,
-        })
+        }, use_cache=use_cache)
 
-        import json
-        import re
-
-        try:
-            json_str = result.content.strip()
-            if json_str.startswith("```"):
-                json_str = re.sub(r"^```(?:json)?\n?", "", json_str)
-                json_str = re.sub(r"\n?```$", "", json_str)
-            outline = json.loads(json_str)
-        except json.JSONDecodeError:
-            outline = {
+        outline = parse_llm_json(
+            content,
+            fallback={
                 "sections": [
                     {
                         "title": "Overview",
@@ -218,179 +369,282 @@ Create a report outline in JSON format:
                 ],
                 "executive_summary_needed": True,
                 "conclusion_needed": True,
-            }
+            },
+        )
 
         return {
-            **state,
             "outline": outline,
             "status": "report_planned",
             "iteration": state.get("iteration", 0) + 1,
         }
 
-    async def _gather_data_node(self, state: dict) -> dict:
-        """Gather data for the report."""
-        outline = state.get("outline", {})
-        requirements = state.get("requirements", {})
+    async def _llm_call(
+        self,
+        chain: Any,
+        variables: dict[str, Any],
+        use_cache: bool = False,
+    ) -> str:
+        """Invoke an LLM chain under the agent's concurrency limit.
 
-        logger.debug("Gathering report data")
+        Args:
+            chain: ``prompt | llm`` chain.
+            variables: Prompt variables.
+            use_cache: Whether to reuse cached LLM responses.
 
-        all_data = []
-        sections = outline.get("sections", [])
+        Returns:
+            Response content.
+        """
+        async with self._llm_semaphore:
+            self._llm_in_flight += 1
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(
+                    "Report LLM call started",
+                    in_flight=self._llm_in_flight,
+                    limit=self.config.max_concurrent_llm,
+                )
+            try:
+                return await ainvoke_content(chain, variables, use_cache=use_cache)
+            finally:
+                self._llm_in_flight -= 1
+
+    async def _search(self, query: str, top_k: int = 5) -> ToolResult:
+        """Search documents, reusing results for identical queries.
+
+        Concurrent callers with the same query share one in-flight search.
 
-        for section in sections:
-            section_data = {
-                "title": section.get("title", ""),
-                "content": [],
-            }
+        Args:
+            query: Search query.
+            top_k: Number of results.
 
-            queries = section.get("search_queries", [])
-            for query in queries[:2]:
-                result = await self.search_tool.execute(query=query, top_k=5)
-                if result.is_success:
-                    for doc in result.data:
-                        section_data["content"].append({
-                            "text": doc["content"],
-                            "source": doc.get("source", "Unknown"),
-                            "relevance": doc.get("score", 0),
-                        })
+        Returns:
+            Search tool result.
+        """
+        key = (query, top_k)
+        cached = get_report_search_cache().get(key)
+        if cached is not None:
+            return cached
+
+        task = self._pending_searches.get(key)
+        if task is None:
+            task = asyncio.create_task(self._run_search(query, top_k))
+            self._pending_searches[key] = task
+            task.add_done_callback(lambda _: self._pending_searches.pop(key, None))
+
+        # Shielded so one cancelled caller does not cancel the shared search
+        return await asyncio.shield(task)
+
+    async def _run_search(self, query: str, top_k: int) -> ToolResult:
+        """Run a bounded document search and cache a successful result."""
+        async with self._search_semaphore:
+            result = await self.search_tool.execute(query=query, top_k=top_k)
+        if result.is_success:
+            get_report_search_cache().put((query, top_k), result)
+        return result
+
+    def _section_fanout_router(self, state: dict) -> list[Send] | str:
+        """Fan out one data-gathering branch per outlined section."""
+        sections = state.get("outline", {}).get("sections", [])
+        if not sections:
+            return "generate_sections"
+        return [
+            Send("gather_section", {"index": i, "section": section})
+            for i, section in enumerate(sections)
+        ]
+
+    async def _gather_section_node(self, task: dict) -> dict:
+        """Gather data for one report section."""
+        section_outline = task["section"]
+
+        logger.debug("Gathering report section data", title=section_outline.get("title", ""))
+
+        section_data = {
+            "index": task["index"],
+            "title": section_outline.get("title", ""),
+            "content": [],
+        }
 
-            all_data.append(section_data)
+        # Search the section's queries concurrently, bounded across all sections
+        results = await asyncio.gather(
+            *(self._search(query) for query in section_outline.get("search_queries", [])[:2]),
+            return_exceptions=True,
+        )
 
-        return {
-            **state,
-            "gathered_data": all_data,
-            "status": "data_gathered",
-            "iteration": state.get("iteration", 0) + 1,
-        }
+        for result in results:
+            if isinstance(result, BaseException):
+                logger.warning("Report data search failed", error=str(result))
+                continue
+            if result.is_success:
+                for doc in result.data:
+                    section_data["content"].append({
+                        "text": doc["content"],
+                        "source": doc.get("source", "Unknown"),
+                        "relevance": doc.get("score", 0),
+                    })
+
+        return {"gathered_data": [section_data]}
 
     async def _generate_sections_node(self, state: dict) -> dict:
-        """Generate content for each report section."""
-        gathered_data = state.get("gathered_data", [])
+        """Generate content for all report sections."""
+        use_cache = state.get("use_llm_cache", False)
         outline = state.get("outline", {})
         requirements = state.get("requirements", {})
+        # Branches finish in any order; restore the outline order
+        gathered_data = sorted(state.get("gathered_data", []), key=lambda data: data["index"])
 
-        logger.debug("Generating report sections")
-
-        sections = []
-        for section_data, section_outline in zip(gathered_data, outline.get("sections", [])):
-            # Combine content for this section
-            context = "\n\n".join(
-                f"[Source: {c['source']}]\n{c['text']}"
-                for c in section_data.get("content", [])[:5]
-            )
-
-            if not context:
-                context = "No specific data available for this section."
-
-            prompt = ChatPromptTemplate.from_template(
-                """Write the content for this report section.
-
-Section Title: {title}
-Section Purpose: {purpose}
-Key Points to Address: {key_points}
+        logger.debug("Generating report sections", count=len(gathered_data))
 
-Available Information:
-{context}
+        # Parallel gather branches cannot write status, so this node advances
+        # the iteration for both data gathering and section generation
+        iteration = state.get("iteration", 0) + 2
 
-Report Depth: {depth}
-Audience: {audience}
+        if not gathered_data:
+            return {
+                "generated_sections": [],
+                "status": "sections_generated",
+                "iteration": iteration,
+            }
 
-Write a well-structured section that:
-1. Has a clear introduction
-2. Addresses the key points
-3. Uses evidence from the provided information
-4. Maintains a professional tone
+        outlined_sections = outline.get("sections", [])
+        section_inputs = []
+        section_sources = []
+        for section_data in gathered_data:
+            section_outline = outlined_sections[section_data["index"]]
+            top_content = section_data["content"][:5]
+            section_sources.append([c["source"] for c in top_content])
 
-Section Content:"""
-            )
+            # Combine content for this section
+            context = "\n\n".join([
+                f"[Source: {c['source']}]\n{c['text']}" for c in top_content
+            ])
 
-            result = await (prompt | self.llm).ainvoke({
+            section_inputs.append({
                 "title": section_outline.get("title", ""),
                 "purpose": section_outline.get("purpose", ""),
-                "key_points": str(section_outline.get("key_points", [])),
-                "context": context,
-                "depth": requirements.get("depth", "standard"),
-                "audience": requirements.get("audience", "general"),
+                "key_points": section_outline.get("key_points", []),
+                "context": (
+                    truncate_tokens(context, self.config.section_ctx_tokens) or _NO_DATA_CONTEXT
+                ),
             })
 
-            sections.append({
-                "title": section_outline.get("title", ""),
-                "content": result.content,
-                "sources": [c["source"] for c in section_data.get("content", [])[:5]],
-            })
+        depth = requirements.get("depth", "standard")
+        audience = requirements.get("audience", "general")
+
+        # A brief report states missing data instead of padding the section
+        contents = [_NO_DATA_CONTEXT] * len(section_inputs)
+        to_write = [
+            i for i, section_input in enumerate(section_inputs)
+            if depth != "brief" or section_input["context"] != _NO_DATA_CONTEXT
+        ]
+        if to_write:
+            written = await self._write_sections(
+                [section_inputs[i] for i in to_write], depth, audience, use_cache
+            )
+            for i, section_content in zip(to_write, written):
+                contents[i] = section_content
 
         return {
-            **state,
-            "generated_sections": sections,
+            # Retrieved documents are no longer needed once sections are written
+            "gathered_data": [],
+            "generated_sections": [
+                {
+                    "title": section_input["title"],
+                    "content": section_content,
+                    "sources": sources,
+                }
+                for section_input, section_content, sources in zip(
+                    section_inputs, contents, section_sources
+                )
+            ],
             "status": "sections_generated",
-            "iteration": state.get("iteration", 0) + 1,
+            "iteration": iteration,
         }
 
+    async def _write_sections(
+        self,
+        section_inputs: list[dict[str, Any]],
+        depth: str,
+        audience: str,
+        use_cache: bool,
+    ) -> list[str]:
+        """Write section contents in one batched LLM call.
+
+        Falls back to one concurrent call per section when the batched
+        response cannot be parsed into one entry per section.
+
+        Args:
+            section_inputs: Title, purpose, key points and context per section.
+            depth: Report depth.
+            audience: Intended audience.
+            use_cache: Whether to reuse cached LLM responses.
+
+        Returns:
+            Content for each section, in input order.
+        """
+        content = await self._llm_call(self._sections_batch_chain, {
+            "sections_json": orjson.dumps(section_inputs).decode(),
+            "depth": depth,
+            "audience": audience,
+        }, use_cache=use_cache)
+
+        written = parse_llm_json(content, fallback=None)
+        if (
+            isinstance(written, list)
+            and len(written) == len(section_inputs)
+            and all(isinstance(w, dict) and isinstance(w.get("content"), str) for w in written)
+        ):
+            return [w["content"] for w in written]
+
+        logger.warning("Batched section response unusable, writing sections individually")
+        return await asyncio.gather(*(
+            self._llm_call(self._section_chain, {
+                **section_input,
+                "key_points": orjson.dumps(section_input["key_points"]).decode(),
+                "depth": depth,
+                "audience": audience,
+            }, use_cache=use_cache)
+            for section_input in section_inputs
+        ))
+
     async def _compile_report_node(self, state: dict) -> dict:
         """Compile all sections into a complete report."""
+        use_cache = state.get("use_llm_cache", False)
         sections = state.get("generated_sections", [])
         outline = state.get("outline", {})
         requirements = state.get("requirements", {})
 
         logger.debug("Compiling report")
 
-        # Generate executive summary if needed
-        executive_summary = ""
-        if outline.get("executive_summary_needed", True):
-            all_content = "\n\n".join(s["content"] for s in sections)
-
-            prompt = ChatPromptTemplate.from_template(
-                """Write an executive summary for this report.
-
-Report Title: {title}
-Report Purpose: {purpose}
-
-Full Report Content:
-{content}
-
-Write a concise executive summary (2-3 paragraphs) that:
-1. States the main purpose
-2. Highlights key findings
-3. Summarizes conclusions/recommendations
-
-Executive Summary:"""
-            )
+        # Nothing to summarize or conclude from sections without content
+        has_content = any(
+            s["content"].strip() and s["content"] != _NO_DATA_CONTEXT for s in sections
+        )
 
-            result = await (prompt | self.llm).ainvoke({
+        # Build the executive summary and conclusion calls, then run them concurrently
+        summary_call = None
+        if has_content and outline.get("executive_summary_needed", True):
+            all_content = "\n\n".join(s["content"] for s in sections)
+            summary_call = self._llm_call(self._summary_chain, {
                 "title": requirements.get("title", "Report"),
                 "purpose": requirements.get("purpose", ""),
-                "content": all_content[:5000],
-            })
-            executive_summary = result.content
-
-        # Generate conclusion if needed
-        conclusion = ""
-        if outline.get("conclusion_needed", True):
-            prompt = ChatPromptTemplate.from_template(
-                """Write a conclusion for this report.
-
-Report Purpose: {purpose}
-Key Findings from Sections:
-{sections}
-
-Write a brief conclusion that:
-1. Summarizes the main findings
-2. Provides recommendations if applicable
-3. Suggests next steps
-
-Conclusion:"""
-            )
+                "content": truncate_tokens(all_content, self.config.exec_summary_ctx_tokens),
+            }, use_cache=use_cache)
 
+        conclusion_call = None
+        if has_content and outline.get("conclusion_needed", True):
             section_summaries = "\n".join(
                 f"- {s['title']}: {s['content'][:200]}..."
                 for s in sections
             )
 
-            result = await (prompt | self.llm).ainvoke({
+            conclusion_call = self._llm_call(self._conclusion_chain, {
                 "purpose": requirements.get("purpose", ""),
                 "sections": section_summaries,
-            })
-            conclusion = result.content
+            }, use_cache=use_cache)
+
+        executive_summary, conclusion = await asyncio.gather(
+            summary_call or asyncio.sleep(0, result=""),
+            conclusion_call or asyncio.sleep(0, result=""),
+        )
 
         # Compile full report
         compiled_report = {
@@ -398,15 +652,15 @@ Conclusion:"""
             "executive_summary": executive_summary,
             "sections": sections,
             "conclusion": conclusion,
-            "sources": list(set(
+            # Ordered dedup keeps sources in first-cited order
+            "sources": list(dict.fromkeys(
                 source
                 for s in sections
-                for source in s.get("sources", [])
+                for source in s.get("sources", ())
             )),
         }
 
         return {
-            **state,
             "compiled_report": compiled_report,
             "status": "report_compiled",
             "iteration": state.get("iteration", 0) + 1,
@@ -419,94 +673,43 @@ Conclusion:"""
 
         logger.debug("Formatting report output", format=output_format)
 
+        title = compiled_report.get("title", "Report")
+        blocks = list(_iter_report_blocks(compiled_report))
+
         if output_format == "markdown":
             # Format as Markdown
-            lines = [
-                f"# {compiled_report.get('title', 'Report')}",
-                "",
-            ]
-
-            if compiled_report.get("executive_summary"):
-                lines.extend([
-                    "## Executive Summary",
-                    "",
-                    compiled_report["executive_summary"],
-                    "",
-                ])
-
-            for section in compiled_report.get("sections", []):
-                lines.extend([
-                    f"## {section['title']}",
-                    "",
-                    section["content"],
-                    "",
-                ])
-
-            if compiled_report.get("conclusion"):
-                lines.extend([
-                    "## Conclusion",
-                    "",
-                    compiled_report["conclusion"],
-                    "",
-                ])
+            lines = [f"# {title}", ""]
+            for heading, body in blocks:
+                lines.extend([f"## {heading}", "", body, ""])
 
             if compiled_report.get("sources"):
-                lines.extend([
-                    "## Sources",
-                    "",
-                ])
-                for source in compiled_report["sources"]:
-                    lines.append(f"- {source}")
+                lines.extend(["## Sources", ""])
+                lines.extend(f"- {source}" for source in compiled_report["sources"])
 
-            formatted_output = "\n".join(lines)
+            formatted_output = _NL.join(lines)
 
         elif output_format == "html":
             # Format as HTML
-            html_parts = [
-                f"<h1>{compiled_report.get('title', 'Report')}</h1>",
-            ]
-
-            if compiled_report.get("executive_summary"):
-                html_parts.extend([
-                    "<h2>Executive Summary</h2>",
-                    f"<p>{compiled_report['executive_summary'].replace(chr(10), '</p><p>')}</p>",
-                ])
-
-            for section in compiled_report.get("sections", []):
-                html_parts.extend([
-                    f"<h2>{section['title']}</h2>",
-                    f"<p>{section['content'].replace(chr(10), '</p><p>')}</p>",
-                ])
-
-            if compiled_report.get("conclusion"):
-                html_parts.extend([
-                    "<h2>Conclusion</h2>",
-                    f"<p>{compiled_report['conclusion'].replace(chr(10), '</p><p>')}</p>",
-                ])
-
-            formatted_output = "\n".join(html_parts)
+            formatted_output = _NL.join([
+                f"<h1>{title}</h1>",
+                *(
+                    f"<h2>{heading}</h2>{_NL}<p>{body.replace(_NL, '</p><p>')}</p>"
+                    for heading, body in blocks
+                ),
+            ])
 
         elif output_format == "json":
-            import json
-            formatted_output = json.dumps(compiled_report, indent=2, ensure_ascii=False)
+            formatted_output = orjson.dumps(compiled_report, option=orjson.OPT_INDENT_2).decode()
 
         else:
             # Plain text
-            lines = [compiled_report.get("title", "Report").upper(), "=" * 50, ""]
-
-            if compiled_report.get("executive_summary"):
-                lines.extend(["EXECUTIVE SUMMARY", "-" * 20, compiled_report["executive_summary"], ""])
-
-            for section in compiled_report.get("sections", []):
-                lines.extend([section["title"].upper(), "-" * 20, section["content"], ""])
+            lines = [title.upper(), "=" * 50, ""]
+            for heading, body in blocks:
+                lines.extend([heading.upper(), "-" * 20, body, ""])
 
-            if compiled_report.get("conclusion"):
-                lines.extend(["CONCLUSION", "-" * 20, compiled_report["conclusion"]])
-
-            formatted_output = "\n".join(lines)
+            formatted_output = _NL.join(lines)
 
         return {
-            **state,
             "formatted_report": formatted_output,
             "success": True,
             "status": "completed",
@@ -517,6 +720,7 @@ Conclusion:"""
         request: str,
         report_type: str = "summary",
         output_format: str = "markdown",
+        cache: bool = False,
         **kwargs: Any,
     ) -> AgentResult:
         """Run the report generation agent.
@@ -525,6 +729,7 @@ Conclusion:"""
             request: Report request/topic.
             report_type: Type of report to generate.
             output_format: Output format (markdown, html, json, text).
+            cache: Reuse LLM responses for prompts already seen.
             **kwargs: Additional arguments.
 
         Returns:
@@ -536,6 +741,7 @@ Conclusion:"""
             "request": request,
             "report_type": report_type,
             "output_format": output_format,
+            "use_llm_cache": cache,
             "requirements": {},
             "outline": {},
             "gathered_data": [],
@@ -548,7 +754,10 @@ Conclusion:"""
         }
 
         try:
-            final_state = await self.graph.ainvoke(initial_state)
+            final_state = await self.graph.ainvoke(
+                initial_state,
+                config={"max_concurrency": self.config.max_concurrent_llm},
+            )
 
             return AgentResult(
                 answer=final_state.get("formatted_report", ""),
@@ -581,6 +790,7 @@ Conclusion:"""
         request: str,
         report_type: str = "summary",
         output_format: str = "markdown",
+        cache: bool = False,
         **kwargs: Any,
     ) -> AsyncIterator[dict[str, Any]]:
         """Stream report generation execution.
@@ -589,6 +799,7 @@ Conclusion:"""
             request: Report request/topic.
             report_type: Type of report.
             output_format: Output format.
+            cache: Reuse LLM responses for prompts already seen.
             **kwargs: Additional arguments.
 
         Yields:
@@ -600,6 +811,7 @@ Conclusion:"""
             "request": request,
             "report_type": report_type,
             "output_format": output_format,
+            "use_llm_cache": cache,
             "requirements": {},
             "outline": {},
             "gathered_data": [],
@@ -611,15 +823,35 @@ Conclusion:"""
             "success": False,
         }
 
-        async for event in self.graph.astream(initial_state):
-            for node_name, state in event.items():
-                yield {
-                    "event": node_name,
-                    "status": state.get("status", ""),
-                    "iteration": state.get("iteration", 0),
-                    "sections_ready": len(state.get("generated_sections", [])),
-                    "title": state.get("requirements", {}).get("title", ""),
-                }
+        # Nodes return only the keys they change, so keep a running summary
+        summary = {"status": "started", "iteration": 0, "sections_ready": 0, "title": ""}
+
+        async for mode, payload in self.graph.astream(
+            initial_state,
+            config={"max_concurrency": self.config.max_concurrent_llm},
+            stream_mode=["updates", "messages"],
+        ):
+            if mode == "messages":
+                # LLM tokens as they are generated, tagged with the emitting node
+                chunk, metadata = payload
+                if chunk.content:
+                    yield {
+                        "event": "token",
+                        "node": metadata.get("langgraph_node", ""),
+                        "content": chunk.content,
+                    }
+                continue
+
+            for node_name, update in payload.items():
+                if "status" in update:
+                    summary["status"] = update["status"]
+                if "iteration" in update:
+                    summary["iteration"] = update["iteration"]
+                if "generated_sections" in update:
+                    summary["sections_ready"] += len(update["generated_sections"])
+                if "requirements" in update:
+                    summary["title"] = update["requirements"].get("title", "")
+                yield {"event": node_name, **summary}
 
 
 def create_report_agent(
@@ -8,20 +8,102 @@ This agent handles customer support ticket triage by:
 5. Routing to the appropriate team
 """
 
-from typing import Any, AsyncIterator
+import asyncio
+from typing import Any, AsyncIterator, TypedDict
 from enum import Enum
 
+import orjson
 from langchain_core.prompts import ChatPromptTemplate
-from langchain_openai import ChatOpenAI
 from langgraph.graph import END, StateGraph
 
-from src.agents.base import AgentConfig, AgentResult, BaseAgent
+from src.agents.base import AgentConfig, AgentResult, BaseAgent, agent_node
+from src.agents.llm import ainvoke_content, get_chat_model, get_semantic_llm_cache
+from src.agents.tools.base import ToolResult
 from src.agents.tools.document_tools import SearchDocumentsTool
+from src.agents.utils import fingerprint, parse_llm_json, truncate_middle, unique_by_content
 from src.core import get_logger
 from src.core.config import get_settings
+from src.rag.retrieval.vector_store import get_vector_store
 
 logger = get_logger(__name__)
 
+_ANALYZE_PROMPT = ChatPromptTemplate.from_template(
+    """Analyze this customer support ticket, extract key information and classify the issue.
+
+Customer Info: {customer_info}
+
+Ticket Content:
+{ticket}
+
+Provide the analysis and classification in JSON format:
+{{
+    "analysis": {{
+        "summary": "brief summary of the issue",
+        "customer_sentiment": "positive/neutral/negative/frustrated",
+        "urgency_indicators": ["list of phrases indicating urgency"],
+        "key_issues": ["list of main issues mentioned"],
+        "customer_expectations": "what the customer expects",
+        "language": "detected language"
+    }},
+    "classification": {{
+        "category": "technical|billing|account|feature_request|bug_report|general",
+        "priority": "critical|high|medium|low",
+        "priority_reason": "reason for priority level",
+        "subcategory": "more specific category",
+        "tags": ["relevant", "tags"],
+        "requires_escalation": true/false,
+        "escalation_reason": "reason if escalation needed"
+    }}
+}}
+
+Priority Guidelines:
+- critical: System down, data loss, security breach
+- high: Major functionality broken, revenue impact
+- medium: Feature not working, workaround available
+- low: Questions, minor issues, feature requests"""
+)
+
+_RESPONSE_PROMPT = ChatPromptTemplate.from_template(
+    """Generate a professional support response for this ticket.
+
+Customer Ticket:
+{ticket}
+
+Issue Analysis:
+- Summary: {summary}
+- Category: {category}
+- Priority: {priority}
+- Customer Sentiment: {sentiment}
+
+Relevant Knowledge Base Articles:
+{kb_context}
+
+Generate a response that:
+1. Acknowledges the customer's issue
+2. Shows empathy if they're frustrated
+3. Provides a clear solution or next steps
+4. References relevant KB articles if helpful
+5. Maintains a professional but friendly tone
+
+Response:"""
+)
+
+
+class SupportTriageState(TypedDict, total=False):
+    """State for support triage agent."""
+
+    ticket: str
+    customer_info: dict[str, Any]
+    use_llm_cache: bool
+    analysis: dict[str, Any]
+    classification: dict[str, Any]
+    kb_articles: list[dict[str, Any]]
+    suggested_response: str
+    routing: dict[str, Any]
+    iteration: int
+    status: str
+    success: bool
+
 
 class Priority(str, Enum):
     """Support ticket priority levels."""
@@ -63,89 +145,120 @@ class SupportTriageAgent(BaseAgent):
         super().__init__(config)
         self.settings = get_settings()
 
-        # Initialize LLM
-        self.llm = ChatOpenAI(
-            model=self.config.model_name,
-            temperature=0.3,  # Slight creativity for responses
-            openai_api_key=self.settings.openai_api_key,
-        )
+        # Initialize LLM (slight creativity for responses)
+        self.llm = get_chat_model(self.config.model_name, 0.3)
+
+        # JSON mode for structured nodes, so responses never arrive fenced or as prose
+        self.json_llm = self.llm.bind(response_format={"type": "json_object"})
+
+        self._analyze_chain = _ANALYZE_PROMPT | self.json_llm
+        self._response_chain = _RESPONSE_PROMPT | self.llm
 
         # Initialize tools
         self.search_tool = SearchDocumentsTool()
 
-        # Build the graph
-        self.graph = self._build_graph()
+        # Bind the shared compiled graph to this agent
+        self.graph = self._get_graph()
+
+    def _prepare_ticket(self, ticket: str) -> str:
+        """Trim an oversized ticket once, before it enters any prompt.
+
+        Args:
+            ticket: Support ticket content.
 
-    def _build_graph(self) -> StateGraph:
+        Returns:
+            Ticket content within the configured character budget.
+        """
+        max_chars = self.settings.max_ticket_chars
+        if len(ticket) > max_chars:
+            logger.info("Support ticket truncated", original_chars=len(ticket), max_chars=max_chars)
+        return truncate_middle(ticket, max_chars)
+
+    @classmethod
+    def _build_graph(cls) -> StateGraph:
         """Build the support triage workflow graph.
 
         Returns:
             Compiled state graph.
         """
-        workflow = StateGraph(dict)
+        workflow = StateGraph(SupportTriageState)
 
         # Add nodes
-        workflow.add_node("analyze_ticket", self._analyze_ticket_node)
-        workflow.add_node("classify_issue", self._classify_issue_node)
-        workflow.add_node("search_knowledge_base", self._search_kb_node)
-        workflow.add_node("generate_response", self._generate_response_node)
-        workflow.add_node("determine_routing", self._determine_routing_node)
-        workflow.add_node("finalize", self._finalize_node)
+        workflow.add_node("analyze_and_classify", agent_node(cls._analyze_and_classify_node))
+        workflow.add_node("search_knowledge_base", agent_node(cls._search_kb_node))
+        workflow.add_node("generate_response", agent_node(cls._generate_response_node))
+        workflow.add_node("determine_routing", agent_node(cls._determine_routing_node))
+        workflow.add_node("finalize", agent_node(cls._finalize_node))
 
         # Set entry point
-        workflow.set_entry_point("analyze_ticket")
+        workflow.set_entry_point("analyze_and_classify")
 
         # Add edges
-        workflow.add_edge("analyze_ticket", "classify_issue")
-        workflow.add_edge("classify_issue", "search_knowledge_base")
+        # Routing only needs the classification, so it runs alongside the
+        # knowledge base search and response generation
+        workflow.add_edge("analyze_and_classify", "search_knowledge_base")
+        workflow.add_edge("analyze_and_classify", "determine_routing")
         workflow.add_edge("search_knowledge_base", "generate_response")
-        workflow.add_edge("generate_response", "determine_routing")
-        workflow.add_edge("determine_routing", "finalize")
+        workflow.add_edge(["generate_response", "determine_routing"], "finalize")
         workflow.add_edge("finalize", END)
 
         return workflow.compile()
 
-    async def _analyze_ticket_node(self, state: dict) -> dict:
-        """Analyze the support ticket content."""
+    async def _analyze_and_classify_node(self, state: dict) -> dict:
+        """Analyze the support ticket and classify its type and priority."""
         ticket = state.get("ticket", "")
-        customer_info = state.get("customer_info", {})
-
-        logger.debug("Analyzing support ticket", ticket_preview=ticket[:100])
-
-        prompt = ChatPromptTemplate.from_template(
-            """Analyze this customer support ticket and extract key information.
-
-Customer Info: {customer_info}
+        # Compact, canonical JSON rather than a Python repr; also scopes the semantic cache
+        customer_info = orjson.dumps(
+            state.get("customer_info", {}), option=orjson.OPT_SORT_KEYS
+        ).decode()
+
+        logger.debug("Analyzing and classifying support ticket", ticket_preview=ticket[:100])
+
+        # Near-duplicate tickets (e.g. recurring password resets) reuse an earlier result.
+        # Only the ticket is embedded, so long customer info cannot dominate the match;
+        # results are scoped to the exact customer info through the cache namespace.
+        cache = None
+        embedding = None
+        if state.get("use_llm_cache", False):
+            cache = get_semantic_llm_cache(
+                f"support_triage.analyze_and_classify:{self.config.model_name}"
+                f":{fingerprint(customer_info)}"
+            )
+            try:
+                [embedding] = await get_vector_store().embed_queries([ticket])
+            except Exception as e:
+                logger.warning("Ticket embedding failed, bypassing LLM cache", error=str(e))
+                cache = None
+
+        if cache is not None:
+            cached = cache.get(embedding)
+            if cached is not None:
+                logger.debug("Ticket analysis served from cache")
+                return {
+                    "analysis": cached["analysis"],
+                    "classification": cached["classification"],
+                    "status": "classified",
+                    "iteration": 1,
+                }
 
-Ticket Content:
-{ticket}
+        async with self._llm_semaphore:
+            result = await self._analyze_chain.ainvoke({
+                "ticket": ticket,
+                "customer_info": customer_info,
+            })
 
-Provide analysis in JSON format:
-{{
-    "summary": "brief summary of the issue",
-    "customer_sentiment": "positive/neutral/negative/frustrated",
-    "urgency_indicators": ["list of phrases indicating urgency"],
-    "key_issues": ["list of main issues mentioned"],
-    "customer_expectations": "what the customer expects",
-    "language": "detected language"
-}}"""
-        )
+        parsed = parse_llm_json(result.content, fallback={})
+        if not isinstance(parsed, dict):
+            parsed = {}
 
-        result = await (prompt | self.llm).ainvoke({
-            "ticket": ticket,
-            "customer_info": str(customer_info),
-        })
+        analysis = parsed.get("analysis")
+        classification = parsed.get("classification")
 
-        import json
-        import re
+        # Only cache complete model results, never the fallbacks below
+        if cache is not None and isinstance(analysis, dict) and isinstance(classification, dict):
+            cache.put(embedding, {"analysis": analysis, "classification": classification})
 
-        try:
-            json_str = result.content.strip()
-            if json_str.startswith("```"):
-                json_str = re.sub(r"^```(?:json)?\n?", "", json_str)
-                json_str = re.sub(r"\n?```$", "", json_str)
-            analysis = json.loads(json_str)
-        except json.JSONDecodeError:
+        if not isinstance(analysis, dict):
             analysis = {
                 "summary": ticket[:200],
                 "customer_sentiment": "neutral",
@@ -155,61 +268,7 @@ Provide analysis in JSON format:
                 "language": "en",
             }
 
-        return {
-            **state,
-            "analysis": analysis,
-            "status": "analyzed",
-            "iteration": 1,
-        }
-
-    async def _classify_issue_node(self, state: dict) -> dict:
-        """Classify the issue type and priority."""
-        analysis = state.get("analysis", {})
-        ticket = state.get("ticket", "")
-
-        logger.debug("Classifying issue")
-
-        prompt = ChatPromptTemplate.from_template(
-            """Based on this support ticket analysis, classify the issue.
-
-Analysis: {analysis}
-
-Original Ticket:
-{ticket}
-
-Classify in JSON format:
-{{
-    "category": "technical|billing|account|feature_request|bug_report|general",
-    "priority": "critical|high|medium|low",
-    "priority_reason": "reason for priority level",
-    "subcategory": "more specific category",
-    "tags": ["relevant", "tags"],
-    "requires_escalation": true/false,
-    "escalation_reason": "reason if escalation needed"
-}}
-
-Priority Guidelines:
-- critical: System down, data loss, security breach
-- high: Major functionality broken, revenue impact
-- medium: Feature not working, workaround available
-- low: Questions, minor issues, feature requests"""
-        )
-
-        result = await (prompt | self.llm).ainvoke({
-            "analysis": str(analysis),
-            "ticket": ticket,
-        })
-
-        import json
-        import re
-
-        try:
-            json_str = result.content.strip()
-            if json_str.startswith("```"):
-                json_str = re.sub(r"^```(?:json)?\n?", "", json_str)
-                json_str = re.sub(r"\n?```$", "", json_str)
-            classification = json.loads(json_str)
-        except json.JSONDecodeError:
+        if not isinstance(classification, dict):
             classification = {
                 "category": "general",
                 "priority": "medium",
@@ -220,10 +279,10 @@ Priority Guidelines:
             }
 
         return {
-            **state,
+            "analysis": analysis,
             "classification": classification,
             "status": "classified",
-            "iteration": state.get("iteration", 0) + 1,
+            "iteration": 1,
         }
 
     async def _search_kb_node(self, state: dict) -> dict:
@@ -245,28 +304,35 @@ Priority Guidelines:
         if category:
             search_queries.append(f"{category} help guide")
 
+        # Run the searches concurrently, bounded across all runs of this agent;
+        # one failing search does not fail the rest
+        results = await asyncio.gather(
+            *(self._search(query) for query in search_queries[:3]),
+            return_exceptions=True,
+        )
+
         all_articles = []
-        for query in search_queries[:3]:
-            result = await self.search_tool.execute(query=query, top_k=3)
+        for result in results:
+            if isinstance(result, BaseException):
+                logger.warning("Knowledge base search failed", error=str(result))
+                continue
             if result.is_success:
                 all_articles.extend(result.data)
 
-        # Deduplicate
-        seen = set()
-        unique_articles = []
-        for article in all_articles:
-            content_key = article["content"][:100]
-            if content_key not in seen:
-                seen.add(content_key)
-                unique_articles.append(article)
+        # Deduplicate on the full content; KB boilerplate often shares long prefixes
+        unique_articles = unique_by_content(all_articles)
 
         return {
-            **state,
             "kb_articles": unique_articles[:5],
             "status": "kb_searched",
             "iteration": state.get("iteration", 0) + 1,
         }
 
+    async def _search(self, query: str) -> ToolResult:
+        """Search the knowledge base under the agent's search concurrency limit."""
+        async with self._search_semaphore:
+            return await self.search_tool.execute(query=query, top_k=3)
+
     async def _generate_response_node(self, state: dict) -> dict:
         """Generate a suggested response for the ticket."""
         analysis = state.get("analysis", {})
@@ -286,43 +352,19 @@ Priority Guidelines:
         else:
             kb_context = "No relevant articles found."
 
-        prompt = ChatPromptTemplate.from_template(
-            """Generate a professional support response for this ticket.
-
-Customer Ticket:
-{ticket}
-
-Issue Analysis:
-- Summary: {summary}
-- Category: {category}
-- Priority: {priority}
-- Customer Sentiment: {sentiment}
-
-Relevant Knowledge Base Articles:
-{kb_context}
-
-Generate a response that:
-1. Acknowledges the customer's issue
-2. Shows empathy if they're frustrated
-3. Provides a clear solution or next steps
-4. References relevant KB articles if helpful
-5. Maintains a professional but friendly tone
-
-Response:"""
-        )
-
-        result = await (prompt | self.llm).ainvoke({
-            "ticket": ticket,
-            "summary": analysis.get("summary", ""),
-            "category": classification.get("category", "general"),
-            "priority": classification.get("priority", "medium"),
-            "sentiment": analysis.get("customer_sentiment", "neutral"),
-            "kb_context": kb_context,
-        })
+        # Responses address the specific ticket, so only exact prompts are reused
+        async with self._llm_semaphore:
+            suggested_response = await ainvoke_content(self._response_chain, {
+                "ticket": ticket,
+                "summary": analysis.get("summary", ""),
+                "category": classification.get("category", "general"),
+                "priority": classification.get("priority", "medium"),
+                "sentiment": analysis.get("customer_sentiment", "neutral"),
+                "kb_context": kb_context,
+            }, use_cache=state.get("use_llm_cache", False))
 
         return {
-            **state,
-            "suggested_response": result.content,
+            "suggested_response": suggested_response,
             "status": "response_generated",
             "iteration": state.get("iteration", 0) + 1,
         }
@@ -369,29 +411,31 @@ Response:"""
             "tags": classification.get("tags", []),
         }
 
-        return {
-            **state,
-            "routing": routing,
-            "status": "routed",
-            "iteration": state.get("iteration", 0) + 1,
-        }
+        # Runs in parallel with the knowledge base search, which owns status and iteration
+        return {"routing": routing}
 
     async def _finalize_node(self, state: dict) -> dict:
         """Finalize the triage result."""
         logger.debug("Finalizing triage")
 
         return {
-            **state,
             "success": True,
             "status": "completed",
         }
 
-    async def run(self, ticket: str, customer_info: dict | None = None, **kwargs: Any) -> AgentResult:
+    async def run(
+        self,
+        ticket: str,
+        customer_info: dict | None = None,
+        cache: bool = False,
+        **kwargs: Any,
+    ) -> AgentResult:
         """Run the support triage agent.
 
         Args:
             ticket: Support ticket content.
             customer_info: Optional customer information.
+            cache: Reuse LLM results for near-duplicate tickets and repeated prompts.
             **kwargs: Additional arguments.
 
         Returns:
@@ -399,9 +443,10 @@ Response:"""
         """
         logger.info("Support triage agent started", ticket_preview=ticket[:50])
 
-        initial_state = {
-            "ticket": ticket,
+        initial_state: SupportTriageState = {
+            "ticket": self._prepare_ticket(ticket),
             "customer_info": customer_info or {},
+            "use_llm_cache": cache,
             "analysis": {},
             "classification": {},
             "kb_articles": [],
@@ -444,12 +489,19 @@ Response:"""
                 error=str(e),
             )
 
-    async def stream(self, ticket: str, customer_info: dict | None = None, **kwargs: Any) -> AsyncIterator[dict[str, Any]]:
+    async def stream(
+        self,
+        ticket: str,
+        customer_info: dict | None = None,
+        cache: bool = False,
+        **kwargs: Any,
+    ) -> AsyncIterator[dict[str, Any]]:
         """Stream support triage execution.
 
         Args:
             ticket: Support ticket content.
             customer_info: Optional customer information.
+            cache: Reuse LLM results for near-duplicate tickets and repeated prompts.
             **kwargs: Additional arguments.
 
         Yields:
@@ -457,9 +509,10 @@ Response:"""
         """
         logger.info("Support triage agent streaming", ticket_preview=ticket[:50])
 
-        initial_state = {
-            "ticket": ticket,
+        initial_state: SupportTriageState = {
+            "ticket": self._prepare_ticket(ticket),
             "customer_info": customer_info or {},
+            "use_llm_cache": cache,
             "analysis": {},
             "classification": {},
             "kb_articles": [],
@@ -470,16 +523,41 @@ Response:"""
             "success": False,
         }
 
-        async for event in self.graph.astream(initial_state):
-            for node_name, state in event.items():
-                yield {
-                    "event": node_name,
-                    "status": state.get("status", ""),
-                    "iteration": state.get("iteration", 0),
-                    "priority": state.get("classification", {}).get("priority"),
-                    "category": state.get("classification", {}).get("category"),
-                    "assigned_team": state.get("routing", {}).get("assigned_team"),
-                }
+        # Parallel nodes return only the keys they change, so keep a running summary
+        summary = {
+            "status": "started",
+            "iteration": 0,
+            "priority": None,
+            "category": None,
+            "assigned_team": None,
+        }
+
+        async for mode, payload in self.graph.astream(
+            initial_state,
+            stream_mode=["updates", "messages"],
+        ):
+            if mode == "messages":
+                # LLM tokens as they are generated, tagged with the emitting node
+                chunk, metadata = payload
+                if chunk.content:
+                    yield {
+                        "event": "token",
+                        "node": metadata.get("langgraph_node", ""),
+                        "content": chunk.content,
+                    }
+                continue
+
+            for node_name, update in payload.items():
+                if "status" in update:
+                    summary["status"] = update["status"]
+                if "iteration" in update:
+                    summary["iteration"] = update["iteration"]
+                if update.get("classification"):
+                    summary["priority"] = update["classification"].get("priority")
+                    summary["category"] = update["classification"].get("category")
+                if update.get("routing"):
+                    summary["assigned_team"] = update["routing"].get("assigned_team")
+                yield {"event": node_name, **summary}
 
 
 def create_support_triage_agent(
@@ -0,0 +1,121 @@
+"""Shared LLM clients for agents."""
+
+import hashlib
+from functools import lru_cache
+from typing import Any, Callable
+
+from langchain_core.runnables import RunnableSequence
+from langchain_openai import ChatOpenAI
+
+from src.core.cache import SemanticQueryCache, TTLCache
+from src.core.config import get_settings
+from src.core.http import add_close_listener, get_http_client
+from src.core.rate_limit import get_llm_rate_limiter
+
+
+@lru_cache(maxsize=8)
+def get_chat_model(model_name: str, temperature: float) -> ChatOpenAI:
+    """Get a shared chat model client.
+
+    Agents configured with the same model and temperature reuse one client,
+    and all clients share one HTTP connection pool and per-model rate limit.
+
+    Args:
+        model_name: LLM model to use.
+        temperature: Sampling temperature.
+
+    Returns:
+        Cached chat model client.
+    """
+    settings = get_settings()
+    return ChatOpenAI(
+        model=model_name,
+        temperature=temperature,
+        openai_api_key=settings.openai_api_key,
+        timeout=settings.llm_timeout_seconds,
+        max_retries=settings.llm_max_retries,
+        http_async_client=get_http_client(),
+        rate_limiter=get_llm_rate_limiter(model_name),
+    )
+
+
+# Models hold the shared HTTP client, so drop them when it is closed
+add_close_listener(get_chat_model.cache_clear)
+
+
+@lru_cache
+def get_llm_cache() -> TTLCache:
+    """Get the shared LLM response cache.
+
+    Returns:
+        Response content cache keyed by prompt fingerprint.
+    """
+    settings = get_settings()
+    return TTLCache(
+        max_entries=settings.llm_cache_max_entries,
+        ttl_seconds=settings.llm_cache_ttl_seconds,
+    )
+
+
+@lru_cache
+def get_semantic_llm_cache(name: str, threshold: float | None = None) -> SemanticQueryCache:
+    """Get a shared cache of LLM results keyed by the embedding of their input.
+
+    Each name gets its own cache, so results of different prompts or models
+    never match each other.
+
+    Args:
+        name: Cache namespace, typically the node and model name.
+        threshold: Minimum cosine similarity for a hit; defaults to the
+            configured LLM semantic cache threshold.
+
+    Returns:
+        Semantic cache for the namespace.
+    """
+    settings = get_settings()
+    return SemanticQueryCache(
+        dimension=settings.embedding_dimension,
+        threshold=threshold if threshold is not None else settings.llm_semantic_cache_threshold,
+        ttl_seconds=settings.llm_cache_ttl_seconds,
+        max_entries=settings.llm_cache_max_entries,
+    )
+
+
+async def ainvoke_content(
+    chain: RunnableSequence,
+    variables: dict[str, Any],
+    use_cache: bool = False,
+    cache_if: Callable[[str], bool] | None = None,
+) -> str:
+    """Invoke a ``prompt | llm`` chain and return the response content.
+
+    With ``use_cache``, a response is reused when the same rendered prompt
+    was already sent to the same model at the same temperature.
+
+    Args:
+        chain: Chain whose first step is a prompt template and last step an LLM.
+        variables: Prompt variables.
+        use_cache: Whether to serve and store the response via the cache.
+        cache_if: Optional check a response must pass to be stored, so that
+            unusable responses are retried instead of served from the cache.
+
+    Returns:
+        Response content.
+    """
+    if not use_cache:
+        return (await chain.ainvoke(variables)).content
+
+    llm = chain.last
+    rendered = chain.first.format(**variables)
+    fingerprint = (
+        f"{getattr(llm, 'model_name', '')}|{getattr(llm, 'temperature', '')}|{rendered}"
+    )
+    key = hashlib.blake2b(fingerprint.encode("utf-8"), digest_size=16).hexdigest()
+
+    cache = get_llm_cache()
+    content = cache.get(key)
+    if content is None:
+        content = (await chain.ainvoke(variables)).content
+        if cache_if is None or cache_if(content):
+            cache.put(key, content)
+    return content
@@ -4,6 +4,9 @@ The orchestrator routes requests to appropriate agents and can
 coordinate multi-agent workflows for complex tasks.
 """
 
+import asyncio
+import re
+from functools import lru_cache
 from typing import Any, AsyncIterator
 from enum import Enum
 
@@ -18,6 +21,8 @@ from src.agents.business.support_triage_agent import create_support_triage_agent
 from src.agents.business.report_agent import create_report_agent
 from src.core import get_logger
 from src.core.config import get_settings
+from src.core.http import add_close_listener, get_http_client
+from src.core.rate_limit import get_llm_rate_limiter
 
 logger = get_logger(__name__)
 
@@ -32,6 +37,60 @@ class AgentType(str, Enum):
     REPORT = "report"
 
 
+# Keyword patterns for requests whose intent is unambiguous without the router LLM.
+# Patterns only match a request that starts with an imperative or a ticket, so
+# questions that merely mention a task ("How do I parse ...?") are left to the router.
+_IMPERATIVE = r"^\s*(?:please\s+)?"
+
+_FAST_ROUTES: list[tuple[re.Pattern[str], str]] = [
+    (
+        re.compile(
+            _IMPERATIVE + r"(?:(customer\s+)?(support\s+)?(ticket|complaint)\b"
+            r"|(triage|classify|route|escalate|handle|investigate)\b.*\b(ticket|complaint)\b)",
+            re.I,
+        ),
+        AgentType.SUPPORT_TRIAGE.value,
+    ),
+    (
+        re.compile(
+            _IMPERATIVE + r"(generate|create|write|prepare|produce|draft)\b.*\breport\b",
+            re.I,
+        ),
+        AgentType.REPORT.value,
+    ),
+    (
+        re.compile(
+            _IMPERATIVE + r"(?:(extract|parse)\b.*\b(fields?|data|values|entities|records?)\b"
+            r"|fill (in|out)\b.*\bform\b)",
+            re.I,
+        ),
+        AgentType.DATA_ENTRY.value,
+    ),
+    (
+        re.compile(
+            _IMPERATIVE + r"(research|investigate"
+            r"|(conduct|do|perform) an? (in-depth analysis|literature review))\b",
+            re.I,
+        ),
+        AgentType.RESEARCH.value,
+    ),
+]
+
+
+@lru_cache(maxsize=2048)
+def _keyword_route(request: str) -> str | None:
+    """Route a request by keywords when exactly one agent's patterns match.
+
+    Args:
+        request: User request.
+
+    Returns:
+        Agent type string, or None if no or several agents match.
+    """
+    matches = [agent_type for pattern, agent_type in _FAST_ROUTES if pattern.search(request)]
+    return matches[0] if len(matches) == 1 else None
+
+
 class AgentOrchestrator:
     """Orchestrator for coordinating multiple agents.
 
@@ -46,16 +105,23 @@ class AgentOrchestrator:
         """Initialize the orchestrator.
 
         Args:
-            model_name: LLM model for routing decisions.
+            model_name: LLM model for routing decisions. Defaults to the
+                router_model setting.
         """
         self.settings = get_settings()
         self.model_name = model_name or self.settings.llm_model
+        self.router_model_name = model_name or self.settings.router_model
 
-        # Initialize routing LLM
+        # Initialize routing LLM; the answer is a single agent name, so cap the output
         self.router_llm = ChatOpenAI(
-            model=self.model_name,
+            model=self.router_model_name,
             temperature=0,
+            max_tokens=8,
             openai_api_key=self.settings.openai_api_key,
+            timeout=self.settings.llm_timeout_seconds,
+            max_retries=self.settings.llm_max_retries,
+            http_async_client=get_http_client(),
+            rate_limiter=get_llm_rate_limiter(self.router_model_name),
         )
 
         # Agent registry
@@ -86,6 +152,11 @@ class AgentOrchestrator:
 
         return self._agents[agent_type]
 
+    def prewarm_agents(self) -> None:
+        """Create every agent up front so no request pays the agent set-up cost."""
+        for agent_type in AgentType:
+            self._get_agent(agent_type.value)
+
     async def route_request(self, request: str) -> str:
         """Determine which agent should handle a request.
 
@@ -95,6 +166,15 @@ class AgentOrchestrator:
         Returns:
             Agent type string.
         """
+        agent_type = _keyword_route(request)
+        if agent_type is not None:
+            logger.info(
+                "Request routed by keywords",
+                agent_type=agent_type,
+                request_preview=request[:50],
+            )
+            return agent_type
+
         prompt = ChatPromptTemplate.from_template(
             """Analyze this request and determine which agent should handle it.
 
@@ -181,12 +261,43 @@ Respond with only the agent name (rag, research, data_entry, support_triage, or
                 metadata={"routed_to": agent_type},
             )
 
+    @staticmethod
+    def _group_workflow_steps(workflow: list[dict[str, Any]]) -> list[list[dict[str, Any]]]:
+        """Group consecutive workflow steps that can run concurrently.
+
+        A step joins the previous step's group when both use the same explicit
+        agent type, it does not use the previous result, and the previous step
+        does not stop the workflow on failure.
+
+        Args:
+            workflow: Workflow steps.
+
+        Returns:
+            Step groups in workflow order.
+        """
+        groups: list[list[dict[str, Any]]] = []
+        for step in workflow:
+            if groups:
+                last = groups[-1][-1]
+                if (
+                    step.get("agent_type")
+                    and step.get("agent_type") == last.get("agent_type")
+                    and not step.get("use_previous", False)
+                    and not last.get("stop_on_failure", False)
+                ):
+                    groups[-1].append(step)
+                    continue
+            groups.append([step])
+        return groups
+
     async def run_workflow(
         self,
         workflow: list[dict[str, Any]],
     ) -> list[AgentResult]:
         """Run a multi-agent workflow.
 
+        Consecutive independent steps for the same agent run concurrently.
+
         Args:
             workflow: List of workflow steps, each with:
                 - agent_type: Type of agent to use
@@ -199,39 +310,45 @@ Respond with only the agent name (rag, research, data_entry, support_triage, or
         """
         logger.info("Starting workflow", num_steps=len(workflow))
 
-        results = []
+        results: list[AgentResult] = []
         previous_result: AgentResult | None = None
 
-        for i, step in enumerate(workflow):
-            agent_type = step.get("agent_type")
-            request = step.get("request", "")
-            use_previous = step.get("use_previous", False)
-            kwargs = step.get("kwargs", {})
+        for group in self._group_workflow_steps(workflow):
+            first_step = len(results) + 1
+            requests = []
+            for step in group:
+                request = step.get("request", "")
 
-            # Incorporate previous result if requested
-            if use_previous and previous_result and previous_result.answer:
-                request = f"{request}\n\nContext from previous step:\n{previous_result.answer}"
+                # Incorporate previous result if requested (only a group's first step can)
+                if step.get("use_previous", False) and previous_result and previous_result.answer:
+                    request = f"{request}\n\nContext from previous step:\n{previous_result.answer}"
+                requests.append(request)
 
             logger.debug(
-                "Executing workflow step",
-                step=i + 1,
-                agent_type=agent_type,
-            )
-
-            result = await self.run(
-                request=request,
-                agent_type=agent_type,
-                **kwargs,
+                "Executing workflow steps",
+                first_step=first_step,
+                num_steps=len(group),
+                agent_type=group[0].get("agent_type"),
             )
 
-            result.metadata["workflow_step"] = i + 1
-            results.append(result)
-            previous_result = result
-
-            # Stop on failure if specified
-            if not result.success and step.get("stop_on_failure", False):
-                logger.warning("Workflow stopped due to failure", step=i + 1)
-                break
+            group_results = await asyncio.gather(*(
+                self.run(
+                    request=request,
+                    agent_type=step.get("agent_type"),
+                    **step.get("kwargs", {}),
+                )
+                for step, request in zip(group, requests)
+            ))
+
+            for i, (step, result) in enumerate(zip(group, group_results), start=first_step):
+                result.metadata["workflow_step"] = i
+                results.append(result)
+                previous_result = result
+
+                # Stop on failure if specified (always the last step of its group)
+                if not result.success and step.get("stop_on_failure", False):
+                    logger.warning("Workflow stopped due to failure", step=i)
+                    return results
 
         return results
 
@@ -319,3 +436,13 @@ def get_orchestrator() -> AgentOrchestrator:
     if _orchestrator is None:
         _orchestrator = AgentOrchestrator()
     return _orchestrator
+
+
+def _reset_orchestrator() -> None:
+    """Drop the global orchestrator so it is rebuilt on its next use."""
+    global _orchestrator
+    _orchestrator = None
+
+
+# The orchestrator and its agents hold LLM clients built on the shared HTTP client
+add_close_listener(_reset_orchestrator)
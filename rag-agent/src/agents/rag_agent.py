@@ -1,22 +1,39 @@
 """RAG Agent using LangGraph for autonomous document Q&A."""
 
+import asyncio
+from dataclasses import replace
+from functools import lru_cache
 from typing import Any, AsyncIterator, Literal
 
 from langchain_core.messages import AIMessage, HumanMessage, SystemMessage
 from langchain_core.prompts import ChatPromptTemplate
-from langchain_openai import ChatOpenAI
+from langgraph.constants import TAG_NOSTREAM
 from langgraph.graph import END, StateGraph
-
-from src.agents.base import ActionType, AgentConfig, AgentResult, AgentState, BaseAgent
+from structlog.contextvars import bound_contextvars
+
+from src.agents.base import (
+    ActionType,
+    AgentConfig,
+    AgentResult,
+    AgentState,
+    BaseAgent,
+    agent_node,
+)
+from src.agents.llm import get_chat_model, get_semantic_llm_cache
+from src.agents.utils import content_hash, fingerprint
 from src.core import get_logger
+from src.core.cache import SemanticQueryCache, TTLCache
 from src.core.config import get_settings
-from src.rag.retrieval.retriever import get_retriever
-from src.rag.chain import format_docs
+from src.rag.retrieval.cached_retriever import get_cached_retriever
+from src.rag.chain import format_docs, format_sources
+from src.rag.retrieval.vector_store import get_vector_store
 
 logger = get_logger(__name__)
 
 
 # Prompts for the RAG agent
+# Static instructions come first as the system message and per-request values
+# last, so repeated calls share a cacheable prompt prefix
 ROUTER_PROMPT = """You are a routing agent that decides the next action based on the current state.
 
 Given a question and any retrieved context, decide what to do next:
@@ -25,37 +42,78 @@ Given a question and any retrieved context, decide what to do next:
 - "refine": If the current answer needs improvement
 - "done": If we have a satisfactory answer
 
-Question: {question}
-Current Context: {context}
-Current Answer: {answer}
-Iteration: {iteration}
-
-What should be the next action? Respond with only one word: retrieve, generate, refine, or done."""
+Respond with only one word: retrieve, generate, refine, or done."""
 
 
 GENERATOR_PROMPT = """You are a helpful AI assistant. Use the provided context to answer the question accurately.
 If the context doesn't contain enough information, say so clearly.
 
-Context:
-{context}
-
-Question: {question}
-
-Provide a comprehensive and accurate answer:"""
+Provide a comprehensive and accurate answer."""
 
 
 REFINER_PROMPT = """You are an AI assistant that refines answers to make them more accurate and helpful.
 
-Original Question: {question}
-Context: {context}
-Current Answer: {answer}
-
-Please improve this answer by:
+Please improve the current answer by:
 1. Fixing any inaccuracies
 2. Adding relevant details from the context
 3. Making it more clear and concise
 
-Refined Answer:"""
+Respond with only the refined answer."""
+
+
+_ROUTER_TEMPLATE = ChatPromptTemplate.from_messages([
+    ("system", ROUTER_PROMPT),
+    ("human", """Question: {question}
+Current Context: {context}
+Current Answer: {answer}
+Iteration: {iteration}
+
+What should be the next action?"""),
+])
+
+_GENERATOR_TEMPLATE = ChatPromptTemplate.from_messages([
+    ("system", GENERATOR_PROMPT),
+    ("human", """Context:
+{context}
+
+Question: {question}"""),
+])
+
+_REFINER_TEMPLATE = ChatPromptTemplate.from_messages([
+    ("system", REFINER_PROMPT),
+    ("human", """Original Question: {question}
+Context: {context}
+Current Answer: {answer}"""),
+])
+
+# Graph node for each action the router can choose
+_ROUTE_TARGETS = {
+    ActionType.RETRIEVE.value: "retrieve",
+    ActionType.GENERATE.value: "generate",
+    ActionType.REFINE.value: "refine",
+    ActionType.DONE.value: END,
+    ActionType.ERROR.value: END,
+}
+_VALID_ACTIONS = frozenset(_ROUTE_TARGETS)
+
+
+@lru_cache
+def _get_answer_cache(namespace: str, threshold: float) -> SemanticQueryCache:
+    """Get the semantic answer cache for an agent configuration.
+
+    The cache is cleared whenever documents are added to or deleted from
+    the vector store, since cached answers depend on what was retrieved.
+
+    Args:
+        namespace: Cache namespace identifying the agent configuration.
+        threshold: Minimum cosine similarity for a hit.
+
+    Returns:
+        Semantic answer cache.
+    """
+    cache = get_semantic_llm_cache(namespace, threshold=threshold)
+    get_vector_store().add_change_listener(cache.clear)
+    return cache
 
 
 class RAGAgent(BaseAgent):
@@ -71,19 +129,31 @@ class RAGAgent(BaseAgent):
         self.settings = get_settings()
 
         # Initialize LLM
-        self.llm = ChatOpenAI(
-            model=self.config.model_name,
-            temperature=self.config.temperature,
-            openai_api_key=self.settings.openai_api_key,
-        )
+        self.llm = get_chat_model(self.config.model_name, self.config.temperature)
+        self._generator_chain = _GENERATOR_TEMPLATE | self.llm
+        self._refiner_chain = _REFINER_TEMPLATE | self.llm
+
+        # Routing decisions and speculative refines are internal, so their
+        # tokens are kept out of stream()
+        self._router_chain = (_ROUTER_TEMPLATE | self.llm).with_config(tags=[TAG_NOSTREAM])
+        self._speculative_refiner_chain = self._refiner_chain.with_config(tags=[TAG_NOSTREAM])
+
+        # Initialize retriever, sharing cached results with other agents
+        self.retriever = get_cached_retriever(self.config.retrieval_top_k)
 
-        # Initialize retriever
-        self.retriever = get_retriever(top_k=self.config.retrieval_top_k)
+        # Router decisions by (question, context, answer, iteration); short-lived,
+        # since they only need to cover repeated loops and concurrent sessions
+        self._router_cache = TTLCache(max_entries=4096, ttl_seconds=30)
 
-        # Build the graph
-        self.graph = self._build_graph()
+        # Refinements started alongside the router, and those it discarded
+        self._speculative_refines = 0
+        self._speculative_refines_wasted = 0
 
-    def _build_graph(self) -> StateGraph:
+        # Bind the shared compiled graph to this agent
+        self.graph = self._get_graph()
+
+    @classmethod
+    def _build_graph(cls) -> StateGraph:
         """Build the LangGraph workflow.
 
         Returns:
@@ -93,10 +163,10 @@ class RAGAgent(BaseAgent):
         workflow = StateGraph(AgentState)
 
         # Add nodes
-        workflow.add_node("retrieve", self._retrieve_node)
-        workflow.add_node("generate", self._generate_node)
-        workflow.add_node("refine", self._refine_node)
-        workflow.add_node("route", self._route_node)
+        workflow.add_node("retrieve", agent_node(cls._retrieve_node))
+        workflow.add_node("generate", agent_node(cls._generate_node))
+        workflow.add_node("refine", agent_node(cls._refine_node))
+        workflow.add_node("route", agent_node(cls._route_node))
 
         # Set entry point
         workflow.set_entry_point("route")
@@ -104,18 +174,22 @@ class RAGAgent(BaseAgent):
         # Add conditional edges from route
         workflow.add_conditional_edges(
             "route",
-            self._get_next_action,
+            agent_node(cls._get_next_action),
+            _ROUTE_TARGETS,
+        )
+
+        # Fresh context without an answer always leads to generation, so skip
+        # the routing step in between
+        workflow.add_conditional_edges(
+            "retrieve",
+            agent_node(cls._after_retrieve),
             {
-                ActionType.RETRIEVE.value: "retrieve",
                 ActionType.GENERATE.value: "generate",
-                ActionType.REFINE.value: "refine",
-                ActionType.DONE.value: END,
-                ActionType.ERROR.value: END,
+                "route": "route",
             },
         )
 
         # Add edges back to route after each action
-        workflow.add_edge("retrieve", "route")
         workflow.add_edge("generate", "route")
         workflow.add_edge("refine", "route")
 
@@ -132,24 +206,17 @@ class RAGAgent(BaseAgent):
         """
         question = state.get("question", "")
 
-        logger.debug("Retrieving documents", question_preview=question[:50])
+        logger.debug("Retrieving documents")
 
-        docs = await self.retriever._aget_relevant_documents(question)
+        async with self._search_semaphore:
+            docs = await self.retriever.aget(
+                question, query_embedding=state.get("query_embedding")
+            )
         context = format_docs(docs)
 
-        # Extract source information
-        sources = [
-            {
-                "content": doc.page_content[:200] + "...",
-                "metadata": doc.metadata,
-            }
-            for doc in docs
-        ]
-
         return {
-            **state,
             "context": context,
-            "sources": sources,
+            "sources": format_sources(docs),
             "iteration": state.get("iteration", 0) + 1,
         }
 
@@ -165,18 +232,15 @@ class RAGAgent(BaseAgent):
         question = state.get("question", "")
         context = state.get("context", "")
 
-        logger.debug("Generating answer", question_preview=question[:50])
+        logger.debug("Generating answer")
 
-        prompt = ChatPromptTemplate.from_template(GENERATOR_PROMPT)
-        chain = prompt | self.llm
-
-        result = await chain.ainvoke({
-            "question": question,
-            "context": context,
-        })
+        async with self._llm_semaphore:
+            result = await self._generator_chain.ainvoke({
+                "question": question,
+                "context": context,
+            })
 
         return {
-            **state,
             "answer": result.content,
             "iteration": state.get("iteration", 0) + 1,
         }
@@ -190,25 +254,34 @@ class RAGAgent(BaseAgent):
         Returns:
             Updated state with refined answer.
         """
-        question = state.get("question", "")
-        context = state.get("context", "")
-        answer = state.get("answer", "")
+        get = state.get
+        refine_count = get("refine_count", 0) + 1
+        iteration = get("iteration", 0) + 1
+
+        # The router may already have refined the answer while it was deciding
+        refined_answer = get("refined_answer", "")
+        if refined_answer:
+            logger.debug("Using speculatively refined answer")
+            return {
+                "answer": refined_answer,
+                "refined_answer": "",
+                "refine_count": refine_count,
+                "iteration": iteration,
+            }
 
         logger.debug("Refining answer")
 
-        prompt = ChatPromptTemplate.from_template(REFINER_PROMPT)
-        chain = prompt | self.llm
-
-        result = await chain.ainvoke({
-            "question": question,
-            "context": context,
-            "answer": answer,
-        })
+        async with self._llm_semaphore:
+            result = await self._refiner_chain.ainvoke({
+                "question": get("question", ""),
+                "context": get("context", ""),
+                "answer": get("answer", ""),
+            })
 
         return {
-            **state,
             "answer": result.content,
-            "iteration": state.get("iteration", 0) + 1,
+            "refine_count": refine_count,
+            "iteration": iteration,
         }
 
     async def _route_node(self, state: AgentState) -> AgentState:
@@ -220,45 +293,125 @@ class RAGAgent(BaseAgent):
         Returns:
             Updated state with next action.
         """
-        iteration = state.get("iteration", 0)
+        get = state.get
+        iteration = get("iteration", 0)
 
         # Check max iterations
         if iteration >= self.config.max_iterations:
             logger.warning("Max iterations reached", iteration=iteration)
-            return {**state, "next_action": ActionType.DONE.value}
+            return {"next_action": ActionType.DONE.value}
 
-        question = state.get("question", "")
-        context = state.get("context", "")
-        answer = state.get("answer", "")
+        question = get("question", "")
+        context = get("context", "")
+        answer = get("answer", "")
 
         # Simple routing logic
         if not context:
-            return {**state, "next_action": ActionType.RETRIEVE.value}
+            return {"next_action": ActionType.RETRIEVE.value}
 
         if not answer:
-            return {**state, "next_action": ActionType.GENERATE.value}
+            return {"next_action": ActionType.GENERATE.value}
+
+        # Nothing was retrieved, so neither refining nor retrieving again can help
+        if not get("sources"):
+            return {"next_action": ActionType.DONE.value}
+
+        # Each refine already sees the full retrieved context in one call, so
+        # further rounds over the same context add cost rather than detail
+        if get("refine_count", 0) >= self.config.max_refines:
+            return {"next_action": ActionType.DONE.value}
+
+        cache_key = (
+            content_hash(question),
+            content_hash(context[:500]),
+            content_hash(answer[:500]),
+            iteration,
+        )
+        action = self._router_cache.get(cache_key)
+        if action is not None:
+            logger.debug("Route decision served from cache", action=action, iteration=iteration)
+            return {"next_action": action}
+
+        # Refine speculatively while the router decides, hiding one round-trip
+        # when it picks "refine"; skipped when no iteration would be left for it
+        refine_task = None
+        if self.config.speculative_refine and iteration < self.config.max_iterations - 1:
+            refine_task = asyncio.create_task(self._speculative_refine({
+                "question": question,
+                "context": context,
+                "answer": answer,
+            }))
+            self._speculative_refines += 1
 
         # Use LLM to decide if we should refine or are done
-        prompt = ChatPromptTemplate.from_template(ROUTER_PROMPT)
-        chain = prompt | self.llm
-
-        result = await chain.ainvoke({
-            "question": question,
-            "context": context[:500],  # Truncate for routing
-            "answer": answer[:500],
-            "iteration": iteration,
-        })
+        try:
+            async with self._llm_semaphore:
+                result = await self._router_chain.ainvoke({
+                    "question": question,
+                    "context": context[:500],  # Truncate for routing
+                    "answer": answer[:500],
+                    "iteration": iteration,
+                })
+        except BaseException:
+            if refine_task is not None:
+                refine_task.cancel()
+            raise
 
         action = result.content.strip().lower()
 
         # Validate action
-        valid_actions = {a.value for a in ActionType}
-        if action not in valid_actions:
+        if action not in _VALID_ACTIONS:
             action = ActionType.DONE.value
 
         logger.debug("Route decision", action=action, iteration=iteration)
+        self._router_cache.put(cache_key, action)
+
+        update = {"next_action": action}
+        if refine_task is None:
+            return update
+
+        if action == ActionType.REFINE.value:
+            try:
+                update["refined_answer"] = (await refine_task).content
+            except Exception as e:
+                # The refine node retries without the speculative result
+                logger.warning("Speculative refine failed", error=str(e))
+        else:
+            refine_task.cancel()
+            self._speculative_refines_wasted += 1
+            logger.debug(
+                "Speculative refine discarded",
+                speculative_refines=self._speculative_refines,
+                wasted=self._speculative_refines_wasted,
+            )
 
-        return {**state, "next_action": action}
+        return update
+
+    async def _speculative_refine(self, variables: dict[str, Any]) -> AIMessage:
+        """Refine an answer ahead of the routing decision.
+
+        Args:
+            variables: Refiner prompt variables.
+
+        Returns:
+            Refined answer message.
+        """
+        async with self._llm_semaphore:
+            return await self._speculative_refiner_chain.ainvoke(variables)
+
+    def _after_retrieve(self, state: AgentState) -> str:
+        """Decide whether retrieval can go straight to generation.
+
+        Args:
+            state: Current agent state.
+
+        Returns:
+            "generate", or "route" when an answer exists or the iteration
+            budget is spent.
+        """
+        if state.get("answer") or state.get("iteration", 0) >= self.config.max_iterations:
+            return "route"
+        return ActionType.GENERATE.value
 
     def _get_next_action(self, state: AgentState) -> str:
         """Get the next action from state.
@@ -271,32 +424,62 @@ class RAGAgent(BaseAgent):
         """
         return state.get("next_action", ActionType.DONE.value)
 
-    async def run(self, question: str, **kwargs: Any) -> AgentResult:
+    async def run(self, question: str, cache: bool = False, **kwargs: Any) -> AgentResult:
         """Run the RAG agent on a question.
 
         Args:
             question: User question.
+            cache: Reuse the answer to a near-identical earlier question.
             **kwargs: Additional arguments.
 
         Returns:
             Agent result with answer and sources.
         """
-        logger.info("RAG agent started", question_preview=question[:50])
+        question_fp = fingerprint(question)
+        logger.info("RAG agent started", question_fp=question_fp, question_preview=question[:50])
+
+        # The answer depends only on the question and agent configuration, so a
+        # near-identical question can reuse a whole earlier run
+        answer_cache = None
+        embedding = None
+        if cache:
+            answer_cache = _get_answer_cache(
+                f"rag_agent.answer:{self.config.model_name}:{self.config.temperature}"
+                f":{self.config.retrieval_top_k}",
+                self.settings.answer_cache_threshold,
+            )
+            try:
+                [embedding] = await get_vector_store().embed_queries([question])
+            except Exception as e:
+                logger.warning("Question embedding failed, bypassing answer cache", error=str(e))
+                answer_cache = None
+
+        if answer_cache is not None:
+            cached = answer_cache.get(embedding)
+            if cached is not None:
+                logger.info("RAG answer served from cache", question_fp=question_fp)
+                return replace(
+                    cached,
+                    metadata={**cached.metadata, "question": question, "cache_hit": True},
+                )
 
         initial_state: AgentState = {
             "messages": [HumanMessage(content=question)],
             "question": question,
+            "query_embedding": embedding,
             "context": "",
             "answer": "",
             "sources": [],
             "next_action": "",
             "iteration": 0,
+            "refine_count": 0,
             "error": None,
         }
 
         try:
-            # Run the graph
-            final_state = await self.graph.ainvoke(initial_state)
+            # Node logs carry the fingerprint instead of repeating the question
+            with bound_contextvars(question_fp=question_fp):
+                final_state = await self.graph.ainvoke(initial_state)
 
             logger.info(
                 "RAG agent completed",
@@ -304,7 +487,7 @@ class RAGAgent(BaseAgent):
                 has_answer=bool(final_state.get("answer")),
             )
 
-            return AgentResult(
+            result = AgentResult(
                 answer=final_state.get("answer", ""),
                 sources=final_state.get("sources", []),
                 iterations=final_state.get("iteration", 0),
@@ -312,6 +495,12 @@ class RAGAgent(BaseAgent):
                 metadata={"question": question},
             )
 
+            # Answers without sources would outlive the documents that could answer them
+            if answer_cache is not None and result.answer and result.sources:
+                answer_cache.put(embedding, result)
+
+            return result
+
         except Exception as e:
             logger.error("RAG agent failed", error=str(e))
             return AgentResult(
@@ -332,7 +521,8 @@ class RAGAgent(BaseAgent):
         Yields:
             Intermediate states and events.
         """
-        logger.info("RAG agent streaming", question_preview=question[:50])
+        question_fp = fingerprint(question)
+        logger.info("RAG agent streaming", question_fp=question_fp, question_preview=question[:50])
 
         initial_state: AgentState = {
             "messages": [HumanMessage(content=question)],
@@ -342,27 +532,56 @@ class RAGAgent(BaseAgent):
             "sources": [],
             "next_action": "",
             "iteration": 0,
+            "refine_count": 0,
             "error": None,
         }
 
-        async for event in self.graph.astream(initial_state):
-            # Extract the node name and state
-            for node_name, state in event.items():
-                yield {
-                    "event": node_name,
-                    "iteration": state.get("iteration", 0),
-                    "has_context": bool(state.get("context")),
-                    "has_answer": bool(state.get("answer")),
-                    "next_action": state.get("next_action", ""),
-                }
-
-                # If we have an answer, also yield it
-                if state.get("answer"):
-                    yield {
-                        "event": "answer_update",
-                        "answer": state.get("answer"),
-                        "sources": state.get("sources", []),
-                    }
+        # Nodes return only the keys they change, so keep a running summary
+        summary = {
+            "iteration": 0,
+            "has_context": False,
+            "has_answer": False,
+            "next_action": "",
+        }
+        sources: list[dict[str, Any]] = []
+
+        # Node logs carry the fingerprint instead of repeating the question
+        with bound_contextvars(question_fp=question_fp):
+            async for mode, payload in self.graph.astream(
+                initial_state,
+                stream_mode=["updates", "messages"],
+            ):
+                if mode == "messages":
+                    # LLM tokens as they are generated, tagged with the emitting node
+                    chunk, metadata = payload
+                    if chunk.content:
+                        yield {
+                            "event": "token",
+                            "node": metadata.get("langgraph_node", ""),
+                            "content": chunk.content,
+                        }
+                    continue
+
+                for node_name, update in payload.items():
+                    if "iteration" in update:
+                        summary["iteration"] = update["iteration"]
+                    if "context" in update:
+                        summary["has_context"] = bool(update["context"])
+                    if "sources" in update:
+                        sources = update["sources"]
+                    if "next_action" in update:
+                        summary["next_action"] = update["next_action"]
+                    if update.get("answer"):
+                        summary["has_answer"] = True
+                    yield {"event": node_name, **summary}
+
+                    # Yield each new or refined answer
+                    if update.get("answer"):
+                        yield {
+                            "event": "answer_update",
+                            "answer": update["answer"],
+                            "sources": sources,
+                        }
 
 
 def create_rag_agent(
@@ -1,75 +1,129 @@
 """Research Agent using LangGraph for multi-step research tasks."""
 
-from typing import Any, AsyncIterator, Literal
-from dataclasses import dataclass
+import re
+from typing import Annotated, Any, AsyncIterator, TypedDict
 
-from langchain_core.messages import AIMessage, HumanMessage, SystemMessage
 from langchain_core.prompts import ChatPromptTemplate
-from langchain_core.tools import Tool
-from langchain_openai import ChatOpenAI
 from langgraph.graph import END, StateGraph
-from langgraph.prebuilt import ToolNode
+from langgraph.types import Send
+from structlog.contextvars import bound_contextvars
 
-from src.agents.base import AgentConfig, AgentResult, BaseAgent
+from src.agents.base import AgentConfig, AgentResult, BaseAgent, agent_node
+from src.agents.llm import get_chat_model
+from src.agents.utils import fingerprint
 from src.core import get_logger
 from src.core.config import get_settings
-from src.rag.retrieval.retriever import get_retriever
-from src.rag.chain import format_docs
+from src.rag.retrieval.cached_retriever import get_cached_retriever
+from src.rag.retrieval.vector_store import get_vector_store
+from src.rag.chain import format_docs, format_sources
 
 logger = get_logger(__name__)
 
 
-@dataclass
-class ResearchState:
+# Questions longer than this, or with more than one clause, always get a plan
+_TRIVIAL_QUESTION_MAX_CHARS = 80
+_COMPLEX_QUESTION_RE = re.compile(
+    r"\b(?:and|compare|contrast|analy[sz]e|vs|versus|explain why)\b",
+    re.IGNORECASE,
+)
+
+# Numbered ("1." / "1)") or bulleted ("-" / "*") plan lines
+_PLAN_RE = re.compile(r"^[ \t]*(?:\d+[.)]|[-*])[ \t]*(.+?)[ \t]*$", re.MULTILINE)
+
+
+def _parse_plan(plan_text: str) -> list[str]:
+    """Extract research steps from the planner's list output.
+
+    Args:
+        plan_text: Planner response.
+
+    Returns:
+        Plan steps without numbering or bullets.
+    """
+    return _PLAN_RE.findall(plan_text)
+
+
+def _is_trivial_question(question: str) -> bool:
+    """Check whether a question is a single lookup that needs no research plan.
+
+    Args:
+        question: Research question.
+
+    Returns:
+        True for short, single-clause questions.
+    """
+    question = question.strip()
+    return (
+        len(question) < _TRIVIAL_QUESTION_MAX_CHARS
+        and question.count("?") == 1
+        and _COMPLEX_QUESTION_RE.search(question) is None
+    )
+
+
+def _merge_findings(
+    current: list[dict[str, Any]],
+    update: list[dict[str, Any]],
+) -> list[dict[str, Any]]:
+    """Add findings written by parallel research branches, in plan order."""
+    return sorted(current + update, key=lambda finding: finding["step_index"])
+
+
+class ResearchState(TypedDict, total=False):
     """State for research agent."""
 
     question: str
     plan: list[str]
-    current_step: int
-    findings: list[dict[str, Any]]
+    plan_embeddings: list[list[float] | None]
+    findings: Annotated[list[dict[str, Any]], _merge_findings]
     synthesis: str
     iteration: int
     status: str  # "planning", "researching", "synthesizing", "done", "error"
-    error: str | None = None
+    error: str | None
 
 
 # Research agent prompts
+# Static instructions come first as the system message and per-request values
+# last, so repeated calls share a cacheable prompt prefix
 PLANNER_PROMPT = """You are a research planning agent. Given a research question, create a step-by-step plan.
 
-Research Question: {question}
-
 Create a plan with 3-5 specific research steps. Each step should be a focused query.
 Format your response as a numbered list:
 1. [First research step]
 2. [Second research step]
-...
-
-Plan:"""
+..."""
 
 
 RESEARCHER_PROMPT = """You are a research agent. Given the context from documents, extract key findings.
 
-Research Step: {step}
-Context:
-{context}
+Extract and summarize the key findings relevant to the research step.
+Be specific and cite relevant information from the context."""
 
-Extract and summarize the key findings relevant to this research step.
-Be specific and cite relevant information from the context.
 
-Findings:"""
+SYNTHESIZER_PROMPT = """You are a research synthesis agent. Combine research findings into a comprehensive answer.
 
+Synthesize the findings into a clear, comprehensive answer to the original question.
+Organize the information logically and highlight key insights."""
 
-SYNTHESIZER_PROMPT = """You are a research synthesis agent. Combine research findings into a comprehensive answer.
 
-Original Question: {question}
+_PLANNER_TEMPLATE = ChatPromptTemplate.from_messages([
+    ("system", PLANNER_PROMPT),
+    ("human", "Research Question: {question}"),
+])
 
-Research Findings:
-{findings}
+_RESEARCHER_TEMPLATE = ChatPromptTemplate.from_messages([
+    ("system", RESEARCHER_PROMPT),
+    ("human", """Research Step: {step}
+Context:
+{context}"""),
+])
 
-Synthesize these findings into a clear, comprehensive answer to the original question.
-Organize the information logically and highlight key insights.
+_SYNTHESIZER_TEMPLATE = ChatPromptTemplate.from_messages([
+    ("system", SYNTHESIZER_PROMPT),
+    ("human", """Original Question: {question}
 
-Synthesis:"""
+Research Findings:
+{findings}"""),
+])
 
 
 class ResearchAgent(BaseAgent):
@@ -85,45 +139,42 @@ class ResearchAgent(BaseAgent):
         self.settings = get_settings()
 
         # Initialize LLM
-        self.llm = ChatOpenAI(
-            model=self.config.model_name,
-            temperature=self.config.temperature,
-            openai_api_key=self.settings.openai_api_key,
-        )
+        self.llm = get_chat_model(self.config.model_name, self.config.temperature)
+        self._planner_chain = _PLANNER_TEMPLATE | self.llm
+        self._researcher_chain = _RESEARCHER_TEMPLATE | self.llm
+        self._synthesizer_chain = _SYNTHESIZER_TEMPLATE | self.llm
 
-        # Initialize retriever
-        self.retriever = get_retriever(top_k=self.config.retrieval_top_k)
+        # Initialize retriever, sharing cached results with other agents
+        self.retriever = get_cached_retriever(self.config.retrieval_top_k)
 
-        # Build the graph
-        self.graph = self._build_graph()
+        # Bind the shared compiled graph to this agent
+        self.graph = self._get_graph()
 
-    def _build_graph(self) -> StateGraph:
+    @classmethod
+    def _build_graph(cls) -> StateGraph:
         """Build the research workflow graph.
 
         Returns:
             Compiled state graph.
         """
-        # Create the graph with dict state type
-        workflow = StateGraph(dict)
+        workflow = StateGraph(ResearchState)
 
         # Add nodes
-        workflow.add_node("plan", self._plan_node)
-        workflow.add_node("research", self._research_node)
-        workflow.add_node("synthesize", self._synthesize_node)
+        workflow.add_node("plan", agent_node(cls._plan_node))
+        workflow.add_node("research", agent_node(cls._research_node))
+        workflow.add_node("synthesize", agent_node(cls._synthesize_node))
 
         # Set entry point
         workflow.set_entry_point("plan")
 
         # Add edges
-        workflow.add_edge("plan", "research")
+        # Plan steps are independent, so each one is researched in its own branch
         workflow.add_conditional_edges(
-            "research",
-            self._should_continue_research,
-            {
-                "continue": "research",
-                "synthesize": "synthesize",
-            },
+            "plan",
+            agent_node(cls._research_fanout_router),
+            ["research", "synthesize"],
         )
+        workflow.add_edge("research", "synthesize")
         workflow.add_edge("synthesize", END)
 
         return workflow.compile()
@@ -139,88 +190,93 @@ class ResearchAgent(BaseAgent):
         """
         question = state.get("question", "")
 
-        logger.debug("Creating research plan", question_preview=question[:50])
+        if _is_trivial_question(question):
+            # A single lookup is researched as-is without asking the planner
+            logger.debug("Skipping planner for simple question")
+            plan_steps = [question.strip()]
+        else:
+            logger.debug("Creating research plan")
 
-        prompt = ChatPromptTemplate.from_template(PLANNER_PROMPT)
-        chain = prompt | self.llm
+            async with self._llm_semaphore:
+                result = await self._planner_chain.ainvoke({"question": question})
+            plan_steps = _parse_plan(result.content)
 
-        result = await chain.ainvoke({"question": question})
-
-        # Parse the plan from the response
-        plan_text = result.content
-        plan_steps = []
+        logger.info("Research plan created", num_steps=len(plan_steps))
 
-        for line in plan_text.split("\n"):
-            line = line.strip()
-            if line and (line[0].isdigit() or line.startswith("-")):
-                # Remove numbering and bullet points
-                step = line.lstrip("0123456789.-) ").strip()
-                if step:
-                    plan_steps.append(step)
+        # Plan and synthesis each count as an iteration, research steps use the rest
+        max_steps = max(self.config.max_iterations - 2, 1)
+        if len(plan_steps) > max_steps:
+            logger.warning("Research plan exceeds max iterations, truncating", max_steps=max_steps)
+            plan_steps = plan_steps[:max_steps]
 
-        logger.info("Research plan created", num_steps=len(plan_steps))
+        # Embed every step in one request instead of one per research branch
+        plan_embeddings: list[list[float] | None] = [None] * len(plan_steps)
+        if plan_steps:
+            try:
+                plan_embeddings = await get_vector_store().embed_queries(plan_steps)
+            except Exception as e:
+                logger.warning("Plan embedding failed, embedding steps separately", error=str(e))
 
         return {
-            **state,
             "plan": plan_steps,
-            "current_step": 0,
-            "findings": [],
+            "plan_embeddings": plan_embeddings,
             "status": "researching",
             "iteration": state.get("iteration", 0) + 1,
         }
 
-    async def _research_node(self, state: dict) -> dict:
-        """Execute a research step.
+    def _research_fanout_router(self, state: dict) -> list[Send] | str:
+        """Fan out one research branch per plan step.
 
         Args:
             state: Current state.
 
         Returns:
-            Updated state with findings.
+            Research branches, or "synthesize" when the plan is empty.
         """
         plan = state.get("plan", [])
-        current_step = state.get("current_step", 0)
-        findings = state.get("findings", [])
+        if not plan:
+            return "synthesize"
+        embeddings = state.get("plan_embeddings") or [None] * len(plan)
+        return [
+            Send("research", {"index": i, "step": step, "query_embedding": embedding})
+            for i, (step, embedding) in enumerate(zip(plan, embeddings))
+        ]
+
+    async def _research_node(self, task: dict) -> dict:
+        """Execute a single research step.
 
-        if current_step >= len(plan):
-            return {**state, "status": "synthesizing"}
+        Args:
+            task: Plan step, its index in the plan and its precomputed embedding.
 
-        step = plan[current_step]
-        logger.debug("Researching step", step=step, index=current_step)
+        Returns:
+            State update adding the step's findings.
+        """
+        step = task["step"]
+        step_index = task["index"]
+        logger.debug("Researching step", step=step, index=step_index)
 
         # Retrieve documents for this step
-        docs = await self.retriever._aget_relevant_documents(step)
+        async with self._search_semaphore:
+            docs = await self.retriever.aget(step, query_embedding=task.get("query_embedding"))
         context = format_docs(docs)
 
         # Extract findings
-        prompt = ChatPromptTemplate.from_template(RESEARCHER_PROMPT)
-        chain = prompt | self.llm
-
-        result = await chain.ainvoke({
-            "step": step,
-            "context": context,
-        })
+        async with self._llm_semaphore:
+            result = await self._researcher_chain.ainvoke({
+                "step": step,
+                "context": context,
+            })
 
         # Add findings
         step_findings = {
             "step": step,
-            "step_index": current_step,
+            "step_index": step_index,
             "findings": result.content,
-            "sources": [
-                {
-                    "content": doc.page_content[:200] + "...",
-                    "metadata": doc.metadata,
-                }
-                for doc in docs
-            ],
+            "sources": format_sources(docs),
         }
 
-        return {
-            **state,
-            "current_step": current_step + 1,
-            "findings": findings + [step_findings],
-            "iteration": state.get("iteration", 0) + 1,
-        }
+        # Parallel branches only add findings; synthesis counts their iterations
+        return {"findings": [step_findings]}
 
     async def _synthesize_node(self, state: dict) -> dict:
         """Synthesize research findings.
@@ -237,48 +293,20 @@ class ResearchAgent(BaseAgent):
         logger.debug("Synthesizing findings", num_findings=len(findings))
 
         # Format findings for synthesis
-        findings_text = ""
-        for f in findings:
-            findings_text += f"\n## {f['step']}\n{f['findings']}\n"
-
-        prompt = ChatPromptTemplate.from_template(SYNTHESIZER_PROMPT)
-        chain = prompt | self.llm
+        findings_text = "".join(f"\n## {f['step']}\n{f['findings']}\n" for f in findings)
 
-        result = await chain.ainvoke({
-            "question": question,
-            "findings": findings_text,
-        })
+        async with self._llm_semaphore:
+            result = await self._synthesizer_chain.ainvoke({
+                "question": question,
+                "findings": findings_text,
+            })
 
         return {
-            **state,
             "synthesis": result.content,
             "status": "done",
-            "iteration": state.get("iteration", 0) + 1,
+            "iteration": state.get("iteration", 0) + len(findings) + 1,
         }
 
-    def _should_continue_research(self, state: dict) -> str:
-        """Decide whether to continue researching or synthesize.
-
-        Args:
-            state: Current state.
-
-        Returns:
-            "continue" or "synthesize".
-        """
-        plan = state.get("plan", [])
-        current_step = state.get("current_step", 0)
-        iteration = state.get("iteration", 0)
-
-        # Check if we've completed all steps or hit max iterations
-        if current_step >= len(plan):
-            return "synthesize"
-
-        if iteration >= self.config.max_iterations:
-            logger.warning("Max iterations reached, synthesizing")
-            return "synthesize"
-
-        return "continue"
-
     async def run(self, question: str, **kwargs: Any) -> AgentResult:
         """Run the research agent on a question.
 
@@ -289,12 +317,15 @@ class ResearchAgent(BaseAgent):
         Returns:
             Agent result with synthesis and findings.
         """
-        logger.info("Research agent started", question_preview=question[:50])
+        question_fp = fingerprint(question)
+        logger.info(
+            "Research agent started", question_fp=question_fp, question_preview=question[:50]
+        )
 
-        initial_state = {
+        initial_state: ResearchState = {
             "question": question,
             "plan": [],
-            "current_step": 0,
+            "plan_embeddings": [],
             "findings": [],
             "synthesis": "",
             "iteration": 0,
@@ -303,8 +334,12 @@ class ResearchAgent(BaseAgent):
         }
 
         try:
-            # Run the graph
-            final_state = await self.graph.ainvoke(initial_state)
+            # Node logs carry the fingerprint instead of repeating the question
+            with bound_contextvars(question_fp=question_fp):
+                final_state = await self.graph.ainvoke(
+                    initial_state,
+                    config={"max_concurrency": self.config.max_concurrent_llm},
+                )
 
             # Collect all sources from findings
             all_sources = []
@@ -349,12 +384,15 @@ class ResearchAgent(BaseAgent):
         Yields:
             Intermediate states and events.
         """
-        logger.info("Research agent streaming", question_preview=question[:50])
+        question_fp = fingerprint(question)
+        logger.info(
+            "Research agent streaming", question_fp=question_fp, question_preview=question[:50]
+        )
 
-        initial_state = {
+        initial_state: ResearchState = {
             "question": question,
             "plan": [],
-            "current_step": 0,
+            "plan_embeddings": [],
             "findings": [],
             "synthesis": "",
             "iteration": 0,
@@ -362,38 +400,66 @@ class ResearchAgent(BaseAgent):
             "error": None,
         }
 
-        async for event in self.graph.astream(initial_state):
-            for node_name, state in event.items():
-                yield {
-                    "event": node_name,
-                    "status": state.get("status", ""),
-                    "iteration": state.get("iteration", 0),
-                    "current_step": state.get("current_step", 0),
-                    "total_steps": len(state.get("plan", [])),
-                    "num_findings": len(state.get("findings", [])),
-                }
-
-                # Yield plan when created
-                if node_name == "plan" and state.get("plan"):
-                    yield {
-                        "event": "plan_created",
-                        "plan": state.get("plan", []),
-                    }
-
-                # Yield findings as they're collected
-                if node_name == "research" and state.get("findings"):
-                    latest_finding = state.get("findings", [])[-1]
-                    yield {
-                        "event": "finding_added",
-                        "finding": latest_finding,
-                    }
-
-                # Yield synthesis when complete
-                if node_name == "synthesize" and state.get("synthesis"):
-                    yield {
-                        "event": "synthesis_complete",
-                        "synthesis": state.get("synthesis"),
-                    }
+        # Parallel nodes return only the keys they change, so keep a running summary
+        summary = {
+            "status": "planning",
+            "iteration": 0,
+            "current_step": 0,
+            "total_steps": 0,
+            "num_findings": 0,
+        }
+
+        # Node logs carry the fingerprint instead of repeating the question
+        with bound_contextvars(question_fp=question_fp):
+            async for mode, payload in self.graph.astream(
+                initial_state,
+                config={"max_concurrency": self.config.max_concurrent_llm},
+                stream_mode=["updates", "messages"],
+            ):
+                if mode == "messages":
+                    # LLM tokens as they are generated, tagged with the emitting node
+                    chunk, metadata = payload
+                    if chunk.content:
+                        yield {
+                            "event": "token",
+                            "node": metadata.get("langgraph_node", ""),
+                            "content": chunk.content,
+                        }
+                    continue
+
+                for node_name, update in payload.items():
+                    if "status" in update:
+                        summary["status"] = update["status"]
+                    if "iteration" in update:
+                        summary["iteration"] = update["iteration"]
+                    if "plan" in update:
+                        summary["total_steps"] = len(update["plan"])
+                    if node_name == "research":
+                        # Steps finish in any order; count how many are done
+                        summary["current_step"] += 1
+                        summary["num_findings"] += len(update["findings"])
+                    yield {"event": node_name, **summary}
+
+                    # Yield plan when created
+                    if node_name == "plan" and update.get("plan"):
+                        yield {
+                            "event": "plan_created",
+                            "plan": update["plan"],
+                        }
+
+                    # Yield findings as each research step completes
+                    if node_name == "research":
+                        yield {
+                            "event": "finding_added",
+                            "finding": update["findings"][-1],
+                        }
+
+                    # Yield synthesis when complete
+                    if node_name == "synthesize" and update.get("synthesis"):
+                        yield {
+                            "event": "synthesis_complete",
+                            "synthesis": update["synthesis"],
+                        }
 
 
 def create_research_agent(
@@ -1,5 +1,6 @@
 """Base tool definitions for agents."""
 
+import inspect
 from abc import ABC, abstractmethod
 from dataclasses import dataclass, field
 from enum import Enum
@@ -147,6 +148,7 @@ class FunctionTool(BaseTool):
         self.func = func
         self.name = name
         self.description = description
+        self._is_coroutine = inspect.iscoroutinefunction(func)
         super().__init__()
 
     async def execute(self, **kwargs: Any) -> ToolResult:
@@ -158,11 +160,8 @@ class FunctionTool(BaseTool):
         Returns:
             ToolResult with function output.
         """
-        import asyncio
-        import inspect
-
         try:
-            if asyncio.iscoroutinefunction(self.func):
+            if self._is_coroutine:
                 result = await self.func(**kwargs)
             else:
                 result = self.func(**kwargs)
@@ -179,6 +178,8 @@ class ToolRegistry:
     def __init__(self) -> None:
         """Initialize the tool registry."""
         self._tools: dict[str, BaseTool] = {}
+        # Tool schemas are static, so they are built once until tools change
+        self._schema_cache: list[dict[str, Any]] | None = None
 
     def register(self, tool: BaseTool) -> None:
         """Register a tool.
@@ -187,6 +188,7 @@ class ToolRegistry:
             tool: Tool to register.
         """
         self._tools[tool.name] = tool
+        self._schema_cache = None
         logger.debug(f"Registered tool: {tool.name}")
 
     def unregister(self, name: str) -> bool:
@@ -200,6 +202,7 @@ class ToolRegistry:
         """
         if name in self._tools:
             del self._tools[name]
+            self._schema_cache = None
             return True
         return False
 
@@ -220,7 +223,9 @@ class ToolRegistry:
         Returns:
             List of tool schemas.
         """
-        return [tool.get_schema() for tool in self._tools.values()]
+        if self._schema_cache is None:
+            self._schema_cache = [tool.get_schema() for tool in self._tools.values()]
+        return list(self._schema_cache)
 
     def get_all(self) -> list[BaseTool]:
         """Get all registered tools.
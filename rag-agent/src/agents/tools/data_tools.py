@@ -1,16 +1,130 @@
 """Data processing tools for agents."""
 
-import json
+import asyncio
+import csv
+import io
+import itertools
 import re
-from typing import Any
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Any, Callable
 
+import orjson
+from langchain_core.prompts import ChatPromptTemplate
+from langchain_core.runnables import RunnableSequence
+
+from src.agents.llm import ainvoke_content, get_chat_model
 from src.agents.tools.base import BaseTool, ToolResult
+from src.agents.utils import parse_llm_json
 from src.core import get_logger
-from src.core.config import get_settings
+from src.core.http import add_close_listener
 
 logger = get_logger(__name__)
 
 
+_SCHEMA_EXTRACTION_PROMPT = ChatPromptTemplate.from_template(
+    """Extract data from the following text according to this schema:
+{schema}
+
+Text:
+{text}
+
+Return the extracted data as valid JSON matching the schema.
+If a field cannot be found, use null.
+
+Extracted JSON:"""
+)
+
+# Auto-detect fields to extract
+_AUTO_EXTRACTION_PROMPT = ChatPromptTemplate.from_template(
+    """Extract all structured data from the following text.
+Look for: names, dates, amounts, addresses, phone numbers, emails,
+and any other identifiable data points.
+
+Text:
+{text}
+
+Return the extracted data as valid JSON.
+
+Extracted JSON:"""
+)
+
+
+# Several texts per request; the instructions and schema are sent once
+_SCHEMA_BATCH_EXTRACTION_PROMPT = ChatPromptTemplate.from_template(
+    """Extract data from each of the following {count} texts according to this schema:
+{schema}
+
+{texts}
+
+Return a JSON array with exactly {count} objects, where item i holds the data
+extracted from text i and matches the schema.
+If a field cannot be found in a text, use null.
+
+Extracted JSON array:"""
+)
+
+_AUTO_BATCH_EXTRACTION_PROMPT = ChatPromptTemplate.from_template(
+    """Extract all structured data from each of the following {count} texts.
+Look for: names, dates, amounts, addresses, phone numbers, emails,
+and any other identifiable data points.
+
+{texts}
+
+Return a JSON array with exactly {count} objects, where item i holds the data
+extracted from text i.
+
+Extracted JSON array:"""
+)
+
+
+@lru_cache(maxsize=4)
+def _get_extraction_chain(with_schema: bool, batched: bool = False) -> RunnableSequence:
+    """Get the shared extraction chain, built on first use.
+
+    Args:
+        with_schema: Whether the chain extracts according to a schema.
+        batched: Whether the chain extracts from several texts at once.
+
+    Returns:
+        ``prompt | llm`` chain.
+    """
+    if batched:
+        prompt = _SCHEMA_BATCH_EXTRACTION_PROMPT if with_schema else _AUTO_BATCH_EXTRACTION_PROMPT
+    else:
+        prompt = _SCHEMA_EXTRACTION_PROMPT if with_schema else _AUTO_EXTRACTION_PROMPT
+    return prompt | get_chat_model("gpt-4o-mini", 0.0)
+
+
+# Chains hold a model built on the shared HTTP client, so drop them when it is closed
+add_close_listener(_get_extraction_chain.cache_clear)
+
+
+def _serialize_extraction_schema(extraction_schema: dict[str, Any] | str) -> str:
+    """Serialize an extraction schema for the prompt unless it already is."""
+    if isinstance(extraction_schema, str):
+        return extraction_schema
+    return orjson.dumps(extraction_schema, option=orjson.OPT_INDENT_2).decode()
+
+
+def _is_json_response(content: str, count: int | None = None) -> bool:
+    """Check that an extraction response parses, as an array of ``count`` items if given.
+
+    Only such responses are cached, so a garbled completion is retried on the
+    next request instead of being served for the cache's lifetime.
+    """
+    parsed = parse_llm_json(content, fallback=None)
+    if count is None:
+        return parsed is not None
+    return isinstance(parsed, list) and len(parsed) == count
+
+
+@lru_cache(maxsize=256)
+def _compile_pattern(pattern: str) -> re.Pattern[str]:
+    """Compile a caller-supplied validation pattern once and reuse it."""
+    return re.compile(pattern)
+
+
 class ExtractDataTool(BaseTool):
     """Extract structured data from unstructured text."""
 
@@ -21,76 +135,40 @@ class ExtractDataTool(BaseTool):
     async def execute(
         self,
         text: str,
-        extraction_schema: dict[str, Any] | None = None,
+        extraction_schema: dict[str, Any] | str | None = None,
+        use_cache: bool = False,
         **kwargs: Any,
     ) -> ToolResult:
         """Extract data from text.
 
+        Extraction runs at temperature 0, so with ``use_cache`` a response is
+        reused when the same text and schema were already extracted.
+
         Args:
             text: Text to extract data from.
-            extraction_schema: Optional schema defining what to extract.
+            extraction_schema: Optional schema defining what to extract, either
+                as a dict or already serialized to JSON.
+            use_cache: Whether to reuse cached LLM responses.
 
         Returns:
             ToolResult with extracted data.
         """
         try:
-            from langchain_openai import ChatOpenAI
-            from langchain_core.prompts import ChatPromptTemplate
-
-            settings = get_settings()
-
-            llm = ChatOpenAI(
-                model="gpt-4o-mini",
-                temperature=0,
-                openai_api_key=settings.openai_api_key,
-            )
-
             if extraction_schema:
-                schema_str = json.dumps(extraction_schema, indent=2)
-                prompt = ChatPromptTemplate.from_template(
-                    """Extract data from the following text according to this schema:
-{schema}
-
-Text:
-{text}
-
-Return the extracted data as valid JSON matching the schema.
-If a field cannot be found, use null.
-
-Extracted JSON:"""
-                )
-                result = await (prompt | llm).ainvoke({
-                    "schema": schema_str,
+                content = await ainvoke_content(_get_extraction_chain(True), {
+                    "schema": _serialize_extraction_schema(extraction_schema),
                     "text": text,
-                })
+                }, use_cache=use_cache, cache_if=_is_json_response)
             else:
-                # Auto-detect fields to extract
-                prompt = ChatPromptTemplate.from_template(
-                    """Extract all structured data from the following text.
-Look for: names, dates, amounts, addresses, phone numbers, emails,
-and any other identifiable data points.
-
-Text:
-{text}
-
-Return the extracted data as valid JSON.
-
-Extracted JSON:"""
+                content = await ainvoke_content(
+                    _get_extraction_chain(False),
+                    {"text": text},
+                    use_cache=use_cache,
+                    cache_if=_is_json_response,
                 )
-                result = await (prompt | llm).ainvoke({"text": text})
-
-            # Parse the JSON response
-            try:
-                # Clean the response
-                json_str = result.content.strip()
-                if json_str.startswith("```"):
-                    json_str = re.sub(r"^```(?:json)?\n?", "", json_str)
-                    json_str = re.sub(r"\n?```$", "", json_str)
 
-                extracted_data = json.loads(json_str)
-            except json.JSONDecodeError:
-                # If JSON parsing fails, return raw text
-                extracted_data = {"raw_extraction": result.content}
+            # Parse the JSON response; if parsing fails, return raw text
+            extracted_data = parse_llm_json(content, fallback={"raw_extraction": content})
 
             return ToolResult.success(
                 extracted_data,
@@ -101,6 +179,92 @@ Extracted JSON:"""
             logger.error("Data extraction failed", error=str(e))
             return ToolResult.error(f"Extraction failed: {str(e)}")
 
+    async def execute_many(
+        self,
+        texts: list[str],
+        extraction_schema: dict[str, Any] | str | None = None,
+        batch_size: int = 8,
+        use_cache: bool = False,
+        max_concurrency: int = 4,
+    ) -> list[ToolResult]:
+        """Extract data from several texts, sending each batch in one LLM request.
+
+        Batching shares the instructions and schema across texts instead of
+        repeating them per request. Up to ``max_concurrency`` batches run
+        concurrently. A batch whose response does not hold one item per text
+        is extracted text by text.
+
+        Args:
+            texts: Texts to extract data from.
+            extraction_schema: Optional schema defining what to extract, either
+                as a dict or already serialized to JSON.
+            batch_size: Maximum number of texts per request.
+            use_cache: Whether to reuse cached LLM responses.
+            max_concurrency: Maximum number of batches extracted at once.
+
+        Returns:
+            One ToolResult per text, in input order.
+        """
+        batch_size = max(1, batch_size)
+        batches = [texts[i:i + batch_size] for i in range(0, len(texts), batch_size)]
+        semaphore = asyncio.Semaphore(max(1, max_concurrency))
+
+        async def run_batch(batch: list[str]) -> list[ToolResult]:
+            async with semaphore:
+                return await self._execute_batch(batch, extraction_schema, use_cache)
+
+        results = await asyncio.gather(*(run_batch(batch) for batch in batches))
+        return [result for batch_results in results for result in batch_results]
+
+    async def _execute_batch(
+        self,
+        texts: list[str],
+        extraction_schema: dict[str, Any] | str | None,
+        use_cache: bool,
+    ) -> list[ToolResult]:
+        """Extract data from one batch of texts with a single LLM request."""
+        if len(texts) == 1:
+            return [await self.execute(texts[0], extraction_schema, use_cache=use_cache)]
+
+        variables = {
+            "count": len(texts),
+            "texts": "\n\n".join(
+                f"Text {i}:\n{text}" for i, text in enumerate(texts, 1)
+            ),
+        }
+        if extraction_schema:
+            variables["schema"] = _serialize_extraction_schema(extraction_schema)
+
+        try:
+            content = await ainvoke_content(
+                _get_extraction_chain(bool(extraction_schema), batched=True),
+                variables,
+                use_cache=use_cache,
+                cache_if=lambda content: _is_json_response(content, len(texts)),
+            )
+        except Exception as e:
+            logger.error("Batch data extraction failed", error=str(e), batch_size=len(texts))
+            return [ToolResult.error(f"Extraction failed: {str(e)}") for _ in texts]
+
+        items = parse_llm_json(content, fallback=None)
+        if not isinstance(items, list) or len(items) != len(texts):
+            logger.warning(
+                "Batch extraction did not return one item per text, extracting separately",
+                batch_size=len(texts),
+            )
+            return list(await asyncio.gather(
+                *(self.execute(text, extraction_schema, use_cache=use_cache) for text in texts)
+            ))
+
+        return [
+            ToolResult.success(
+                item if isinstance(item, dict) else {"raw_extraction": item},
+                text_length=len(text),
+                batch_size=len(texts),
+            )
+            for text, item in zip(texts, items)
+        ]
+
     def get_schema(self) -> dict[str, Any]:
         """Get the tool schema."""
         return {
@@ -123,6 +287,30 @@ Extracted JSON:"""
         }
 
 
+# Marks a rule option that was not given
+_UNSET: Any = object()
+
+
+@dataclass(frozen=True, slots=True)
+class _FieldCheck:
+    """Validation checks for one field, resolved from its rule."""
+
+    field: str
+    required: bool
+    type_name: str | None
+    python_type: type | tuple[type, ...] | None
+    pattern: re.Pattern[str] | None
+    min: Any
+    max: Any
+    enum: Any
+
+
+@lru_cache(maxsize=128)
+def _get_cached_field_checks(rules_json: bytes) -> tuple[_FieldCheck, ...]:
+    """Build field checks for a ruleset serialized to JSON."""
+    return ValidateDataTool._build_field_checks(orjson.loads(rules_json))
+
+
 class ValidateDataTool(BaseTool):
     """Validate data against rules or schema."""
 
@@ -138,6 +326,61 @@ class ValidateDataTool(BaseTool):
         "url": r"^https?://[^\s]+$",
         "number": r"^-?\d+\.?\d*$",
     }
+    _COMPILED_PATTERNS = {name: re.compile(pattern) for name, pattern in PATTERNS.items()}
+
+    _TYPE_MAP: dict[str, type | tuple[type, ...]] = {
+        "string": str,
+        "number": (int, float),
+        "integer": int,
+        "boolean": bool,
+        "array": list,
+        "object": dict,
+    }
+
+    @classmethod
+    def _build_field_checks(cls, rules: dict[str, Any]) -> tuple["_FieldCheck", ...]:
+        """Resolve validation rules into per-field checks.
+
+        Args:
+            rules: Validation rules by field.
+
+        Returns:
+            One check per field, with types resolved and patterns compiled.
+        """
+        checks = []
+        for field, rule in rules.items():
+            pattern = rule.get("pattern")
+            compiled = None
+            if pattern:
+                compiled = cls._COMPILED_PATTERNS.get(pattern) or _compile_pattern(pattern)
+            type_name = rule.get("type")
+            checks.append(_FieldCheck(
+                field=field,
+                required=rule.get("required", False),
+                type_name=type_name,
+                python_type=cls._TYPE_MAP.get(type_name) if type_name else None,
+                pattern=compiled,
+                min=rule.get("min", _UNSET),
+                max=rule.get("max", _UNSET),
+                enum=rule.get("enum", _UNSET),
+            ))
+        return tuple(checks)
+
+    def _get_field_checks(self, rules: dict[str, Any]) -> tuple["_FieldCheck", ...]:
+        """Get the checks for a ruleset, reusing them for repeated rulesets.
+
+        Args:
+            rules: Validation rules by field.
+
+        Returns:
+            Per-field checks.
+        """
+        try:
+            rules_json = orjson.dumps(rules)
+        except TypeError:
+            # Rules that are not plain JSON cannot be keyed, so build them directly
+            return self._build_field_checks(rules)
+        return _get_cached_field_checks(rules_json)
 
     async def execute(
         self,
@@ -158,82 +401,66 @@ class ValidateDataTool(BaseTool):
             errors: list[dict[str, str]] = []
             warnings: list[dict[str, str]] = []
 
-            if rules:
-                for field, rule in rules.items():
-                    value = data.get(field)
+            for check in self._get_field_checks(rules) if rules else ():
+                field = check.field
+                value = data.get(field)
 
-                    # Required check
-                    if rule.get("required", False) and value is None:
+                # Required check
+                if value is None:
+                    if check.required:
                         errors.append({
                             "field": field,
                             "error": "Required field is missing",
                         })
-                        continue
-
-                    if value is None:
-                        continue
-
-                    # Type check
-                    expected_type = rule.get("type")
-                    if expected_type:
-                        type_map = {
-                            "string": str,
-                            "number": (int, float),
-                            "integer": int,
-                            "boolean": bool,
-                            "array": list,
-                            "object": dict,
-                        }
-                        if expected_type in type_map:
-                            if not isinstance(value, type_map[expected_type]):
-                                errors.append({
-                                    "field": field,
-                                    "error": f"Expected {expected_type}, got {type(value).__name__}",
-                                })
-
-                    # Pattern check
-                    pattern = rule.get("pattern")
-                    if pattern and isinstance(value, str):
-                        if pattern in self.PATTERNS:
-                            pattern = self.PATTERNS[pattern]
-                        if not re.match(pattern, value):
-                            errors.append({
-                                "field": field,
-                                "error": f"Value does not match pattern: {pattern}",
-                            })
-
-                    # Min/max checks
-                    if "min" in rule:
-                        if isinstance(value, (int, float)) and value < rule["min"]:
-                            errors.append({
-                                "field": field,
-                                "error": f"Value {value} is less than minimum {rule['min']}",
-                            })
-                        elif isinstance(value, str) and len(value) < rule["min"]:
-                            errors.append({
-                                "field": field,
-                                "error": f"Length {len(value)} is less than minimum {rule['min']}",
-                            })
-
-                    if "max" in rule:
-                        if isinstance(value, (int, float)) and value > rule["max"]:
-                            errors.append({
-                                "field": field,
-                                "error": f"Value {value} is greater than maximum {rule['max']}",
-                            })
-                        elif isinstance(value, str) and len(value) > rule["max"]:
-                            errors.append({
-                                "field": field,
-                                "error": f"Length {len(value)} is greater than maximum {rule['max']}",
-                            })
-
-                    # Enum check
-                    if "enum" in rule and value not in rule["enum"]:
+                    continue
+
+                # Type check
+                if check.python_type is not None and not isinstance(value, check.python_type):
+                    errors.append({
+                        "field": field,
+                        "error": f"Expected {check.type_name}, got {type(value).__name__}",
+                    })
+
+                # Pattern check
+                if check.pattern is not None and isinstance(value, str):
+                    if not check.pattern.match(value):
+                        errors.append({
+                            "field": field,
+                            "error": f"Value does not match pattern: {check.pattern.pattern}",
+                        })
+
+                # Min/max checks
+                if check.min is not _UNSET:
+                    if isinstance(value, (int, float)) and value < check.min:
+                        errors.append({
+                            "field": field,
+                            "error": f"Value {value} is less than minimum {check.min}",
+                        })
+                    elif isinstance(value, str) and len(value) < check.min:
+                        errors.append({
+                            "field": field,
+                            "error": f"Length {len(value)} is less than minimum {check.min}",
+                        })
+
+                if check.max is not _UNSET:
+                    if isinstance(value, (int, float)) and value > check.max:
+                        errors.append({
+                            "field": field,
+                            "error": f"Value {value} is greater than maximum {check.max}",
+                        })
+                    elif isinstance(value, str) and len(value) > check.max:
                         errors.append({
                             "field": field,
-                            "error": f"Value must be one of: {rule['enum']}",
+                            "error": f"Length {len(value)} is greater than maximum {check.max}",
                         })
 
+                # Enum check
+                if check.enum is not _UNSET and value not in check.enum:
+                    errors.append({
+                        "field": field,
+                        "error": f"Value must be one of: {check.enum}",
+                    })
+
             is_valid = len(errors) == 0
 
             return ToolResult.success(
@@ -271,6 +498,77 @@ class ValidateDataTool(BaseTool):
         }
 
 
+def _as_str(value: Any) -> str:
+    """Convert a value to text, skipping the str() call for values that already are."""
+    return value if type(value) is str else str(value)
+
+
+_CONVERTERS: dict[str, Callable[[Any], Any]] = {
+    "string": str,
+    "integer": int,
+    "float": float,
+    "boolean": bool,
+}
+
+_FORMATTERS: dict[str, Callable[[str], str]] = {
+    "uppercase": str.upper,
+    "lowercase": str.lower,
+    "title": str.title,
+    "trim": str.strip,
+}
+
+
+def _rename_field(result: dict[str, Any], transform: dict[str, Any]) -> None:
+    """Rename a field."""
+    old_name = transform.get("from")
+    if old_name in result:
+        result[transform.get("to")] = result.pop(old_name)
+
+
+def _convert_field(result: dict[str, Any], transform: dict[str, Any]) -> None:
+    """Convert a field's type."""
+    field = transform.get("field")
+    converter = _CONVERTERS.get(transform.get("to_type"))
+    if field in result and converter is not None:
+        result[field] = converter(result[field])
+
+
+def _format_field(result: dict[str, Any], transform: dict[str, Any]) -> None:
+    """Format a field's text."""
+    field = transform.get("field")
+    formatter = _FORMATTERS.get(transform.get("format"))
+    if field in result and formatter is not None:
+        result[field] = formatter(_as_str(result[field]))
+
+
+def _remove_field(result: dict[str, Any], transform: dict[str, Any]) -> None:
+    """Remove a field."""
+    result.pop(transform.get("field"), None)
+
+
+def _add_field(result: dict[str, Any], transform: dict[str, Any]) -> None:
+    """Add a new field."""
+    result[transform.get("field")] = transform.get("value")
+
+
+def _merge_fields(result: dict[str, Any], transform: dict[str, Any]) -> None:
+    """Merge multiple fields into a target field."""
+    separator = transform.get("separator", " ")
+    values = (_as_str(result.get(f, "")) for f in transform.get("fields", []))
+    result[transform.get("target")] = separator.join(filter(None, values))
+
+
+# Transformation type -> handler applying it to the result in place
+_TRANSFORM_HANDLERS: dict[str, Callable[[dict[str, Any], dict[str, Any]], None]] = {
+    "rename": _rename_field,
+    "convert": _convert_field,
+    "format": _format_field,
+    "remove": _remove_field,
+    "add": _add_field,
+    "merge": _merge_fields,
+}
+
+
 class TransformDataTool(BaseTool):
     """Transform data from one format to another."""
 
@@ -294,66 +592,17 @@ class TransformDataTool(BaseTool):
             ToolResult with transformed data.
         """
         try:
-            result = dict(data)
-
-            for transform in transformations:
-                transform_type = transform.get("type")
-
-                if transform_type == "rename":
-                    # Rename a field
-                    old_name = transform.get("from")
-                    new_name = transform.get("to")
-                    if old_name in result:
-                        result[new_name] = result.pop(old_name)
-
-                elif transform_type == "convert":
-                    # Convert field type
-                    field = transform.get("field")
-                    to_type = transform.get("to_type")
-                    if field in result:
-                        value = result[field]
-                        if to_type == "string":
-                            result[field] = str(value)
-                        elif to_type == "integer":
-                            result[field] = int(value)
-                        elif to_type == "float":
-                            result[field] = float(value)
-                        elif to_type == "boolean":
-                            result[field] = bool(value)
-
-                elif transform_type == "format":
-                    # Format a field
-                    field = transform.get("field")
-                    format_spec = transform.get("format")
-                    if field in result:
-                        value = result[field]
-                        if format_spec == "uppercase":
-                            result[field] = str(value).upper()
-                        elif format_spec == "lowercase":
-                            result[field] = str(value).lower()
-                        elif format_spec == "title":
-                            result[field] = str(value).title()
-                        elif format_spec == "trim":
-                            result[field] = str(value).strip()
-
-                elif transform_type == "remove":
-                    # Remove a field
-                    field = transform.get("field")
-                    result.pop(field, None)
-
-                elif transform_type == "add":
-                    # Add a new field
-                    field = transform.get("field")
-                    value = transform.get("value")
-                    result[field] = value
-
-                elif transform_type == "merge":
-                    # Merge multiple fields
-                    fields = transform.get("fields", [])
-                    target = transform.get("target")
-                    separator = transform.get("separator", " ")
-                    values = [str(result.get(f, "")) for f in fields]
-                    result[target] = separator.join(v for v in values if v)
+            # Every known transformation writes to the result, so the input is
+            # only copied when at least one will be applied
+            steps = [
+                (handler, transform)
+                for transform in transformations
+                if (handler := _TRANSFORM_HANDLERS.get(transform.get("type"))) is not None
+            ]
+            result = dict(data) if steps else data
+
+            for handler, transform in steps:
+                handler(result, transform)
 
             return ToolResult.success(
                 result,
@@ -384,7 +633,7 @@ class TransformDataTool(BaseTool):
                             "properties": {
                                 "type": {
                                     "type": "string",
-                                    "enum": ["rename", "convert", "format", "remove", "add", "merge"],
+                                    "enum": list(_TRANSFORM_HANDLERS),
                                 },
                             },
                         },
@@ -402,6 +651,9 @@ class FormatOutputTool(BaseTool):
     description = """Format data for output in various formats like JSON,
     CSV, markdown table, or plain text."""
 
+    # Lists or dicts with more items than this are formatted in a worker thread
+    OFFLOAD_MIN_ITEMS = 256
+
     async def execute(
         self,
         data: Any,
@@ -418,57 +670,12 @@ class FormatOutputTool(BaseTool):
             ToolResult with formatted output.
         """
         try:
-            if format_type == "json":
-                output = json.dumps(data, indent=2, ensure_ascii=False)
-
-            elif format_type == "csv":
-                if isinstance(data, list) and data:
-                    # Assume list of dicts
-                    if isinstance(data[0], dict):
-                        headers = list(data[0].keys())
-                        lines = [",".join(headers)]
-                        for row in data:
-                            values = [str(row.get(h, "")).replace(",", ";") for h in headers]
-                            lines.append(",".join(values))
-                        output = "\n".join(lines)
-                    else:
-                        output = "\n".join(str(item) for item in data)
-                else:
-                    output = str(data)
-
-            elif format_type == "markdown":
-                if isinstance(data, list) and data and isinstance(data[0], dict):
-                    # Create markdown table
-                    headers = list(data[0].keys())
-                    lines = [
-                        "| " + " | ".join(headers) + " |",
-                        "| " + " | ".join(["---"] * len(headers)) + " |",
-                    ]
-                    for row in data:
-                        values = [str(row.get(h, "")) for h in headers]
-                        lines.append("| " + " | ".join(values) + " |")
-                    output = "\n".join(lines)
-                elif isinstance(data, dict):
-                    lines = []
-                    for key, value in data.items():
-                        lines.append(f"**{key}**: {value}")
-                    output = "\n".join(lines)
-                else:
-                    output = str(data)
-
-            elif format_type == "text":
-                if isinstance(data, dict):
-                    lines = []
-                    for key, value in data.items():
-                        lines.append(f"{key}: {value}")
-                    output = "\n".join(lines)
-                elif isinstance(data, list):
-                    output = "\n".join(str(item) for item in data)
-                else:
-                    output = str(data)
-
+            # Large inputs are formatted off the event loop so other
+            # concurrent tool calls are not blocked meanwhile
+            if isinstance(data, (list, dict)) and len(data) > self.OFFLOAD_MIN_ITEMS:
+                output = await asyncio.to_thread(self._format_sync, data, format_type)
             else:
-                output = str(data)
+                output = self._format_sync(data, format_type)
 
             return ToolResult.success(
                 {"formatted_output": output, "format": format_type},
@@ -478,6 +685,66 @@ class FormatOutputTool(BaseTool):
             logger.error("Output formatting failed", error=str(e))
             return ToolResult.error(f"Formatting failed: {str(e)}")
 
+    @staticmethod
+    def _format_sync(data: Any, format_type: str) -> str:
+        """Format data synchronously.
+
+        Args:
+            data: Data to format.
+            format_type: Output format (json, csv, markdown, text).
+
+        Returns:
+            Formatted output.
+        """
+        if format_type == "json":
+            output = orjson.dumps(
+                data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS
+            ).decode()
+
+        elif format_type == "csv":
+            if isinstance(data, list) and data:
+                # Assume list of dicts
+                if isinstance(data[0], dict):
+                    headers = list(data[0].keys())
+                    buffer = io.StringIO()
+                    writer = csv.writer(buffer, lineterminator="\n")
+                    writer.writerow(headers)
+                    writer.writerows([row.get(h, "") for h in headers] for row in data)
+                    output = buffer.getvalue().removesuffix("\n")
+                else:
+                    output = "\n".join(str(item) for item in data)
+            else:
+                output = str(data)
+
+        elif format_type == "markdown":
+            if isinstance(data, list) and data and isinstance(data[0], dict):
+                # Create markdown table
+                headers = list(data[0].keys())
+                header = "| " + " | ".join(headers) + " |"
+                separator = "|" + " --- |" * len(headers)
+                rows = (
+                    "| " + " | ".join([_as_str(row.get(h, "")) for h in headers]) + " |"
+                    for row in data
+                )
+                output = "\n".join(itertools.chain((header, separator), rows))
+            elif isinstance(data, dict):
+                output = "\n".join(f"**{key}**: {value}" for key, value in data.items())
+            else:
+                output = str(data)
+
+        elif format_type == "text":
+            if isinstance(data, dict):
+                output = "\n".join(f"{key}: {value}" for key, value in data.items())
+            elif isinstance(data, list):
+                output = "\n".join(str(item) for item in data)
+            else:
+                output = str(data)
+
+        else:
+            output = str(data)
+
+        return output
+
     def get_schema(self) -> dict[str, Any]:
         """Get the tool schema."""
         return {
@@ -4,11 +4,40 @@ from typing import Any
 
 from src.agents.tools.base import BaseTool, ToolResult
 from src.core import get_logger
+from src.core.cache import SemanticQueryCache
 from src.core.config import get_settings
+from src.core.rate_limit import get_search_rate_limiter
 from src.rag.retrieval.vector_store import get_vector_store
 
 logger = get_logger(__name__)
 
+# Global search result cache instance
+_search_cache: SemanticQueryCache | None = None
+
+
+def get_search_cache() -> SemanticQueryCache | None:
+    """Get the shared semantic cache for document search results.
+
+    The cache is cleared whenever documents are added to or deleted from
+    the vector store.
+
+    Returns:
+        The cache singleton, or None if the search cache is disabled.
+    """
+    global _search_cache
+    settings = get_settings()
+    if not settings.search_cache_enabled:
+        return None
+    if _search_cache is None:
+        _search_cache = SemanticQueryCache(
+            dimension=settings.embedding_dimension,
+            threshold=settings.search_cache_threshold,
+            ttl_seconds=settings.search_cache_ttl_seconds,
+            max_entries=settings.search_cache_max_entries,
+        )
+        get_vector_store().add_change_listener(_search_cache.clear)
+    return _search_cache
+
 
 class SearchDocumentsTool(BaseTool):
     """Search for relevant documents in the knowledge base."""
@@ -22,6 +51,7 @@ class SearchDocumentsTool(BaseTool):
         self,
         query: str,
         top_k: int = 5,
+        query_embedding: list[float] | None = None,
         **kwargs: Any,
     ) -> ToolResult:
         """Search for documents.
@@ -29,13 +59,22 @@ class SearchDocumentsTool(BaseTool):
         Args:
             query: Search query.
             top_k: Number of results to return.
+            query_embedding: Precomputed embedding of the query.
 
         Returns:
             ToolResult with search results.
         """
         try:
+            rate_limiter = get_search_rate_limiter()
+            if rate_limiter is not None:
+                await rate_limiter.aacquire()
+
             vector_store = get_vector_store()
-            results = await vector_store.search(query=query, top_k=top_k)
+            results = await vector_store.search(
+                query=query,
+                top_k=top_k,
+                query_embedding=query_embedding,
+            )
 
             formatted_results = []
             for i, result in enumerate(results, 1):
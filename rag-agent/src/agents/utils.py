@@ -0,0 +1,155 @@
+"""Shared helpers for agent graph nodes."""
+
+import hashlib
+from functools import lru_cache
+from typing import Any, Iterable
+
+import orjson
+import tiktoken
+
+
+def strip_json_fence(text: str) -> str:
+    """Remove a surrounding markdown code fence from an LLM response.
+
+    Args:
+        text: Raw LLM response content.
+
+    Returns:
+        Response content without the fence.
+    """
+    text = text.strip()
+    if not text.startswith("```"):
+        return text
+
+    body = text[3:]
+    newline = body.find("\n")
+    tag = body[:newline].strip() if newline != -1 else ""
+    if newline != -1 and (not tag or tag.isalpha()):
+        # Drop the opening fence line along with its language tag
+        body = body[newline + 1:]
+    elif body.startswith("json"):
+        body = body[4:]
+
+    if body.endswith("```"):
+        body = body[:-3]
+    return body.strip()
+
+
+def parse_llm_json(text: str, fallback: Any) -> Any:
+    """Parse a JSON object from an LLM response.
+
+    Args:
+        text: Raw LLM response content, optionally wrapped in a code fence.
+        fallback: Value returned when the content is not valid JSON.
+
+    Returns:
+        Parsed JSON value, or the fallback.
+    """
+    try:
+        return orjson.loads(strip_json_fence(text))
+    except orjson.JSONDecodeError:
+        return fallback
+
+
+@lru_cache
+def get_token_encoder() -> tiktoken.Encoding:
+    """Get the shared tokenizer used to budget prompt context.
+
+    Returns:
+        Tiktoken encoding.
+    """
+    return tiktoken.get_encoding("cl100k_base")
+
+
+def truncate_tokens(text: str, max_tokens: int) -> str:
+    """Truncate text to at most a number of tokens.
+
+    Args:
+        text: Text to truncate.
+        max_tokens: Maximum number of tokens to keep.
+
+    Returns:
+        Text cut at a token boundary.
+    """
+    # Every token covers at least one byte, so short text needs no encoding
+    if len(text.encode("utf-8")) <= max_tokens:
+        return text
+
+    encoder = get_token_encoder()
+    tokens = encoder.encode(text)
+    if len(tokens) <= max_tokens:
+        return text
+    return encoder.decode(tokens[:max_tokens])
+
+
+def truncate_middle(text: str, max_chars: int, tail_chars: int = 500) -> str:
+    """Truncate text to a character budget, keeping its beginning and end.
+
+    Args:
+        text: Text to truncate.
+        max_chars: Maximum number of characters kept from the text.
+        tail_chars: Number of those characters taken from the end.
+
+    Returns:
+        Head and tail of the text joined by a truncation marker.
+    """
+    if len(text) <= max_chars:
+        return text
+
+    tail_chars = min(tail_chars, max_chars // 2)
+    head = text[:max_chars - tail_chars]
+    tail = text[len(text) - tail_chars:] if tail_chars else ""
+    return f"{head}\n...[truncated]...\n{tail}"
+
+
+def content_hash(text: str) -> int:
+    """Compute a stable 64-bit fingerprint of text content.
+
+    Unlike the built-in ``hash``, the result is identical across processes
+    and workers, and it covers the full content rather than a prefix.
+
+    Args:
+        text: Text to fingerprint.
+
+    Returns:
+        Integer fingerprint.
+    """
+    digest = hashlib.blake2b(text.encode("utf-8", "ignore"), digest_size=8).digest()
+    return int.from_bytes(digest, "big")
+
+
+def fingerprint(text: str) -> str:
+    """Compute a short hex fingerprint of text for log correlation.
+
+    Args:
+        text: Text to fingerprint.
+
+    Returns:
+        16-character hex string of the content hash.
+    """
+    return f"{content_hash(text):016x}"
+
+
+def unique_by_content(
+    items: Iterable[dict[str, Any]],
+    key: str = "content",
+) -> list[dict[str, Any]]:
+    """Drop items whose content duplicates an earlier item.
+
+    Order is preserved, so ranked search results keep their ranking.
+
+    Args:
+        items: Items to deduplicate.
+        key: Field holding the text content.
+
+    Returns:
+        Items with duplicate content removed.
+    """
+    seen: set[int] = set()
+    unique = []
+    for item in items:
+        item_hash = content_hash(item[key])
+        if item_hash not in seen:
+            seen.add(item_hash)
+            unique.append(item)
+    return unique
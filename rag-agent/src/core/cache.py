@@ -0,0 +1,217 @@
+"""In-process caches shared by the RAG pipeline and agents."""
+
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Hashable, Sequence
+
+import numpy as np
+
+
+class TTLCache:
+    """Least-recently-used cache whose entries expire after a fixed time."""
+
+    def __init__(self, max_entries: int = 1024, ttl_seconds: float = 600.0) -> None:
+        """Initialize the cache.
+
+        Args:
+            max_entries: Maximum number of entries.
+            ttl_seconds: Time-to-live for entries.
+        """
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self._entries: OrderedDict[Hashable, tuple[float, Any]] = OrderedDict()
+
+    def __len__(self) -> int:
+        """Return the number of cached entries."""
+        return len(self._entries)
+
+    def get(self, key: Hashable) -> Any | None:
+        """Look up a cached value.
+
+        Args:
+            key: Cache key.
+
+        Returns:
+            Cached value, or None on a miss.
+        """
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+
+        expires_at, value = entry
+        if expires_at <= time.monotonic():
+            del self._entries[key]
+            return None
+
+        self._entries.move_to_end(key)
+        return value
+
+    def put(self, key: Hashable, value: Any) -> None:
+        """Cache a value.
+
+        Args:
+            key: Cache key.
+            value: Value to cache.
+        """
+        self._entries[key] = (time.monotonic() + self.ttl_seconds, value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        """Remove all entries."""
+        self._entries.clear()
+
+
+@dataclass
+class _SemanticEntry:
+    """A cached value with its normalized key embedding."""
+
+    vector: np.ndarray
+    value: Any
+    signatures: tuple[int, ...]
+    expires_at: float
+
+
+class SemanticQueryCache:
+    """Approximate-match cache keyed by embedding vectors.
+
+    Embeddings are bucketed with random-hyperplane LSH: each table hashes a
+    vector to a ``num_bits`` signature, and a lookup only compares cosine
+    similarity against entries sharing a bucket in at least one table.
+    Entries expire after ``ttl_seconds`` and the least recently used entry
+    is evicted once ``max_entries`` is reached.
+    """
+
+    def __init__(
+        self,
+        dimension: int,
+        threshold: float = 0.95,
+        ttl_seconds: float = 600.0,
+        max_entries: int = 1024,
+        num_tables: int = 4,
+        num_bits: int = 12,
+        seed: int = 0,
+    ) -> None:
+        """Initialize the semantic cache.
+
+        Args:
+            dimension: Embedding dimension.
+            threshold: Minimum cosine similarity for a hit.
+            ttl_seconds: Time-to-live for entries.
+            max_entries: Maximum number of entries.
+            num_tables: Number of LSH hash tables.
+            num_bits: Signature bits per table.
+            seed: Seed for the random projections.
+        """
+        self.threshold = threshold
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+
+        rng = np.random.default_rng(seed)
+        self._planes = rng.standard_normal((num_tables, num_bits, dimension))
+        self._bit_weights = 1 << np.arange(num_bits, dtype=np.int64)
+
+        self._entries: OrderedDict[int, _SemanticEntry] = OrderedDict()
+        self._buckets: list[dict[int, set[int]]] = [{} for _ in range(num_tables)]
+        self._next_id = 0
+
+    def __len__(self) -> int:
+        """Return the number of cached entries."""
+        return len(self._entries)
+
+    def _normalize(self, embedding: Sequence[float]) -> np.ndarray:
+        vector = np.asarray(embedding, dtype=np.float64)
+        norm = np.linalg.norm(vector)
+        return vector / norm if norm else vector
+
+    def _signatures(self, vector: np.ndarray) -> tuple[int, ...]:
+        bits = (self._planes @ vector) > 0
+        return tuple(int(sig) for sig in bits.astype(np.int64) @ self._bit_weights)
+
+    def _remove(self, entry_id: int) -> None:
+        entry = self._entries.pop(entry_id)
+        for table, signature in zip(self._buckets, entry.signatures):
+            bucket = table.get(signature)
+            if bucket is not None:
+                bucket.discard(entry_id)
+                if not bucket:
+                    del table[signature]
+
+    def get(
+        self,
+        embedding: Sequence[float],
+        threshold: float | None = None,
+    ) -> Any | None:
+        """Look up the value cached for the most similar embedding.
+
+        Args:
+            embedding: Query embedding.
+            threshold: Override for the minimum cosine similarity.
+
+        Returns:
+            Cached value, or None on a miss.
+        """
+        vector = self._normalize(embedding)
+        now = time.monotonic()
+
+        candidates: set[int] = set()
+        for table, signature in zip(self._buckets, self._signatures(vector)):
+            candidates.update(table.get(signature, ()))
+
+        if threshold is None:
+            threshold = self.threshold
+
+        best_id, best_score = None, threshold
+        for entry_id in candidates:
+            entry = self._entries[entry_id]
+            if entry.expires_at <= now:
+                self._remove(entry_id)
+                continue
+            score = float(entry.vector @ vector)
+            if score >= best_score:
+                best_id, best_score = entry_id, score
+
+        if best_id is None:
+            return None
+
+        self._entries.move_to_end(best_id)
+        return self._entries[best_id].value
+
+    def put(
+        self,
+        embedding: Sequence[float],
+        value: Any,
+        ttl_seconds: float | None = None,
+    ) -> None:
+        """Cache a value under an embedding.
+
+        Args:
+            embedding: Key embedding.
+            value: Value to cache.
+            ttl_seconds: Override for the entry time-to-live.
+        """
+        ttl = self.ttl_seconds if ttl_seconds is None else ttl_seconds
+        vector = self._normalize(embedding)
+        signatures = self._signatures(vector)
+
+        entry_id = self._next_id
+        self._next_id += 1
+        self._entries[entry_id] = _SemanticEntry(
+            vector=vector,
+            value=value,
+            signatures=signatures,
+            expires_at=time.monotonic() + ttl,
+        )
+        for table, signature in zip(self._buckets, signatures):
+            table.setdefault(signature, set()).add(entry_id)
+
+        while len(self._entries) > self.max_entries:
+            self._remove(next(iter(self._entries)))
+
+    def clear(self) -> None:
+        """Remove all entries."""
+        self._entries.clear()
+        for table in self._buckets:
+            table.clear()
@@ -57,10 +57,38 @@ class Settings(BaseSettings):
     hybrid_search_enabled: bool = True
     hybrid_alpha: float = 0.5  # Balance between dense and sparse search
     llm_model: str = "gpt-4o-mini"
+    router_model: str = "gpt-4o-mini"  # Small model for orchestrator routing decisions
+
+    # Semantic search cache
+    search_cache_enabled: bool = False
+    search_cache_threshold: float = 0.95  # Minimum cosine similarity for a hit
+    search_cache_ttl_seconds: int = 600
+    search_cache_max_entries: int = 1024
+
+    # LLM response cache (used when callers opt in per run)
+    llm_cache_ttl_seconds: int = 3600
+    llm_cache_max_entries: int = 1024
+    llm_semantic_cache_threshold: float = 0.9  # Minimum cosine similarity for a hit
+    answer_cache_threshold: float = 0.97  # Stricter threshold for reusing whole agent answers
+
+    # Shared HTTP/2 connection pool for LLM API calls
+    llm_max_connections: int = 64
+    llm_max_keepalive_connections: int = 32
+    llm_timeout_seconds: float = 60.0
+    llm_max_retries: int = 2
+
+    # Client-side rate limits (0 disables)
+    llm_requests_per_second: float = 0.0  # Per model, shared by all LLM clients
+    llm_burst: int = 10
+    search_requests_per_second: float = 0.0  # Shared by all agent document searches
+    search_burst: int = 20
 
     # Agent Settings
     agent_max_iterations: int = 10
     agent_timeout_seconds: int = 120
+    max_concurrent_searches: int = 8  # Per-agent limit on parallel vector store searches
+    prewarm_agents: bool = False  # Create all agents at startup instead of on first use
+    max_ticket_chars: int = 4000  # Longer support tickets keep only their beginning and end
 
     # Logging & Observability
     log_level: Literal["DEBUG", "INFO", "WARNING", "ERROR"] = "INFO"
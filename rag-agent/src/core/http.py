@@ -0,0 +1,57 @@
+"""Shared HTTP client for outbound LLM API calls."""
+
+from functools import lru_cache
+from typing import Callable
+
+import httpx
+
+from src.core.config import get_settings
+
+# Callbacks invoked after the shared client is closed
+_close_listeners: list[Callable[[], None]] = []
+
+
+@lru_cache
+def get_http_client() -> httpx.AsyncClient:
+    """Get the HTTP client shared by all LLM clients.
+
+    Concurrent LLM calls are multiplexed over pooled HTTP/2 connections
+    instead of each client opening its own.
+
+    Returns:
+        Shared async HTTP client.
+    """
+    settings = get_settings()
+    return httpx.AsyncClient(
+        http2=True,
+        limits=httpx.Limits(
+            max_connections=settings.llm_max_connections,
+            max_keepalive_connections=settings.llm_max_keepalive_connections,
+        ),
+        timeout=httpx.Timeout(settings.llm_timeout_seconds, connect=5.0),
+    )
+
+
+def add_close_listener(listener: Callable[[], None]) -> None:
+    """Register a callback invoked after the shared HTTP client is closed.
+
+    Modules that cache LLM clients built on the shared HTTP client use this
+    to drop them, so they are rebuilt on a new client when next requested.
+
+    Args:
+        listener: Callback taking no arguments.
+    """
+    _close_listeners.append(listener)
+
+
+async def aclose_http_client() -> None:
+    """Close the shared HTTP client and its connection pool.
+
+    Intended for application shutdown. Registered close listeners drop the
+    clients built on it, so a restarted application gets a new client.
+    """
+    if get_http_client.cache_info().currsize:
+        await get_http_client().aclose()
+        get_http_client.cache_clear()
+        for listener in _close_listeners:
+            listener()
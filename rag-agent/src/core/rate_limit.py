@@ -0,0 +1,140 @@
+"""Client-side rate limiting for outbound LLM and search calls."""
+
+import asyncio
+import threading
+import time
+from functools import lru_cache
+
+from langchain_core.rate_limiters import BaseRateLimiter
+
+from src.core.config import get_settings
+from src.core.logging import get_logger
+
+logger = get_logger(__name__)
+
+
+class AsyncTokenBucket(BaseRateLimiter):
+    """Token bucket that paces requests to a sustained rate.
+
+    Up to ``burst`` requests pass immediately; after that each caller
+    reserves the next token and sleeps until it is due, so waiting callers
+    are served in arrival order. Implements the LangChain rate limiter
+    interface, so it can be passed to chat models as ``rate_limiter``.
+    """
+
+    def __init__(self, rate: float, burst: int = 1, name: str = "default") -> None:
+        """Initialize the bucket.
+
+        Args:
+            rate: Sustained requests per second.
+            burst: Maximum number of requests allowed at once.
+            name: Name used in log events.
+        """
+        if rate <= 0:
+            raise ValueError("rate must be positive")
+
+        self.rate = rate
+        self.burst = max(burst, 1)
+        self.name = name
+        self._tokens = float(self.burst)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def _reserve(self, blocking: bool) -> float | None:
+        """Take a token, possibly one that only becomes available later.
+
+        Args:
+            blocking: Whether to reserve a future token when none is left.
+
+        Returns:
+            Seconds to wait before the token is due, or None when no token
+            is available and blocking is disabled.
+        """
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+
+            if self._tokens >= 1:
+                self._tokens -= 1
+                return 0.0
+            if not blocking:
+                return None
+
+            # Tokens go negative, so later callers queue behind this reservation
+            wait = (1 - self._tokens) / self.rate
+            self._tokens -= 1
+            return wait
+
+    def acquire(self, *, blocking: bool = True) -> bool:
+        """Acquire a token, sleeping until one is available.
+
+        Args:
+            blocking: Whether to wait when no token is available.
+
+        Returns:
+            True if a token was acquired.
+        """
+        wait = self._reserve(blocking)
+        if wait is None:
+            return False
+        if wait:
+            logger.debug("Rate limited", limiter=self.name, wait_seconds=round(wait, 3))
+            time.sleep(wait)
+        return True
+
+    async def aacquire(self, *, blocking: bool = True) -> bool:
+        """Acquire a token without blocking the event loop.
+
+        Args:
+            blocking: Whether to wait when no token is available.
+
+        Returns:
+            True if a token was acquired.
+        """
+        wait = self._reserve(blocking)
+        if wait is None:
+            return False
+        if wait:
+            logger.debug("Rate limited", limiter=self.name, wait_seconds=round(wait, 3))
+            await asyncio.sleep(wait)
+        return True
+
+
+@lru_cache
+def get_llm_rate_limiter(model_name: str) -> AsyncTokenBucket | None:
+    """Get the rate limiter shared by all clients of an LLM model.
+
+    Each model gets its own bucket, since provider limits apply per model.
+
+    Args:
+        model_name: LLM model name.
+
+    Returns:
+        Shared rate limiter, or None when LLM rate limiting is disabled.
+    """
+    settings = get_settings()
+    if settings.llm_requests_per_second <= 0:
+        return None
+    return AsyncTokenBucket(
+        rate=settings.llm_requests_per_second,
+        burst=settings.llm_burst,
+        name=f"llm:{model_name}",
+    )
+
+
+@lru_cache
+def get_search_rate_limiter() -> AsyncTokenBucket | None:
+    """Get the rate limiter shared by all vector store searches from agents.
+
+    Returns:
+        Shared rate limiter, or None when search rate limiting is disabled.
+    """
+    settings = get_settings()
+    if settings.search_requests_per_second <= 0:
+        return None
+    return AsyncTokenBucket(
+        rate=settings.search_requests_per_second,
+        burst=settings.search_burst,
+        name="search",
+    )
@@ -35,11 +35,24 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
     except Exception as e:
         logger.warning("Failed to initialize vector store", error=str(e))
 
+    if settings.prewarm_agents:
+        try:
+            from src.agents.orchestrator import get_orchestrator
+
+            get_orchestrator().prewarm_agents()
+            logger.info("Agents prewarmed")
+        except Exception as e:
+            logger.warning("Failed to prewarm agents", error=str(e))
+
     yield
 
     # Shutdown
     logger.info("Shutting down RAG Agent Service")
 
+    from src.core.http import aclose_http_client
+
+    await aclose_http_client()
+
 
 def create_app() -> FastAPI:
     """Create and configure the FastAPI application."""
@@ -61,6 +61,24 @@ def format_docs(docs: list[Document]) -> str:
     return "\n\n---\n\n".join(formatted_parts)
 
 
+def format_sources(docs: list[Document]) -> list[dict[str, Any]]:
+    """Format documents into source references with a content preview.
+
+    Args:
+        docs: List of documents to format.
+
+    Returns:
+        List of source dicts with content preview and metadata.
+    """
+    return [
+        {
+            "content": doc.page_content[:200] + "...",
+            "metadata": doc.metadata,
+        }
+        for doc in docs
+    ]
+
+
 class RAGChain:
     """RAG chain for question answering."""
 
@@ -135,13 +153,7 @@ class RAGChain:
 
         return {
             "answer": answer,
-            "sources": [
-                {
-                    "content": doc.page_content[:200] + "...",
-                    "metadata": doc.metadata,
-                }
-                for doc in docs
-            ],
+            "sources": format_sources(docs),
             "question": question,
         }
 
@@ -266,13 +278,7 @@ class ConversationalRAGChain:
 
         return {
             "answer": answer,
-            "sources": [
-                {
-                    "content": doc.page_content[:200] + "...",
-                    "metadata": doc.metadata,
-                }
-                for doc in docs
-            ],
+            "sources": format_sources(docs),
             "question": question,
             "history_length": len(self.chat_history),
         }
@@ -8,6 +8,7 @@ from src.rag.retrieval.retriever import (
     AdvancedRetriever,
     get_retriever,
 )
+from src.rag.retrieval.cached_retriever import CachedRetriever, get_cached_retriever
 from src.rag.retrieval.reranker import (
     CrossEncoderReranker,
     CohereReranker,
@@ -31,6 +32,8 @@ __all__ = [
     "ContextualRetriever",
     "AdvancedRetriever",
     "get_retriever",
+    "CachedRetriever",
+    "get_cached_retriever",
     # Rerankers
     "CrossEncoderReranker",
     "CohereReranker",
@@ -0,0 +1,115 @@
+"""Retriever wrapper that caches results for repeated and similar queries."""
+
+from functools import lru_cache
+
+from langchain_core.documents import Document
+
+from src.core import get_logger
+from src.core.cache import SemanticQueryCache, TTLCache
+from src.core.config import get_settings
+from src.rag.retrieval.retriever import QdrantRetriever, get_retriever
+from src.rag.retrieval.vector_store import get_vector_store
+
+logger = get_logger(__name__)
+
+
+class CachedRetriever:
+    """Two-tier cache in front of a semantic retriever.
+
+    Caching is opt-in through the search cache setting; when it is disabled
+    every query goes to the retriever. When enabled, exact repeats of a query
+    are served from an LRU cache without touching the vector store, and other
+    queries are embedded once and served from a previous result whose query
+    embedding is similar enough; on a miss the same embedding is reused for
+    the search. Both tiers expire entries after a TTL and are cleared
+    whenever documents are added to or deleted from the vector store.
+    """
+
+    def __init__(self, retriever: QdrantRetriever) -> None:
+        """Initialize the cached retriever.
+
+        Args:
+            retriever: Retriever to serve cache misses.
+        """
+        settings = get_settings()
+        self.retriever = retriever
+
+        self._exact: TTLCache | None = None
+        self._semantic: SemanticQueryCache | None = None
+        if settings.search_cache_enabled:
+            self._exact = TTLCache(
+                max_entries=settings.search_cache_max_entries,
+                ttl_seconds=settings.search_cache_ttl_seconds,
+            )
+            self._semantic = SemanticQueryCache(
+                dimension=settings.embedding_dimension,
+                threshold=settings.search_cache_threshold,
+                ttl_seconds=settings.search_cache_ttl_seconds,
+                max_entries=settings.search_cache_max_entries,
+            )
+
+        get_vector_store().add_change_listener(self.clear)
+
+    def clear(self) -> None:
+        """Remove all cached results."""
+        if self._exact is not None:
+            self._exact.clear()
+        if self._semantic is not None:
+            self._semantic.clear()
+
+    async def aget(
+        self,
+        query: str,
+        query_embedding: list[float] | None = None,
+    ) -> list[Document]:
+        """Retrieve documents for a query, using cached results when possible.
+
+        Args:
+            query: Search query.
+            query_embedding: Precomputed embedding of the query.
+
+        Returns:
+            List of relevant documents.
+        """
+        if self._exact is None or self._semantic is None:
+            return await self.retriever._aget_relevant_documents(
+                query, query_embedding=query_embedding
+            )
+
+        docs = self._exact.get(query)
+        if docs is not None:
+            logger.debug("Retrieval served from exact cache", query_preview=query[:50])
+            return docs
+
+        embedding = query_embedding
+        if embedding is None:
+            try:
+                [embedding] = await get_vector_store().embed_queries([query])
+            except Exception as e:
+                logger.warning("Query embedding failed, bypassing retrieval cache", error=str(e))
+
+        if embedding is not None:
+            docs = self._semantic.get(embedding)
+            if docs is not None:
+                logger.debug("Retrieval served from semantic cache", query_preview=query[:50])
+                self._exact.put(query, docs)
+                return docs
+
+        docs = await self.retriever._aget_relevant_documents(query, query_embedding=embedding)
+
+        self._exact.put(query, docs)
+        if embedding is not None:
+            self._semantic.put(embedding, docs)
+        return docs
+
+@lru_cache(maxsize=8)
+def get_cached_retriever(top_k: int) -> CachedRetriever:
+    """Get a cached semantic retriever shared by all agents using the same top_k.
+
+    Args:
+        top_k: Number of documents to retrieve.
+
+    Returns:
+        Shared cached retriever.
+    """
+    return CachedRetriever(get_retriever(top_k=top_k))
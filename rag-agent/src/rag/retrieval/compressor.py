@@ -12,6 +12,8 @@ from langchain_openai import ChatOpenAI
 
 from src.core import get_logger
 from src.core.config import get_settings
+from src.core.http import get_http_client
+from src.core.rate_limit import get_llm_rate_limiter
 
 logger = get_logger(__name__)
 
@@ -59,6 +61,10 @@ Relevant content:"""
                 temperature=0,
                 max_tokens=self.max_tokens,
                 openai_api_key=settings.openai_api_key,
+                timeout=settings.llm_timeout_seconds,
+                max_retries=settings.llm_max_retries,
+                http_async_client=get_http_client(),
+                rate_limiter=get_llm_rate_limiter(self.model_name),
             )
         return self._llm
 
@@ -6,6 +6,8 @@ from langchain_core.documents import Document
 
 from src.core import get_logger
 from src.core.config import get_settings
+from src.core.http import get_http_client
+from src.core.rate_limit import get_llm_rate_limiter
 
 logger = get_logger(__name__)
 
@@ -269,6 +271,10 @@ class LLMReranker:
                 model=self.model_name,
                 temperature=0,
                 openai_api_key=settings.openai_api_key,
+                timeout=settings.llm_timeout_seconds,
+                max_retries=settings.llm_max_retries,
+                http_async_client=get_http_client(),
+                rate_limiter=get_llm_rate_limiter(self.model_name),
             )
         return self._llm
 
@@ -43,12 +43,14 @@ class QdrantRetriever(BaseRetriever):
         query: str,
         *,
         run_manager: CallbackManagerForRetrieverRun | None = None,
+        query_embedding: list[float] | None = None,
     ) -> list[Document]:
         """Retrieve relevant documents for a query.
 
         Args:
             query: Search query.
             run_manager: Optional callback manager.
+            query_embedding: Precomputed embedding of the query.
 
         Returns:
             List of relevant documents.
@@ -60,6 +62,7 @@ class QdrantRetriever(BaseRetriever):
             top_k=self.top_k,
             filter_metadata=self.filter_metadata,
             score_threshold=self.score_threshold,
+            query_embedding=query_embedding,
         )
 
         documents = []
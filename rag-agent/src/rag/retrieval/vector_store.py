@@ -1,6 +1,6 @@
 """Vector store implementation using Qdrant."""
 
-from typing import Any
+from typing import Any, Callable
 from uuid import uuid4
 
 from langchain_core.documents import Document
@@ -28,6 +28,20 @@ class VectorStore:
         self.settings = get_settings()
         self._client: QdrantClient | None = None
         self._embeddings: OpenAIEmbeddings | None = None
+        self._change_listeners: list[Callable[[], None]] = []
+
+    def add_change_listener(self, listener: Callable[[], None]) -> None:
+        """Register a callback invoked whenever documents are added or deleted.
+
+        Args:
+            listener: Callback taking no arguments.
+        """
+        self._change_listeners.append(listener)
+
+    def _notify_change(self) -> None:
+        """Invoke the registered change listeners."""
+        for listener in self._change_listeners:
+            listener()
 
     async def initialize(self) -> None:
         """Initialize the Qdrant client and collection."""
@@ -149,6 +163,7 @@ class VectorStore:
             collection_name=self.COLLECTION_NAME,
             points=points,
         )
+        self._notify_change()
 
         logger.info(
             "Added documents to vector store",
@@ -158,12 +173,30 @@ class VectorStore:
 
         return chunk_ids
 
+    async def embed_queries(self, queries: list[str]) -> list[list[float]]:
+        """Embed several queries in a single embeddings request.
+
+        Args:
+            queries: Query texts.
+
+        Returns:
+            One embedding per query.
+        """
+        if self._embeddings is None:
+            raise RuntimeError("Vector store not initialized")
+
+        if not queries:
+            return []
+
+        return await self._embeddings.aembed_documents(queries)
+
     async def search(
         self,
         query: str,
         top_k: int = 5,
         filter_metadata: dict[str, Any] | None = None,
         score_threshold: float | None = None,
+        query_embedding: list[float] | None = None,
     ) -> list[dict[str, Any]]:
         """Search for similar documents.
 
@@ -172,6 +205,7 @@ class VectorStore:
             top_k: Number of results to return.
             filter_metadata: Optional metadata filters.
             score_threshold: Minimum similarity score.
+            query_embedding: Precomputed embedding of the query.
 
         Returns:
             List of search results with content, score, and metadata.
@@ -179,8 +213,9 @@ class VectorStore:
         if self._client is None or self._embeddings is None:
             raise RuntimeError("Vector store not initialized")
 
-        # Generate query embedding
-        query_embedding = await self._embeddings.aembed_query(query)
+        # Generate query embedding unless the caller already has one
+        if query_embedding is None:
+            query_embedding = await self._embeddings.aembed_query(query)
 
         # Build filter if provided
         query_filter = None
@@ -260,6 +295,7 @@ class VectorStore:
                 collection_name=self.COLLECTION_NAME,
                 points_selector=models.PointIdsList(points=point_ids),
             )
+            self._notify_change()
 
         logger.info(
             "Deleted document chunks",
@@ -0,0 +1,153 @@
+"""Tests for shared agent helpers."""
+
+from unittest.mock import MagicMock, patch
+
+from src.agents.utils import (
+    content_hash,
+    fingerprint,
+    parse_llm_json,
+    strip_json_fence,
+    truncate_middle,
+    truncate_tokens,
+    unique_by_content,
+)
+
+
+class TestContentHash:
+    """Tests for content_hash function."""
+
+    def test_stable(self):
+        """Test that equal content gives equal fingerprints."""
+        assert content_hash("same text") == content_hash("same text")
+
+    def test_covers_full_content(self):
+        """Test that content sharing a long prefix is distinguished."""
+        prefix = "x" * 200
+        assert content_hash(prefix + "a") != content_hash(prefix + "b")
+
+
+class TestFingerprint:
+    """Tests for fingerprint function."""
+
+    def test_fixed_length_hex(self):
+        """Test that fingerprints are 16 hex characters regardless of input size."""
+        for text in ["", "short", "x" * 10_000]:
+            fp = fingerprint(text)
+            assert len(fp) == 16
+            int(fp, 16)
+
+    def test_matches_content_hash(self):
+        """Test that the fingerprint is the hex form of the content hash."""
+        assert int(fingerprint("question"), 16) == content_hash("question")
+
+
+class TestUniqueByContent:
+    """Tests for unique_by_content function."""
+
+    def test_removes_duplicates_preserving_order(self):
+        """Test deduplication keeps the first occurrence in order."""
+        items = [
+            {"content": "alpha", "rank": 1},
+            {"content": "beta", "rank": 2},
+            {"content": "alpha", "rank": 3},
+        ]
+
+        result = unique_by_content(items)
+
+        assert [r["rank"] for r in result] == [1, 2]
+
+    def test_custom_key(self):
+        """Test deduplication on a custom field."""
+        items = [{"text": "a"}, {"text": "a"}, {"text": "b"}]
+
+        assert len(unique_by_content(items, key="text")) == 2
+
+    def test_empty(self):
+        """Test deduplication of an empty sequence."""
+        assert unique_by_content([]) == []
+
+
+class TestStripJsonFence:
+    """Tests for strip_json_fence function."""
+
+    def test_plain_json_unchanged(self):
+        """Test that unfenced content is only trimmed."""
+        assert strip_json_fence('  {"a": 1}\n') == '{"a": 1}'
+
+    def test_json_fence(self):
+        """Test stripping a ```json fence."""
+        assert strip_json_fence('```json\n{"a": 1}\n```') == '{"a": 1}'
+
+    def test_bare_fence(self):
+        """Test stripping a fence without a language tag."""
+        assert strip_json_fence('```\n[1, 2]\n```') == "[1, 2]"
+
+    def test_other_language_tag(self):
+        """Test that any language tag on the opening fence line is dropped."""
+        assert strip_json_fence('```JSON\n{"a": 1}\n```') == '{"a": 1}'
+
+    def test_single_line_fence(self):
+        """Test stripping a fence that opens and closes on the content line."""
+        assert strip_json_fence('```json{"a": 1}```') == '{"a": 1}'
+        assert strip_json_fence('```{"a": 1}```') == '{"a": 1}'
+
+    def test_content_on_fence_line(self):
+        """Test that content after the opening fence is kept."""
+        assert strip_json_fence('```json {"a":\n 1}\n```') == '{"a":\n 1}'
+
+
+class TestParseLlmJson:
+    """Tests for parse_llm_json function."""
+
+    def test_fenced_json(self):
+        """Test parsing JSON wrapped in a code fence."""
+        assert parse_llm_json('```json\n{"a": 1}\n```', {}) == {"a": 1}
+
+    def test_invalid_returns_fallback(self):
+        """Test that invalid JSON returns the fallback."""
+        fallback = {"title": "Report"}
+        assert parse_llm_json("not json", fallback) is fallback
+
+
+class TestTruncateTokens:
+    """Tests for truncate_tokens function."""
+
+    def test_short_text_unchanged(self):
+        """Test that text within the budget is returned without encoding."""
+        with patch("src.agents.utils.get_token_encoder") as mock_encoder:
+            assert truncate_tokens("short text", 100) == "short text"
+
+        mock_encoder.assert_not_called()
+
+    def test_truncates_at_token_boundary(self):
+        """Test that long text is cut to the token budget."""
+        encoder = MagicMock()
+        encoder.encode.side_effect = lambda text: text.split()
+        encoder.decode.side_effect = lambda tokens: " ".join(tokens)
+
+        with patch("src.agents.utils.get_token_encoder", return_value=encoder):
+            result = truncate_tokens("one two three four five", 3)
+
+        assert result == "one two three"
+
+
+class TestTruncateMiddle:
+    """Tests for truncate_middle function."""
+
+    def test_short_text_unchanged(self):
+        """Test that text within the budget is returned as is."""
+        assert truncate_middle("short text", 100) == "short text"
+
+    def test_keeps_head_and_tail(self):
+        """Test that long text keeps its beginning and end around a marker."""
+        text = "a" * 80 + "b" * 40 + "c" * 20
+
+        result = truncate_middle(text, 100, tail_chars=20)
+
+        assert result == "a" * 80 + "\n...[truncated]...\n" + "c" * 20
+
+    def test_tail_capped_to_half_budget(self):
+        """Test that the tail never takes more than half the budget."""
+        result = truncate_middle("x" * 50 + "y" * 50, 20, tail_chars=500)
+
+        assert result == "x" * 10 + "\n...[truncated]...\n" + "y" * 10
@@ -0,0 +1,127 @@
+"""Tests for in-process caches."""
+
+from unittest.mock import patch
+
+import numpy as np
+
+from src.core.cache import SemanticQueryCache, TTLCache
+
+
+def _unit(vector: np.ndarray) -> list[float]:
+    return list(vector / np.linalg.norm(vector))
+
+
+class TestTTLCache:
+    """Tests for TTLCache."""
+
+    def test_get_put(self):
+        """Test storing and retrieving a value."""
+        cache = TTLCache()
+        cache.put("key", "value")
+
+        assert cache.get("key") == "value"
+        assert cache.get("missing") is None
+
+    def test_ttl_expiry(self):
+        """Test that expired entries are not returned."""
+        cache = TTLCache(ttl_seconds=10)
+
+        with patch("src.core.cache.time.monotonic", return_value=100.0):
+            cache.put("key", "value")
+        with patch("src.core.cache.time.monotonic", return_value=111.0):
+            assert cache.get("key") is None
+
+        assert len(cache) == 0
+
+    def test_lru_eviction(self):
+        """Test that the least recently used entry is evicted."""
+        cache = TTLCache(max_entries=2)
+        cache.put("a", 1)
+        cache.put("b", 2)
+        cache.get("a")
+        cache.put("c", 3)
+
+        assert cache.get("a") == 1
+        assert cache.get("b") is None
+        assert cache.get("c") == 3
+
+
+class TestSemanticQueryCache:
+    """Tests for SemanticQueryCache."""
+
+    def test_exact_hit(self):
+        """Test that the same embedding returns the cached value."""
+        cache = SemanticQueryCache(dimension=8)
+        embedding = [1.0, 0.5, 0.0, 0.0, 0.2, 0.0, 0.0, 0.1]
+
+        cache.put(embedding, ["result"])
+
+        assert cache.get(embedding) == ["result"]
+
+    def test_near_duplicate_hit(self):
+        """Test that a slightly perturbed embedding still hits."""
+        rng = np.random.default_rng(1)
+        base = rng.standard_normal(64)
+        cache = SemanticQueryCache(dimension=64, threshold=0.95)
+
+        cache.put(_unit(base), "cached")
+        near = base + rng.standard_normal(64) * 0.01
+
+        assert cache.get(_unit(near)) == "cached"
+
+    def test_dissimilar_miss(self):
+        """Test that an unrelated embedding misses."""
+        rng = np.random.default_rng(2)
+        cache = SemanticQueryCache(dimension=64)
+
+        cache.put(_unit(rng.standard_normal(64)), "cached")
+
+        assert cache.get(_unit(rng.standard_normal(64))) is None
+
+    def test_threshold_override(self):
+        """Test that a per-call threshold is honored."""
+        cache = SemanticQueryCache(dimension=4)
+        embedding = [1.0, 0.0, 0.0, 0.0]
+        cache.put(embedding, "cached")
+
+        assert cache.get(embedding, threshold=1.01) is None
+        assert cache.get(embedding) == "cached"
+
+    def test_ttl_expiry(self):
+        """Test that expired entries are not returned."""
+        cache = SemanticQueryCache(dimension=4, ttl_seconds=10)
+        embedding = [1.0, 0.0, 0.0, 0.0]
+
+        with patch("src.core.cache.time.monotonic", return_value=100.0):
+            cache.put(embedding, "cached")
+        with patch("src.core.cache.time.monotonic", return_value=111.0):
+            assert cache.get(embedding) is None
+
+        assert len(cache) == 0
+
+    def test_lru_eviction(self):
+        """Test that the least recently used entry is evicted."""
+        cache = SemanticQueryCache(dimension=4, max_entries=2)
+        first = [1.0, 0.0, 0.0, 0.0]
+        second = [0.0, 1.0, 0.0, 0.0]
+        third = [0.0, 0.0, 1.0, 0.0]
+
+        cache.put(first, "first")
+        cache.put(second, "second")
+        cache.get(first)
+        cache.put(third, "third")
+
+        assert len(cache) == 2
+        assert cache.get(first) == "first"
+        assert cache.get(second) is None
+        assert cache.get(third) == "third"
+
+    def test_clear(self):
+        """Test clearing the cache."""
+        cache = SemanticQueryCache(dimension=4)
+        cache.put([1.0, 0.0, 0.0, 0.0], "cached")
+
+        cache.clear()
+
+        assert len(cache) == 0
+        assert cache.get([1.0, 0.0, 0.0, 0.0]) is None
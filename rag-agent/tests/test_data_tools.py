@@ -0,0 +1,352 @@
+"""Tests for data processing tools."""
+
+import asyncio
+from unittest.mock import AsyncMock, patch
+
+import pytest
+from langchain_core.language_models.fake_chat_models import FakeListChatModel
+
+from src.agents.llm import get_llm_cache
+from src.agents.tools import data_tools
+from src.agents.tools.base import ToolResult
+from src.agents.tools.data_tools import (
+    ExtractDataTool,
+    FormatOutputTool,
+    TransformDataTool,
+    ValidateDataTool,
+)
+
+
+@pytest.fixture
+def fake_llm():
+    """Serve extraction chains from a fake chat model."""
+    llm = FakeListChatModel(responses=['```json\n{"name": "Ada"}\n```'])
+    data_tools._get_extraction_chain.cache_clear()
+    get_llm_cache().clear()
+    with patch.object(data_tools, "get_chat_model", return_value=llm):
+        yield llm
+    data_tools._get_extraction_chain.cache_clear()
+    get_llm_cache().clear()
+
+
+class TestExtractDataTool:
+    """Tests for ExtractDataTool."""
+
+    @pytest.mark.asyncio
+    async def test_extracts_json(self, fake_llm):
+        """Test that the fenced JSON response is parsed."""
+        tool = ExtractDataTool()
+
+        result = await tool.execute(text="Ada Lovelace", extraction_schema={"name": "string"})
+
+        assert result.is_success
+        assert result.data == {"name": "Ada"}
+
+    @pytest.mark.asyncio
+    async def test_chain_reused(self, fake_llm):
+        """Test that the prompt and model are built once per extraction mode."""
+        tool = ExtractDataTool()
+
+        await tool.execute(text="first")
+        await tool.execute(text="second")
+
+        assert data_tools._get_extraction_chain.cache_info().misses == 1
+
+    @pytest.mark.asyncio
+    async def test_response_cache(self, fake_llm):
+        """Test that repeated extractions reuse the cached response only when asked to."""
+        tool = ExtractDataTool()
+        fake_llm.responses = ['{"name": "Ada"}', '{"name": "Grace"}']
+        schema = {"name": "string"}
+
+        first = await tool.execute(text="Ada Lovelace", extraction_schema=schema, use_cache=True)
+        second = await tool.execute(text="Ada Lovelace", extraction_schema=schema, use_cache=True)
+        uncached = await tool.execute(text="Ada Lovelace", extraction_schema=schema)
+
+        assert first.data == second.data == {"name": "Ada"}
+        assert uncached.data == {"name": "Grace"}
+
+    @pytest.mark.asyncio
+    async def test_unparseable_response_not_cached(self, fake_llm):
+        """Test that a garbled response is retried instead of served from the cache."""
+        tool = ExtractDataTool()
+        fake_llm.responses = ["Sorry, I cannot help", '{"name": "Ada"}']
+
+        first = await tool.execute(text="Ada Lovelace", use_cache=True)
+        second = await tool.execute(text="Ada Lovelace", use_cache=True)
+        third = await tool.execute(text="Ada Lovelace", use_cache=True)
+
+        assert first.data == {"raw_extraction": "Sorry, I cannot help"}
+        assert second.data == third.data == {"name": "Ada"}
+        assert fake_llm.i == 0  # Two requests; the third was served from the cache
+
+    @pytest.mark.asyncio
+    async def test_execute_many_single_request(self, fake_llm):
+        """Test that a batch is extracted from one JSON array response."""
+        tool = ExtractDataTool()
+        fake_llm.responses = [
+            '[{"name": "Ada"}, {"name": "Grace"}, {"name": "Alan"}]',
+            '{"name": "unused"}',
+        ]
+
+        results = await tool.execute_many(["Ada", "Grace", "Alan"])
+
+        assert [r.data for r in results] == [{"name": "Ada"}, {"name": "Grace"}, {"name": "Alan"}]
+        assert fake_llm.i == 1  # One request for the whole batch
+
+    @pytest.mark.asyncio
+    async def test_execute_many_falls_back_on_mismatch(self, fake_llm):
+        """Test that texts are extracted separately when the array length is wrong."""
+        tool = ExtractDataTool()
+        fake_llm.responses = ['[{"name": "Ada"}]', '{"name": "Ada"}', '{"name": "Grace"}']
+
+        results = await tool.execute_many(["Ada", "Grace"])
+
+        assert sorted(r.data["name"] for r in results) == ["Ada", "Grace"]
+
+    @pytest.mark.asyncio
+    async def test_execute_many_bounds_concurrent_batches(self):
+        """Test that no more than max_concurrency batches are extracted at once."""
+        tool = ExtractDataTool()
+        running = peak = 0
+
+        async def fake_batch(texts, extraction_schema, use_cache):
+            nonlocal running, peak
+            running += 1
+            peak = max(peak, running)
+            await asyncio.sleep(0)
+            running -= 1
+            return [ToolResult.success({}) for _ in texts]
+
+        with patch.object(tool, "_execute_batch", side_effect=fake_batch):
+            results = await tool.execute_many(["t"] * 10, batch_size=1, max_concurrency=3)
+
+        assert len(results) == 10
+        assert peak == 3
+
+
+class TestValidateDataTool:
+    """Tests for ValidateDataTool."""
+
+    @pytest.mark.asyncio
+    async def test_named_pattern(self):
+        """Test that built-in pattern names are resolved."""
+        tool = ValidateDataTool()
+
+        result = await tool.execute(
+            data={"email": "user@example.com", "website": "not a url"},
+            rules={"email": {"pattern": "email"}, "website": {"pattern": "url"}},
+        )
+
+        assert result.data["valid"] is False
+        assert [e["field"] for e in result.data["errors"]] == ["website"]
+        assert ValidateDataTool.PATTERNS["url"] in result.data["errors"][0]["error"]
+
+    @pytest.mark.asyncio
+    async def test_custom_pattern(self):
+        """Test that raw regex patterns are applied."""
+        tool = ValidateDataTool()
+        rules = {"code": {"pattern": r"^[A-Z]{3}-\d{3}$"}}
+
+        valid = await tool.execute(data={"code": "ABC-123"}, rules=rules)
+        invalid = await tool.execute(data={"code": "abc-123"}, rules=rules)
+
+        assert valid.data["valid"] is True
+        assert invalid.data["valid"] is False
+
+    @pytest.mark.asyncio
+    async def test_rule_checks(self):
+        """Test required, type, range and enum checks, reported in rule order."""
+        tool = ValidateDataTool()
+        rules = {
+            "name": {"required": True},
+            "age": {"type": "integer", "min": 0, "max": 150},
+            "code": {"min": 3, "max": 5},
+            "status": {"enum": ["open", "closed"]},
+            "score": {"type": "number"},
+        }
+
+        result = await tool.execute(
+            data={"age": 200, "code": "ab", "status": "pending", "score": "high"},
+            rules=rules,
+        )
+
+        assert result.data["fields_checked"] == 5
+        assert result.data["errors"] == [
+            {"field": "name", "error": "Required field is missing"},
+            {"field": "age", "error": "Value 200 is greater than maximum 150"},
+            {"field": "code", "error": "Length 2 is less than minimum 3"},
+            {"field": "status", "error": "Value must be one of: ['open', 'closed']"},
+            {"field": "score", "error": "Expected number, got str"},
+        ]
+
+    @pytest.mark.asyncio
+    async def test_rules_compiled_once(self):
+        """Test that a repeated ruleset reuses its compiled checks."""
+        tool = ValidateDataTool()
+        rules = {"id": {"type": "string", "pattern": r"^id-\d+$"}}
+
+        with patch.object(
+            ValidateDataTool, "_build_field_checks", wraps=ValidateDataTool._build_field_checks
+        ) as mock_build:
+            data_tools._get_cached_field_checks.cache_clear()
+            first = await tool.execute(data={"id": "id-1"}, rules=rules)
+            second = await tool.execute(data={"id": "x"}, rules=dict(rules))
+
+        assert first.data["valid"] is True
+        assert second.data["valid"] is False
+        assert mock_build.call_count == 1
+
+    @pytest.mark.asyncio
+    async def test_non_json_rules(self):
+        """Test that rules which cannot be serialized are still applied."""
+        tool = ValidateDataTool()
+
+        result = await tool.execute(data={"tag": "c"}, rules={"tag": {"enum": {"a", "b"}}})
+
+        assert result.data["valid"] is False
+
+    @pytest.mark.asyncio
+    async def test_invalid_pattern(self):
+        """Test that a malformed pattern is reported as a tool error."""
+        tool = ValidateDataTool()
+
+        result = await tool.execute(data={"code": "x"}, rules={"code": {"pattern": "("}})
+
+        assert not result.is_success
+
+
+class TestTransformDataTool:
+    """Tests for TransformDataTool."""
+
+    @pytest.mark.asyncio
+    async def test_applies_transformations_in_order(self):
+        """Test each transformation type."""
+        tool = TransformDataTool()
+        data = {"first": "ada", "last": "lovelace", "age": "36", "tmp": 1}
+
+        result = await tool.execute(data=data, transformations=[
+            {"type": "format", "field": "first", "format": "title"},
+            {"type": "merge", "fields": ["first", "last"], "target": "name"},
+            {"type": "convert", "field": "age", "to_type": "integer"},
+            {"type": "rename", "from": "age", "to": "years"},
+            {"type": "remove", "field": "tmp"},
+            {"type": "add", "field": "source", "value": "form"},
+        ])
+
+        assert result.data == {
+            "first": "Ada",
+            "last": "lovelace",
+            "name": "Ada lovelace",
+            "years": 36,
+            "source": "form",
+        }
+        assert data["tmp"] == 1
+
+    @pytest.mark.asyncio
+    async def test_unknown_types_ignored(self):
+        """Test that unknown transformation, conversion and format types are no-ops."""
+        tool = TransformDataTool()
+
+        result = await tool.execute(data={"a": "x"}, transformations=[
+            {"type": "explode", "field": "a"},
+            {"type": "convert", "field": "a", "to_type": "decimal"},
+            {"type": "format", "field": "a", "format": "reverse"},
+        ])
+
+        assert result.data == {"a": "x"}
+
+    @pytest.mark.asyncio
+    async def test_no_copy_without_changes(self):
+        """Test that the input is returned as-is when nothing is applied."""
+        tool = TransformDataTool()
+        data = {"a": "x"}
+
+        unchanged = await tool.execute(data=data, transformations=[{"type": "explode"}])
+        changed = await tool.execute(data=data, transformations=[{"type": "remove", "field": "a"}])
+
+        assert unchanged.data is data
+        assert changed.data == {}
+        assert data == {"a": "x"}
+
+    @pytest.mark.asyncio
+    async def test_failed_conversion(self):
+        """Test that a failing conversion is reported as a tool error."""
+        tool = TransformDataTool()
+
+        result = await tool.execute(
+            data={"a": "x"},
+            transformations=[{"type": "convert", "field": "a", "to_type": "integer"}],
+        )
+
+        assert not result.is_success
+
+
+class TestFormatOutputTool:
+    """Tests for FormatOutputTool."""
+
+    @pytest.mark.asyncio
+    async def test_json(self):
+        """Test indented JSON output with non-ASCII text and non-string keys."""
+        tool = FormatOutputTool()
+
+        result = await tool.execute(data={"city": "Zürich", 1: [1, 2]}, format_type="json")
+
+        assert result.data["formatted_output"] == (
+            '{\n  "city": "Zürich",\n  "1": [\n    1,\n    2\n  ]\n}'
+        )
+
+    @pytest.mark.asyncio
+    async def test_csv_quotes_values(self):
+        """Test that CSV values with commas and quotes are quoted, not altered."""
+        tool = FormatOutputTool()
+        data = [
+            {"name": "Lovelace, Ada", "note": 'said "hi"'},
+            {"name": "Hopper", "note": None},
+        ]
+
+        result = await tool.execute(data=data, format_type="csv")
+
+        assert result.data["formatted_output"] == (
+            'name,note\n"Lovelace, Ada","said ""hi"""\nHopper,'
+        )
+
+    @pytest.mark.asyncio
+    async def test_markdown_table(self):
+        """Test markdown table output for a list of dicts."""
+        tool = FormatOutputTool()
+        data = [{"name": "Ada", "year": 1815}, {"name": "Grace"}]
+
+        result = await tool.execute(data=data, format_type="markdown")
+
+        assert result.data["formatted_output"] == (
+            "| name | year |\n| --- | --- |\n| Ada | 1815 |\n| Grace |  |"
+        )
+
+    @pytest.mark.asyncio
+    async def test_markdown_and_text_dict(self):
+        """Test key/value output for a dict."""
+        tool = FormatOutputTool()
+        data = {"name": "Ada", "year": 1815}
+
+        markdown = await tool.execute(data=data, format_type="markdown")
+        text = await tool.execute(data=data, format_type="text")
+
+        assert markdown.data["formatted_output"] == "**name**: Ada\n**year**: 1815"
+        assert text.data["formatted_output"] == "name: Ada\nyear: 1815"
+
+    @pytest.mark.asyncio
+    async def test_large_input_formatted_in_thread(self):
+        """Test that only large inputs are offloaded to a worker thread."""
+        tool = FormatOutputTool()
+        rows = [{"n": i} for i in range(FormatOutputTool.OFFLOAD_MIN_ITEMS + 1)]
+
+        with patch.object(
+            data_tools.asyncio, "to_thread", new_callable=AsyncMock, return_value="n"
+        ) as mock_to_thread:
+            small = await tool.execute(data=rows[:2], format_type="csv")
+            large = await tool.execute(data=rows, format_type="csv")
+
+        assert small.data["formatted_output"] == "n\n0\n1"
+        assert large.data["formatted_output"] == "n"
+        mock_to_thread.assert_awaited_once_with(tool._format_sync, rows, "csv")
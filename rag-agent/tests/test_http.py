@@ -0,0 +1,43 @@
+"""Tests for the shared HTTP client."""
+
+from unittest.mock import patch
+
+import pytest
+
+from src.agents import orchestrator
+from src.agents.llm import get_chat_model
+from src.core.http import aclose_http_client, get_http_client
+
+
+class TestAcloseHttpClient:
+    """Tests for aclose_http_client function."""
+
+    @pytest.mark.asyncio
+    async def test_clients_rebuilt_after_close(self):
+        """Test that cached LLM clients are dropped with the closed HTTP client."""
+        get_chat_model.cache_clear()
+        with patch("src.agents.llm.ChatOpenAI", side_effect=lambda **_: object()), \
+             patch("src.agents.orchestrator.ChatOpenAI"):
+            model = get_chat_model("gpt-4o-mini", 0.0)
+            first_orchestrator = orchestrator.get_orchestrator()
+            client = get_http_client()
+
+            await aclose_http_client()
+
+            assert client.is_closed
+            assert get_http_client() is not client
+            assert get_chat_model("gpt-4o-mini", 0.0) is not model
+            assert orchestrator.get_orchestrator() is not first_orchestrator
+
+        get_chat_model.cache_clear()
+        orchestrator._reset_orchestrator()
+
+    @pytest.mark.asyncio
+    async def test_noop_without_client(self):
+        """Test that closing before any client was created does nothing."""
+        await aclose_http_client()
+        get_http_client.cache_clear()
+
+        await aclose_http_client()
+
+        assert get_http_client.cache_info().currsize == 0
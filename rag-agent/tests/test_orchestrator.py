@@ -1,11 +1,14 @@
 """Tests for Agent Orchestrator module."""
 
+import asyncio
+
 import pytest
 from unittest.mock import AsyncMock, MagicMock, patch
 
 from src.agents.orchestrator import (
     AgentType,
     AgentOrchestrator,
+    _keyword_route,
     get_orchestrator,
 )
 from src.agents.base import AgentResult
@@ -27,6 +30,44 @@ class TestAgentType:
         assert len(AgentType) == 5
 
 
+class TestKeywordRoute:
+    """Tests for _keyword_route function."""
+
+    def test_unambiguous_matches(self):
+        """Test requests with clear intent are routed by keywords."""
+        assert _keyword_route("Customer complaint: my order never arrived") == "support_triage"
+        assert _keyword_route("Ticket #4521: login fails after reset") == "support_triage"
+        assert _keyword_route("Please triage this ticket: refund not received") == "support_triage"
+        assert _keyword_route("Generate a quarterly sales report") == "report"
+        assert _keyword_route("Extract the invoice fields from this PDF") == "data_entry"
+        assert _keyword_route("Research the history of vector databases") == "research"
+
+    def test_no_match(self):
+        """Test plain questions are left to the router LLM."""
+        assert _keyword_route("What is Python?") is None
+
+    def test_questions_mentioning_tasks(self):
+        """Test questions that only mention a task are left to the router LLM."""
+        assert _keyword_route(
+            "How do I parse data in pandas according to the handbook?"
+        ) is None
+        assert _keyword_route("Explain how to extract values from the API response") is None
+        assert _keyword_route("Can you research what our docs say about Kubernetes?") is None
+        assert _keyword_route("How do I write a report with the template?") is None
+        assert _keyword_route(
+            "How do I buy a conference ticket per the travel policy?"
+        ) is None
+        assert _keyword_route("What are our customer support hours?") is None
+
+    def test_polite_imperative(self):
+        """Test a leading "please" does not hide an imperative request."""
+        assert _keyword_route("Please fill out the onboarding form for Ada") == "data_entry"
+
+    def test_ambiguous_match(self):
+        """Test requests matching several agents are left to the router LLM."""
+        assert _keyword_route("Investigate this support ticket and write a report") is None
+
+
 class TestAgentOrchestrator:
     """Tests for AgentOrchestrator class."""
 
@@ -53,6 +94,21 @@ class TestAgentOrchestrator:
 
             assert orchestrator.model_name == "gpt-4"
 
+    def test_init_router_model(self):
+        """Test that routing uses the router model unless a model is given."""
+        with patch("src.agents.orchestrator.get_settings") as mock_settings, \
+             patch("src.agents.orchestrator.ChatOpenAI") as mock_chat:
+            mock_settings.return_value.llm_model = "gpt-4o"
+            mock_settings.return_value.router_model = "gpt-4o-mini"
+            mock_settings.return_value.openai_api_key = "test-key"
+
+            default = AgentOrchestrator()
+            custom = AgentOrchestrator(model_name="gpt-4")
+
+            assert default.router_model_name == "gpt-4o-mini"
+            assert custom.router_model_name == "gpt-4"
+            assert mock_chat.call_args_list[0].kwargs["model"] == "gpt-4o-mini"
+
     def test_get_agent_rag(self):
         """Test getting RAG agent."""
         with patch("src.agents.orchestrator.get_settings") as mock_settings, \
@@ -91,6 +147,32 @@ class TestAgentOrchestrator:
             # Should only create once
             mock_create.assert_called_once()
 
+    def test_prewarm_agents(self):
+        """Test that prewarming creates every agent type once."""
+        factories = [
+            "create_rag_agent",
+            "create_research_agent",
+            "create_data_entry_agent",
+            "create_support_triage_agent",
+            "create_report_agent",
+        ]
+        with patch("src.agents.orchestrator.get_settings") as mock_settings, \
+             patch("src.agents.orchestrator.ChatOpenAI"):
+            mock_settings.return_value.llm_model = "gpt-4o-mini"
+            mock_settings.return_value.openai_api_key = "test-key"
+
+            mocks = {name: patch(f"src.agents.orchestrator.{name}").start() for name in factories}
+            try:
+                orchestrator = AgentOrchestrator()
+                orchestrator.prewarm_agents()
+                orchestrator._get_agent("rag")
+            finally:
+                patch.stopall()
+
+            assert set(orchestrator._agents) == {t.value for t in AgentType}
+            for mock_create in mocks.values():
+                mock_create.assert_called_once()
+
     def test_get_agent_unknown_type(self):
         """Test getting unknown agent type."""
         with patch("src.agents.orchestrator.get_settings") as mock_settings, \
@@ -134,6 +216,21 @@ class TestAgentOrchestrator:
 
                     assert result == "rag"
 
+    @pytest.mark.asyncio
+    async def test_route_request_keyword_fast_path(self):
+        """Test that keyword-routed requests skip the router LLM."""
+        with patch("src.agents.orchestrator.get_settings") as mock_settings, \
+             patch("src.agents.orchestrator.ChatOpenAI"), \
+             patch("src.agents.orchestrator.ChatPromptTemplate") as mock_prompt:
+            mock_settings.return_value.llm_model = "gpt-4o-mini"
+            mock_settings.return_value.openai_api_key = "test-key"
+
+            orchestrator = AgentOrchestrator()
+            result = await orchestrator.route_request("Please create a weekly status report")
+
+            assert result == "report"
+            mock_prompt.from_template.assert_not_called()
+
     @pytest.mark.asyncio
     async def test_route_request_invalid_defaults_to_rag(self):
         """Test that invalid routing result defaults to RAG."""
@@ -342,6 +439,63 @@ class TestAgentOrchestrator:
             assert len(results) == 1
             assert results[0].success is False
 
+    @pytest.mark.asyncio
+    async def test_run_workflow_runs_independent_steps_concurrently(self):
+        """Test independent same-agent steps overlap and keep their order."""
+        with patch("src.agents.orchestrator.get_settings") as mock_settings, \
+             patch("src.agents.orchestrator.ChatOpenAI"), \
+             patch("src.agents.orchestrator.create_rag_agent") as mock_rag:
+            mock_settings.return_value.llm_model = "gpt-4o-mini"
+            mock_settings.return_value.openai_api_key = "test-key"
+
+            in_flight = 0
+            max_in_flight = 0
+
+            async def run(question, **kwargs):
+                nonlocal in_flight, max_in_flight
+                in_flight += 1
+                max_in_flight = max(max_in_flight, in_flight)
+                await asyncio.sleep(0)
+                in_flight -= 1
+                return AgentResult(answer=question, metadata={})
+
+            mock_rag_agent = MagicMock()
+            mock_rag_agent.run = run
+            mock_rag.return_value = mock_rag_agent
+
+            orchestrator = AgentOrchestrator()
+
+            workflow = [
+                {"agent_type": "rag", "request": "Q1"},
+                {"agent_type": "rag", "request": "Q2"},
+                {"agent_type": "rag", "request": "Q3", "use_previous": True},
+            ]
+
+            results = await orchestrator.run_workflow(workflow)
+
+            assert [r.metadata["workflow_step"] for r in results] == [1, 2, 3]
+            assert results[0].answer == "Q1"
+            assert results[1].answer == "Q2"
+            assert results[2].answer.startswith("Q3") and "Q2" in results[2].answer
+            assert max_in_flight == 2
+
+    def test_group_workflow_steps(self):
+        """Test grouping of consecutive independent same-agent steps."""
+        workflow = [
+            {"agent_type": "rag", "request": "a"},
+            {"agent_type": "rag", "request": "b", "stop_on_failure": True},
+            {"agent_type": "rag", "request": "c"},
+            {"agent_type": "research", "request": "d"},
+            {"request": "e"},
+            {"request": "f"},
+        ]
+
+        groups = AgentOrchestrator._group_workflow_steps(workflow)
+
+        assert [[step["request"] for step in group] for group in groups] == [
+            ["a", "b"], ["c"], ["d"], ["e"], ["f"],
+        ]
+
     @pytest.mark.asyncio
     async def test_stream(self):
         """Test streaming agent execution."""
@@ -0,0 +1,115 @@
+"""Tests for the RAG agent."""
+
+import asyncio
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+from langchain_core.messages import AIMessage
+
+from src.agents.base import AgentConfig
+from src.agents.rag_agent import RAGAgent
+from src.core.config import get_settings
+from src.rag.retrieval.vector_store import get_vector_store
+
+
+def _make_agent(router_action: str) -> RAGAgent:
+    """Create a speculating RAG agent whose router returns a fixed action."""
+    with patch("src.agents.rag_agent.get_chat_model"):
+        agent = RAGAgent(AgentConfig(speculative_refine=True))
+    agent._router_chain = MagicMock()
+    agent._router_chain.ainvoke = AsyncMock(return_value=AIMessage(content=router_action))
+    agent._speculative_refiner_chain = MagicMock()
+    agent._speculative_refiner_chain.ainvoke = AsyncMock(
+        return_value=AIMessage(content="refined")
+    )
+    return agent
+
+
+_ROUTE_STATE = {
+    "question": "What is Qdrant?",
+    "context": "Qdrant is a vector database.",
+    "answer": "A database.",
+    "sources": [{"content": "Qdrant is a vector database."}],
+    "iteration": 2,
+}
+
+
+class TestSpeculativeRefine:
+    """Tests for refining while the router decides."""
+
+    def test_off_by_default(self):
+        """Test that speculation is opt-in."""
+        assert AgentConfig().speculative_refine is False
+
+    @pytest.mark.asyncio
+    async def test_used_when_router_refines(self):
+        """Test that the speculative answer is handed to the refine node."""
+        agent = _make_agent("refine")
+
+        update = await agent._route_node(_ROUTE_STATE)
+
+        assert update == {"next_action": "refine", "refined_answer": "refined"}
+        assert agent._speculative_refines == 1
+        assert agent._speculative_refines_wasted == 0
+
+    @pytest.mark.asyncio
+    async def test_discarded_when_router_finishes(self):
+        """Test that the speculative refine is cancelled and counted as wasted."""
+        agent = _make_agent("done")
+        agent._speculative_refiner_chain.ainvoke.side_effect = lambda _: asyncio.sleep(
+            10, result=AIMessage(content="refined")
+        )
+
+        update = await agent._route_node(_ROUTE_STATE)
+
+        assert update == {"next_action": "done"}
+        assert agent._speculative_refines == 1
+        assert agent._speculative_refines_wasted == 1
+
+
+class TestAnswerCache:
+    """Tests for the semantic answer cache in RAGAgent.run."""
+
+    @staticmethod
+    def _make_agent(sources: list[dict]) -> RAGAgent:
+        """Create an agent whose graph returns a fixed answer and sources."""
+        with patch("src.agents.rag_agent.get_chat_model"):
+            agent = RAGAgent(AgentConfig(model_name="answer-cache-test"))
+        agent.graph = MagicMock()
+        agent.graph.ainvoke = AsyncMock(return_value={
+            "answer": "Qdrant is a vector database.",
+            "sources": sources,
+            "iteration": 2,
+        })
+        return agent
+
+    @pytest.mark.asyncio
+    async def test_cleared_when_documents_change(self):
+        """Test that cached answers are dropped after the vector store changes."""
+        agent = self._make_agent([{"content": "Qdrant docs"}])
+        store = get_vector_store()
+        embedding = [1.0] + [0.0] * (get_settings().embedding_dimension - 1)
+
+        with patch.object(store, "embed_queries", AsyncMock(return_value=[embedding])):
+            await agent.run("What is Qdrant?", cache=True)
+            cached = await agent.run("What is Qdrant?", cache=True)
+            store._notify_change()
+            await agent.run("What is Qdrant?", cache=True)
+
+        assert cached.metadata["cache_hit"] is True
+        assert agent.graph.ainvoke.await_count == 2
+        store._notify_change()
+
+    @pytest.mark.asyncio
+    async def test_answers_without_sources_not_cached(self):
+        """Test that answers with no retrieved sources are not reused."""
+        agent = self._make_agent([])
+        store = get_vector_store()
+        embedding = [0.0, 1.0] + [0.0] * (get_settings().embedding_dimension - 2)
+
+        with patch.object(store, "embed_queries", AsyncMock(return_value=[embedding])):
+            await agent.run("What is pgvector?", cache=True)
+            second = await agent.run("What is pgvector?", cache=True)
+
+        assert "cache_hit" not in second.metadata
+        assert agent.graph.ainvoke.await_count == 2
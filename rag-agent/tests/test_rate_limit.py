@@ -0,0 +1,46 @@
+"""Tests for client-side rate limiting."""
+
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from src.core.rate_limit import AsyncTokenBucket
+
+
+class TestAsyncTokenBucket:
+    """Tests for AsyncTokenBucket."""
+
+    def test_invalid_rate(self):
+        """Test that a non-positive rate is rejected."""
+        with pytest.raises(ValueError):
+            AsyncTokenBucket(rate=0)
+
+    def test_burst_passes_immediately(self):
+        """Test that requests within the burst do not wait."""
+        with patch("src.core.rate_limit.time.monotonic", return_value=100.0):
+            bucket = AsyncTokenBucket(rate=1.0, burst=3)
+
+            assert [bucket.acquire(blocking=False) for _ in range(4)] == [
+                True, True, True, False,
+            ]
+
+    def test_tokens_refill_over_time(self):
+        """Test that tokens are replenished at the configured rate."""
+        with patch("src.core.rate_limit.time.monotonic", return_value=100.0):
+            bucket = AsyncTokenBucket(rate=2.0, burst=1)
+            assert bucket.acquire(blocking=False)
+            assert not bucket.acquire(blocking=False)
+
+        with patch("src.core.rate_limit.time.monotonic", return_value=100.5):
+            assert bucket.acquire(blocking=False)
+
+    @pytest.mark.asyncio
+    async def test_waiters_queue_in_order(self):
+        """Test that callers beyond the burst sleep until their token is due."""
+        with patch("src.core.rate_limit.time.monotonic", return_value=100.0), \
+                patch("src.core.rate_limit.asyncio.sleep", new_callable=AsyncMock) as mock_sleep:
+            bucket = AsyncTokenBucket(rate=4.0, burst=1)
+            for _ in range(3):
+                assert await bucket.aacquire()
+
+        assert [call.args[0] for call in mock_sleep.await_args_list] == [0.25, 0.5]
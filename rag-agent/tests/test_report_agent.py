@@ -0,0 +1,75 @@
+"""Tests for the report generation agent."""
+
+from unittest.mock import AsyncMock, patch
+
+import orjson
+import pytest
+from langchain_core.language_models.fake_chat_models import FakeListChatModel
+
+from src.agents.business.report_agent import _NO_DATA_CONTEXT, ReportGenerationAgent
+from src.agents.tools.base import ToolResult
+from src.agents.tools.document_tools import SearchDocumentsTool
+
+
+class TestReportGenerationAgent:
+    """Tests for ReportGenerationAgent."""
+
+    @pytest.mark.asyncio
+    async def test_brief_report_without_data_skips_summary_and_conclusion(self):
+        """Test that a brief report with no search results makes no writing calls."""
+        requirements = {"title": "Q3 Status", "purpose": "Status", "depth": "brief"}
+        outline = {
+            "sections": [
+                {"title": "Sales", "search_queries": ["q3 sales"]},
+                {"title": "Hiring", "search_queries": ["q3 hiring"]},
+            ],
+            "executive_summary_needed": True,
+            "conclusion_needed": True,
+        }
+        llm = FakeListChatModel(responses=[
+            orjson.dumps(requirements).decode(),
+            orjson.dumps(outline).decode(),
+            "unexpected LLM call",
+        ])
+
+        with patch("src.agents.business.report_agent.get_chat_model", return_value=llm), \
+             patch.object(
+                 SearchDocumentsTool, "execute", AsyncMock(return_value=ToolResult.success([]))
+             ):
+            agent = ReportGenerationAgent()
+            result = await agent.run("Q3 status report")
+
+        assert result.success
+        assert result.iterations == 5
+        assert llm.i == 2  # Requirements and outline only
+        assert "Executive Summary" not in result.answer
+        assert "Conclusion" not in result.answer
+        assert _NO_DATA_CONTEXT in result.answer
+
+    @pytest.mark.asyncio
+    async def test_stream_reports_section_generation(self):
+        """Test that streaming reports the section generation step and its iteration."""
+        outline = {
+            "sections": [{"title": "Sales", "search_queries": ["q3 sales"]}],
+            "executive_summary_needed": False,
+            "conclusion_needed": False,
+        }
+        llm = FakeListChatModel(responses=[
+            orjson.dumps({"title": "Q3", "depth": "brief"}).decode(),
+            orjson.dumps(outline).decode(),
+        ])
+
+        with patch("src.agents.business.report_agent.get_chat_model", return_value=llm), \
+             patch.object(
+                 SearchDocumentsTool, "execute", AsyncMock(return_value=ToolResult.success([]))
+             ):
+            agent = ReportGenerationAgent()
+            events = [
+                event async for event in agent.stream("Q3 status report")
+                if event["event"] != "token"
+            ]
+
+        generated = next(e for e in events if e["event"] == "generate_sections")
+        assert generated["status"] == "sections_generated"
+        assert generated["iteration"] == 4
+        assert events[-1]["status"] == "completed"
@@ -0,0 +1,53 @@
+"""Tests for the research agent."""
+
+from src.agents.research_agent import _is_trivial_question, _parse_plan
+
+
+class TestIsTrivialQuestion:
+    """Tests for _is_trivial_question function."""
+
+    def test_simple_lookup(self):
+        """Test that a short single-fact question skips planning."""
+        assert _is_trivial_question("What is the default chunk size?")
+
+    def test_long_question(self):
+        """Test that long questions are planned."""
+        question = "What is the default chunk size " + "for the ingestion pipeline " * 3 + "?"
+
+        assert not _is_trivial_question(question)
+
+    def test_multiple_clauses(self):
+        """Test that conjunctions and comparisons are planned."""
+        assert not _is_trivial_question("What is Qdrant and how is it deployed?")
+        assert not _is_trivial_question("Compare Qdrant to pgvector?")
+        assert not _is_trivial_question("Qdrant vs pgvector?")
+
+    def test_multiple_questions(self):
+        """Test that several questions in one are planned."""
+        assert not _is_trivial_question("What is Qdrant? Who maintains it?")
+
+    def test_not_a_question(self):
+        """Test that open-ended instructions are planned."""
+        assert not _is_trivial_question("Summarize the onboarding docs")
+
+    def test_word_boundaries(self):
+        """Test that keywords inside other words do not count."""
+        assert _is_trivial_question("Where is the canvas brand guide?")
+
+
+class TestParsePlan:
+    """Tests for _parse_plan function."""
+
+    def test_numbered_list(self):
+        """Test that numbering and surrounding text are stripped."""
+        plan_text = "Here is the plan:\n1. Find the SLA terms\n2) Check escalation rules  \n\nDone."
+
+        assert _parse_plan(plan_text) == ["Find the SLA terms", "Check escalation rules"]
+
+    def test_bullets(self):
+        """Test that bulleted steps are accepted."""
+        assert _parse_plan("- First step\n  * Second step") == ["First step", "Second step"]
+
+    def test_ignores_empty_items(self):
+        """Test that markers without a step are skipped."""
+        assert _parse_plan("1.\n2. Real step\n-") == ["Real step"]
@@ -5,6 +5,7 @@ from unittest.mock import AsyncMock, MagicMock, patch
 
 from langchain_core.documents import Document
 
+from src.rag.retrieval.cached_retriever import CachedRetriever
 from src.rag.retrieval.retriever import (
     QdrantRetriever,
     HybridRetriever,
@@ -354,3 +355,81 @@ class TestGetRetriever:
 
             retriever = get_retriever("semantic", top_k=10)
             assert retriever.top_k == 10
+
+
+def _make_cached_retriever(enabled: bool) -> tuple[CachedRetriever, MagicMock, MagicMock]:
+    """Create a cached retriever over a mock retriever and vector store."""
+    settings = MagicMock()
+    settings.search_cache_enabled = enabled
+    settings.search_cache_threshold = 0.95
+    settings.search_cache_ttl_seconds = 600
+    settings.search_cache_max_entries = 16
+    settings.embedding_dimension = 4
+
+    vector_store = MagicMock()
+    vector_store.embed_queries = AsyncMock(side_effect=lambda queries: [[1.0, 0.0, 0.0, 0.0]])
+
+    retriever = MagicMock()
+    retriever._aget_relevant_documents = AsyncMock(
+        return_value=[Document(page_content="Cached content")]
+    )
+
+    with patch("src.rag.retrieval.cached_retriever.get_settings", return_value=settings), \
+            patch("src.rag.retrieval.cached_retriever.get_vector_store", return_value=vector_store):
+        cached = CachedRetriever(retriever)
+
+    return cached, retriever, vector_store
+
+
+class TestCachedRetriever:
+    """Tests for CachedRetriever class."""
+
+    @pytest.mark.asyncio
+    async def test_disabled_by_default(self):
+        """Test that every query is retrieved when the search cache is disabled."""
+        cached, retriever, vector_store = _make_cached_retriever(enabled=False)
+
+        await cached.aget("test query")
+        await cached.aget("test query")
+
+        assert retriever._aget_relevant_documents.await_count == 2
+        vector_store.embed_queries.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_exact_repeat_skips_retrieval(self):
+        """Test that a repeated query is served without retrieving or embedding again."""
+        cached, retriever, vector_store = _make_cached_retriever(enabled=True)
+
+        with patch("src.rag.retrieval.cached_retriever.get_vector_store", return_value=vector_store):
+            first = await cached.aget("test query")
+            second = await cached.aget("test query")
+
+        assert second == first
+        retriever._aget_relevant_documents.assert_awaited_once()
+        vector_store.embed_queries.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_similar_query_served_from_semantic_cache(self):
+        """Test that a query with a similar embedding reuses earlier documents."""
+        cached, retriever, vector_store = _make_cached_retriever(enabled=True)
+
+        with patch("src.rag.retrieval.cached_retriever.get_vector_store", return_value=vector_store):
+            await cached.aget("test query")
+            docs = await cached.aget("the test query")
+
+        assert docs[0].page_content == "Cached content"
+        retriever._aget_relevant_documents.assert_awaited_once_with(
+            "test query", query_embedding=[1.0, 0.0, 0.0, 0.0]
+        )
+
+    @pytest.mark.asyncio
+    async def test_clear(self):
+        """Test that clearing the cache forces a new retrieval."""
+        cached, retriever, vector_store = _make_cached_retriever(enabled=True)
+
+        with patch("src.rag.retrieval.cached_retriever.get_vector_store", return_value=vector_store):
+            await cached.aget("test query")
+            cached.clear()
+            await cached.aget("test query")
+
+        assert retriever._aget_relevant_documents.await_count == 2
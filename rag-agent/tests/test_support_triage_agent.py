@@ -0,0 +1,41 @@
+"""Tests for the support triage agent."""
+
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import orjson
+import pytest
+from langchain_core.messages import AIMessage
+
+from src.agents.base import AgentConfig
+from src.agents.business.support_triage_agent import SupportTriageAgent
+from src.core.config import get_settings
+from src.rag.retrieval.vector_store import get_vector_store
+
+
+class TestAnalyzeAndClassifyCache:
+    """Tests for the semantic cache of ticket analysis."""
+
+    @pytest.mark.asyncio
+    async def test_scoped_to_customer_info(self):
+        """Test that the ticket alone is embedded and results are not shared across customers."""
+        with patch("src.agents.business.support_triage_agent.get_chat_model"):
+            agent = SupportTriageAgent(AgentConfig(model_name="triage-cache-test"))
+        agent._analyze_chain = MagicMock()
+        agent._analyze_chain.ainvoke = AsyncMock(return_value=AIMessage(content=orjson.dumps({
+            "analysis": {"summary": "Login fails"},
+            "classification": {"category": "technical", "priority": "high"},
+        }).decode()))
+        embedding = [0.0, 0.0, 1.0] + [0.0] * (get_settings().embedding_dimension - 3)
+        embed_queries = AsyncMock(return_value=[embedding])
+        ticket = "I cannot log in after resetting my password"
+
+        with patch.object(get_vector_store(), "embed_queries", embed_queries):
+            for customer_info in [{"plan": "free"}, {"plan": "free"}, {"plan": "enterprise"}]:
+                await agent._analyze_and_classify_node({
+                    "ticket": ticket,
+                    "customer_info": customer_info,
+                    "use_llm_cache": True,
+                })
+
+        embed_queries.assert_awaited_with([ticket])
+        assert agent._analyze_chain.ainvoke.await_count == 2
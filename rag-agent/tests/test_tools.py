@@ -0,0 +1,114 @@
+"""Tests for the tool base classes and registry."""
+
+import copy
+import dataclasses
+import pickle
+from unittest.mock import patch
+
+import pytest
+
+from src.agents.tools.base import ToolRegistry, ToolResult, tool
+from src.agents.tools.data_tools import FormatOutputTool, ValidateDataTool
+
+
+class TestToolResult:
+    """Tests for ToolResult."""
+
+    def test_metadata(self):
+        """Test that metadata keyword arguments are kept."""
+        result = ToolResult.success({"a": 1}, source="kb")
+
+        assert result.metadata == {"source": "kb"}
+
+    def test_copyable_and_mutable_metadata(self):
+        """Test that results can be copied and pickled and their metadata updated."""
+        result = ToolResult.success([1])
+
+        result.metadata["source"] = "kb"
+
+        assert dataclasses.asdict(result)["metadata"] == {"source": "kb"}
+        assert copy.deepcopy(result) == result
+        assert pickle.loads(pickle.dumps(result)) == result
+        assert ToolResult.success([1]).metadata == {}
+
+
+class TestFunctionTool:
+    """Tests for FunctionTool."""
+
+    @pytest.mark.asyncio
+    async def test_sync_function(self):
+        """Test wrapping a regular function."""
+        @tool()
+        def add(a: int, b: int) -> int:
+            """Add two numbers."""
+            return a + b
+
+        result = await add.execute(a=1, b=2)
+
+        assert result.is_success
+        assert result.data == 3
+
+    @pytest.mark.asyncio
+    async def test_async_function(self):
+        """Test wrapping a coroutine function."""
+        @tool(name="async_add")
+        async def add(a: int, b: int) -> int:
+            """Add two numbers."""
+            return a + b
+
+        result = await add.execute(a=1, b=2)
+
+        assert add.name == "async_add"
+        assert result.data == 3
+
+    @pytest.mark.asyncio
+    async def test_error(self):
+        """Test that exceptions become error results."""
+        @tool()
+        def fail() -> None:
+            """Always fail."""
+            raise ValueError("boom")
+
+        result = await fail.execute()
+
+        assert not result.is_success
+        assert result.error == "boom"
+
+
+class TestToolRegistry:
+    """Tests for ToolRegistry."""
+
+    def test_list_tools_builds_schemas_once(self):
+        """Test that schemas are reused until the registered tools change."""
+        registry = ToolRegistry()
+        registry.register(ValidateDataTool())
+
+        with patch.object(
+            ValidateDataTool, "get_schema", autospec=True, side_effect=ValidateDataTool.get_schema
+        ) as mock_schema:
+            first = registry.list_tools()
+            second = registry.list_tools()
+
+        assert first == second
+        assert mock_schema.call_count == 1
+
+    def test_register_and_unregister_refresh_schemas(self):
+        """Test that registry changes are reflected in the listed schemas."""
+        registry = ToolRegistry()
+        registry.register(ValidateDataTool())
+        registry.list_tools()
+
+        registry.register(FormatOutputTool())
+        assert [s["name"] for s in registry.list_tools()] == ["validate_data", "format_output"]
+
+        assert registry.unregister("validate_data")
+        assert [s["name"] for s in registry.list_tools()] == ["format_output"]
+
+    def test_returned_list_is_a_copy(self):
+        """Test that callers cannot change the cached schema list."""
+        registry = ToolRegistry()
+        registry.register(ValidateDataTool())
+
+        registry.list_tools().clear()
+
+        assert len(registry.list_tools()) == 1
@@ -206,6 +206,47 @@ class TestVectorStore:
         call_args = mock_client.search.call_args
         assert call_args.kwargs["query_filter"] is not None
 
+    @pytest.mark.asyncio
+    async def test_search_with_query_embedding(self):
+        """Test that a precomputed query embedding skips embedding."""
+        store = VectorStore()
+
+        mock_client = MagicMock()
+        mock_client.search.return_value = []
+        store._client = mock_client
+        store._embeddings = AsyncMock()
+
+        await store.search("test query", query_embedding=[0.3] * 1536)
+
+        store._embeddings.aembed_query.assert_not_called()
+        assert mock_client.search.call_args.kwargs["query_vector"] == [0.3] * 1536
+
+    @pytest.mark.asyncio
+    async def test_embed_queries(self):
+        """Test embedding several queries in one request."""
+        store = VectorStore()
+        store._embeddings = AsyncMock()
+        store._embeddings.aembed_documents.return_value = [[0.1], [0.2]]
+
+        embeddings = await store.embed_queries(["a", "b"])
+
+        assert embeddings == [[0.1], [0.2]]
+        store._embeddings.aembed_documents.assert_called_once_with(["a", "b"])
+
+    @pytest.mark.asyncio
+    async def test_change_listener_on_add(self):
+        """Test that change listeners fire when documents are added."""
+        store = VectorStore()
+        store._client = MagicMock()
+        store._embeddings = AsyncMock()
+        store._embeddings.aembed_documents.return_value = [[0.1] * 1536]
+        listener = MagicMock()
+        store.add_change_listener(listener)
+
+        await store.add_documents([Document(page_content="Content")], "doc123")
+
+        listener.assert_called_once_with()
+
     @pytest.mark.asyncio
     async def test_search_not_initialized(self):
         """Test searching when not initialized."""